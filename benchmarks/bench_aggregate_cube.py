@@ -0,0 +1,90 @@
+import sys
+import os
+import time
+
+# RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (BENCHMARKS/BENCH_AGGREGATE_CUBE.PY) HACIA SRC.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import numpy as np
+import pandas as pd
+from etl import build_context
+from eda import run_eda
+from dtype_optimizer import run_dtype_optimizer
+from aggregate_cube import AggregateCube
+
+# INDICADOR DE CADA DATASET QUE USA stats_inferential PARA LA MATRIZ DE CORRELACIÓN
+INDICATORS = {
+    "life_expectancy": "Esperanza de vida al nacer",
+    "preventable_deaths": "Muertes",
+    "literacy": "Tasa de alfabetización",
+    "child_mortality": "Mortalidad infantil",
+    "gdp": "PIB per cápita a precios constantes"
+}
+
+
+def timed(function, repeat=20):
+    '''
+    Ejecuta la función "repeat" veces y devuelve el mejor tiempo en segundos y el último resultado.
+    '''
+
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    '''
+    Compara, con los datos ya limpios y optimizados, las consultas que antes filtraban y agrupaban las
+    filas en cada llamada (promedios anuales de stats_inferential, totales de muertes por país en 2019
+    y por año en España) con las mismas consultas resueltas en el cubo de agregados. También mide lo
+    que cuesta construir el cubo, que se paga una única vez por ejecución.
+    '''
+
+    context = build_context(verbosity=0)
+    run_eda(context, incremental=False)
+    run_dtype_optimizer(context, verbose=False)
+    processed = context.processed
+    years = list(range(1980, 2020))
+
+    def build():
+        cube = AggregateCube()
+        for name, df in processed.items():
+            cube.add(name, df)
+        return cube
+
+    build_time, cube = timed(build, repeat=5)
+    print(f"→ construcción del cubo (una vez): {build_time * 1000:.1f} ms")
+
+    def rows_yearly_means():
+        return pd.DataFrame({column: processed[name][processed[name]["Año"].isin(years)].groupby("Año")[column].mean()
+                             for name, column in INDICATORS.items()})
+
+    def cube_yearly_means():
+        return pd.DataFrame({column: cube.series(name, column, "Media").reindex(years) for name, column in INDICATORS.items()})
+
+    deaths = processed["preventable_deaths"]
+
+    def rows_totals():
+        return (deaths[deaths["Año"] == 2019].groupby("País", observed=True)["Muertes"].sum(),
+                deaths[deaths["País"] == "España"].groupby("Año")["Muertes"].sum())
+
+    def cube_totals():
+        return (cube.series("preventable_deaths", "Muertes", "Suma", by="País", year=2019),
+                cube.series("preventable_deaths", "Muertes", "Suma", by="Año", country="España"))
+
+    for name, rows_query, cube_query in [("promedios anuales (stats_inferential)", rows_yearly_means, cube_yearly_means),
+                                         ("totales de muertes 2019 / España", rows_totals, cube_totals)]:
+        rows_time, expected = timed(rows_query)
+        cube_time, result = timed(cube_query)
+        if isinstance(expected, tuple):
+            error = max(np.max(np.abs(r.to_numpy() - e.to_numpy()) / np.abs(e.to_numpy())) for r, e in zip(result, expected))
+        else:
+            error = np.nanmax(np.abs(result.dropna().to_numpy() - expected.reindex(result.dropna().index).to_numpy()) / expected.abs().max().to_numpy())
+        print(f"→ {name}: filas {rows_time * 1000:.2f} ms, cubo {cube_time * 1000:.2f} ms ({rows_time / cube_time:.1f}x), "
+              f"error relativo máximo {error:.1e}")
+
+
+if __name__ == "__main__":
+    main()
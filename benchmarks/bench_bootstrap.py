@@ -0,0 +1,72 @@
+import sys
+import os
+import time
+
+# RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (BENCHMARKS/BENCH_BOOTSTRAP.PY) HACIA SRC.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import numpy as np
+from etl import build_context
+from eda import run_eda
+from bootstrap import bootstrap_intervals, regression_statistics, correlation_statistics, REPLICATES, SEED
+from process_pool import start_process_pool, close_process_pool
+
+# CORTE TRANSVERSAL QUE SE REMUESTREA: UN AÑO, TODOS LOS PAÍSES CON LOS TRES INDICADORES
+YEAR = 2019
+COLUMNS = {"life_expectancy": "Esperanza de vida al nacer", "child_mortality": "Mortalidad infantil", "gdp": "PIB per cápita a precios constantes"}
+
+
+def loop_replicates(data, replicates=REPLICATES, seed=SEED):
+    '''
+    Las mismas remuestras calculadas una por una: np.polyfit y np.corrcoef sobre cada remuestra.
+    '''
+
+    rng = np.random.default_rng(seed)
+    fits, correlations = [], []
+    for _ in range(replicates):
+        sample = data[rng.integers(0, len(data), size=len(data))]
+        fits.append(np.polyfit(sample[:, 0], sample[:, 1], 1))
+        correlations.append(np.corrcoef(sample, rowvar=False))
+    return np.array(fits), np.array(correlations)
+
+
+def batched(data):
+    return bootstrap_intervals(regression_statistics, data[:, :2]), bootstrap_intervals(correlation_statistics, data)
+
+
+def main(workers=(1, 2, 4)):
+    '''
+    Compara el bootstrap remuestra por remuestra (un ajuste y una matriz de correlación por vuelta de
+    bucle, sin los intervalos) con bootstrap_intervals() (matriz de índices por bloque y estadísticos
+    por lotes, con los intervalos percentil y BCa), en serie y con pools de distintos tamaños.
+    Comprueba que los intervalos no dependen de la cantidad de procesos.
+    '''
+
+    context = build_context(verbosity=0)
+    run_eda(context, incremental=False)
+    frames = [context.processed[name].loc[lambda df: df["Año"] == YEAR, ["País", column]].set_index("País")
+              for name, column in COLUMNS.items()]
+    data = frames[0].join(frames[1:], how="inner").dropna().to_numpy(dtype=np.float64)
+    print(f"→ {len(data)} países en {YEAR}, {REPLICATES} remuestras")
+
+    start = time.perf_counter()
+    loop_replicates(data)
+    loop_time = time.perf_counter() - start
+    print(f"→ bucle por remuestra: {loop_time * 1000:.0f} ms")
+
+    reference = None
+    for count in workers:
+        start_process_pool(count)
+        try:
+            batched(data)
+            start = time.perf_counter()
+            intervals = batched(data)
+            elapsed = time.perf_counter() - start
+        finally:
+            close_process_pool()
+        reference = reference or intervals
+        assert all(np.array_equal(a[key][i], b[key][i]) for a, b in zip(reference, intervals) for key in ("percentile", "bca") for i in (0, 1))
+        print(f"→ por lotes, {count} proceso(s): {elapsed * 1000:.0f} ms ({loop_time / elapsed:.1f}x), mismos intervalos")
+
+
+if __name__ == "__main__":
+    main()
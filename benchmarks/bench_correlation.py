@@ -0,0 +1,83 @@
+import sys
+import os
+import time
+
+# RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (BENCHMARKS/BENCH_CORRELATION.PY) HACIA SRC.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import numpy as np
+import pandas as pd
+from etl import build_context
+from eda import run_eda
+from panel import build_panel
+from correlation import pairwise_correlation
+
+# MATRIZ SINTÉTICA ANCHA: COLUMNAS, FILAS Y PROPORCIÓN DE NULOS
+WIDE_SHAPE = (40_000, 200)
+WIDE_MISSING = 0.3
+# COLUMNAS SOBRE LAS QUE SE MIDE EL SPEARMAN DE LA MATRIZ ANCHA Y PATRONES DE NULOS DE LA VARIANTE AGRUPADA
+SPEARMAN_COLUMNS = 40
+WIDE_PATTERNS = 10
+
+
+def timed(function, repeat=3):
+    '''
+    Ejecuta la función "repeat" veces y devuelve el mejor tiempo en segundos y el último resultado.
+    '''
+
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def compare(name, df, variants, repeat=3):
+    for label, method in variants:
+        pandas_time, expected = timed(lambda: df.corr(method=method), repeat)
+        engine_time, result = timed(lambda: pairwise_correlation(df, method), repeat)
+        error = np.nanmax(np.abs(result.to_numpy() - expected.to_numpy()))
+        assert (result.isna() == expected.isna()).all().all(), f"{name}, {label}: pares en NaN distintos"
+        assert error < 1e-12, f"{name}, {label}: diferencia {error:.1e}"
+        print(f"→ {name}, {label}: df.corr() {pandas_time * 1000:.0f} ms, pairwise_correlation() {engine_time * 1000:.0f} ms "
+              f"({pandas_time / engine_time:.1f}x), diferencia máxima {error:.1e}")
+
+
+def main():
+    '''
+    Compara df.corr() (Pearson y Spearman, par a par) con pairwise_correlation() sobre todos los
+    indicadores del panel país-año y sobre una matriz sintética de WIDE_SHAPE con WIDE_MISSING de
+    nulos, y verifica que ambos coincidan. En la matriz ancha, con nulos independientes por columna,
+    cada par de columnas tiene su propio patrón y ambos Spearman se miden sobre SPEARMAN_COLUMNS
+    columnas y se extrapolan a todas, porque tardan decenas de segundos; con WIDE_PATTERNS patrones
+    de nulos compartidos se miden completos.
+    '''
+
+    context = build_context(verbosity=0)
+    run_eda(context, incremental=False)
+    indicators = build_panel(context.processed).drop(columns=["País", "Año"])
+    print(f"→ panel país-año: {indicators.shape[0]} filas x {indicators.shape[1]} indicadores")
+    compare("panel", indicators, [("Pearson", "pearson"), ("Spearman", "spearman")])
+
+    rng = np.random.default_rng(0)
+    wide = pd.DataFrame(rng.normal(size=WIDE_SHAPE)).mask(rng.random(WIDE_SHAPE) < WIDE_MISSING)
+    print(f"→ matriz sintética: {WIDE_SHAPE[0]} filas x {WIDE_SHAPE[1]} columnas, {WIDE_MISSING:.0%} de nulos")
+    compare("matriz sintética", wide, [("Pearson", "pearson")], repeat=1)
+
+    subset = wide.iloc[:, :SPEARMAN_COLUMNS]
+    pandas_time, expected = timed(lambda: subset.corr(method="spearman"), repeat=1)
+    engine_time, result = timed(lambda: pairwise_correlation(subset, "spearman"), repeat=1)
+    assert np.nanmax(np.abs(result.to_numpy() - expected.to_numpy())) < 1e-12
+    scale = (WIDE_SHAPE[1] / SPEARMAN_COLUMNS) ** 2
+    print(f"→ matriz sintética, Spearman: df.corr() ~{pandas_time * scale:.0f} s, pairwise_correlation() "
+          f"~{engine_time * scale:.0f} s (extrapolados de {SPEARMAN_COLUMNS} columnas)")
+
+    # OTRA MATRIZ DEL MISMO TAMAÑO, PERO LAS COLUMNAS COMPARTEN UNO DE WIDE_PATTERNS PATRONES DE NULOS
+    masks = rng.random((WIDE_SHAPE[0], WIDE_PATTERNS)) < WIDE_MISSING
+    grouped = pd.DataFrame(rng.normal(size=WIDE_SHAPE)).mask(masks[:, np.arange(WIDE_SHAPE[1]) % WIDE_PATTERNS])
+    print(f"→ matriz sintética con {WIDE_PATTERNS} patrones de nulos compartidos")
+    compare(f"matriz sintética ({WIDE_PATTERNS} patrones)", grouped, [("Spearman", "spearman")], repeat=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import sys
+import os
+import time
+
+# RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (BENCHMARKS/BENCH_DENSITY.PY) HACIA SRC.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import numpy as np
+from matplotlib import cbook
+from scipy.stats import gaussian_kde
+from etl import build_context
+from eda import run_eda
+from density import distribution_arrays, GRIDSIZE, CUT
+
+
+def timed(function, repeat=5):
+    '''
+    Ejecuta la función "repeat" veces y devuelve el mejor tiempo en segundos y el último resultado.
+    '''
+
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def reference_arrays(values, bins=30):
+    '''
+    Los mismos tres paneles calculados como antes, cada uno por su lado: np.histogram, boxplot_stats
+    de matplotlib y gaussian_kde de scipy evaluado en la grilla de sns.kdeplot.
+    '''
+
+    values = values[~np.isnan(values)]
+    counts, edges = np.histogram(values, bins=bins)
+    box = cbook.boxplot_stats(values)[0]
+    kde = gaussian_kde(values)
+    bandwidth = np.sqrt(kde.covariance.squeeze())
+    support = np.linspace(values.min() - CUT * bandwidth, values.max() + CUT * bandwidth, GRIDSIZE)
+    return {"edges": edges, "counts": counts, "box": box, "support": support, "density": kde(support)}
+
+
+def main():
+    '''
+    Compara, para cada columna numérica de los datasets limpios, el cálculo por separado del
+    histograma, el boxplot y el KDE exacto con distribution_arrays() (una sola pasada ordenada y KDE
+    por FFT). Comprueba que el histograma y el boxplot coinciden exactamente y mide el error máximo
+    del KDE relativo a su pico.
+    '''
+
+    context = build_context(verbosity=0)
+    run_eda(context, incremental=False)
+
+    total_reference, total_binned = 0.0, 0.0
+    for name, df in context.processed.items():
+        for column in df.select_dtypes("number").columns.drop("Año", errors="ignore"):
+            values = df[column].to_numpy(dtype=np.float64)
+            if np.count_nonzero(~np.isnan(values)) < 2:
+                continue
+            reference_time, expected = timed(lambda: reference_arrays(values))
+            binned_time, arrays = timed(lambda: distribution_arrays(values))
+            total_reference += reference_time
+            total_binned += binned_time
+
+            assert np.array_equal(expected["counts"], arrays["counts"]), (name, column)
+            assert all(np.isclose(expected["box"][key], arrays["box"][key]) for key in ("med", "q1", "q3", "whislo", "whishi", "mean")), (name, column)
+            assert np.array_equal(expected["box"]["fliers"], arrays["box"]["fliers"]), (name, column)
+            error = np.abs(expected["density"] - arrays["density"]).max() / expected["density"].max()
+            print(f"→ {name} / {column} ({len(values)} filas): {reference_time * 1000:.1f} → {binned_time * 1000:.1f} ms "
+                  f"({reference_time / binned_time:.1f}x), error máximo del KDE {error:.2%}")
+
+    print(f"\nTotal: {total_reference * 1000:.0f} → {total_binned * 1000:.0f} ms ({total_reference / total_binned:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
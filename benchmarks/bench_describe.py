@@ -0,0 +1,80 @@
+import sys
+import os
+import time
+
+# RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (BENCHMARKS/BENCH_DESCRIBE.PY) HACIA SRC.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import numpy as np
+from etl import build_context
+from eda import run_eda
+from dtype_optimizer import run_dtype_optimizer
+from describe import STATISTICS, describe_slices
+
+
+def timed(function, repeat=5):
+    '''
+    Ejecuta la función "repeat" veces y devuelve el mejor tiempo en segundos y el último resultado.
+    '''
+
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def pandas_describe(slices):
+    '''
+    Lo que hacían antes las funciones de stats: once llamadas de pandas por recorte y variable, cada
+    una con su propio recorrido (y, la mediana, los percentiles y la moda, con su propio ordenamiento).
+    '''
+
+    rows = []
+    for data in slices.values():
+        frame = data.to_frame() if data.ndim == 1 else data
+        for column in frame.columns:
+            values = frame[column]
+            rows.append([values.mean(), values.median(), values.mode().iloc[0], values.std(), values.var(),
+                         values.min(), values.max(), values.max() - values.min(),
+                         values.quantile(0.25), values.quantile(0.50), values.quantile(0.75)])
+    return np.array(rows, dtype=np.float64)
+
+
+def main():
+    '''
+    Compara, con los datos ya limpios y optimizados, las once estadísticas de los recortes de
+    stats_vaccination_coverage y stats_life_expectancy calculadas con pandas y con describe_slices().
+    '''
+
+    context = build_context(verbosity=0)
+    run_eda(context, incremental=False)
+    run_dtype_optimizer(context, verbose=False)
+
+    vaccination = context.processed["vaccination_coverage"]
+    life = context.processed["life_expectancy"]
+    vaccines = vaccination.columns.difference(["País", "Año"])
+    ipv1 = [column for column in vaccines if "(IPV1)" in column][0]
+    cases = {
+        "vaccination_coverage": {
+            "todos los países y años": vaccination[vaccines],
+            "global 2019": vaccination.loc[vaccination["Año"] == 2019, ipv1],
+            "España, todos los años": vaccination.loc[vaccination["País"] == "España", ipv1]
+        },
+        "life_expectancy": {
+            "todos los países y años": life["Esperanza de vida al nacer"],
+            "global 2019": life.loc[life["Año"] == 2019, "Esperanza de vida al nacer"],
+            "España, todos los años": life.loc[life["País"] == "España", "Esperanza de vida al nacer"]
+        }
+    }
+
+    for name, slices in cases.items():
+        pandas_time, expected = timed(lambda: pandas_describe(slices))
+        engine_time, table = timed(lambda: describe_slices(slices))
+        error = np.nanmax(np.abs(table[STATISTICS].to_numpy() - expected) / np.maximum(np.abs(expected), 1))
+        print(f"→ {name}: {len(table)} variables, pandas {pandas_time * 1000:.1f} ms, "
+              f"una pasada {engine_time * 1000:.1f} ms ({pandas_time / engine_time:.1f}x), error relativo máximo {error:.1e}")
+
+
+if __name__ == "__main__":
+    main()
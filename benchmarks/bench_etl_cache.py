@@ -0,0 +1,46 @@
+import sys
+import os
+import time
+import tempfile
+
+# RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (BENCHMARKS/BENCH_ETL_CACHE.PY) HACIA SRC.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from etl import load_data
+from raw_cache import clear_cache
+
+
+def timed(function, repeat=1):
+    '''
+    Ejecuta la función "repeat" veces y devuelve el mejor tiempo en segundos.
+    '''
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(repeat=5):
+    '''
+    Compara el tiempo de carga de los CSV crudos sin caché, con la caché vacía (parseo + escritura
+    de la caché) y con la caché ya generada (lectura de los .npy como memmap).
+    '''
+
+    cache_dir = tempfile.mkdtemp(prefix="etl_cache_")
+    try:
+        sin_cache = timed(lambda: load_data(use_cache=False), repeat)
+        cold = timed(lambda: (clear_cache(cache_dir), load_data(cache_dir=cache_dir)), repeat)
+        warm = timed(lambda: load_data(cache_dir=cache_dir), repeat)
+    finally:
+        clear_cache(cache_dir)
+
+    print(f"Sin caché (pd.read_csv): {sin_cache * 1000:.1f} ms")
+    print(f"Caché fría (parseo + escritura): {cold * 1000:.1f} ms")
+    print(f"Caché caliente (memmap): {warm * 1000:.1f} ms")
+    print(f"Aceleración caliente vs sin caché: {sin_cache / warm:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import sys
+import os
+import io
+import time
+import shutil
+import filecmp
+import tempfile
+import contextlib
+
+# RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (BENCHMARKS/BENCH_FIGURE_CACHE.PY) HACIA SRC.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import figure_render
+from etl import build_context
+from eda import run_eda
+from stats import run_stats
+
+
+def render_all(context, figures_dir, reuse):
+    '''
+    Ejecuta run_stats completo (sin ejecución incremental, en serie) guardando los gráficos en
+    figures_dir, creando una figura nueva por gráfico (reuse=False) o reutilizando las figuras
+    (reuse=True). Devuelve el tiempo en segundos y cuántos .png se dibujaron.
+    '''
+
+    figure_render.FIGURES_PATH = figures_dir
+    figure_render.REUSE_FIGURES = reuse
+    before = {name: os.stat(os.path.join(figures_dir, name)).st_mtime_ns for name in os.listdir(figures_dir)}
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_stats(context, incremental=False)
+    elapsed = time.perf_counter() - start
+    drawn = sum(os.stat(os.path.join(figures_dir, name)).st_mtime_ns != before.get(name) for name in os.listdir(figures_dir))
+    return elapsed, drawn
+
+
+def middle_edit_redraws(context, figures_dir):
+    '''
+    Cambia un único valor en el medio de la tasa de alfabetización (donde el repr() de la Series, que
+    sólo muestra las primeras y últimas filas, no lo ve) y comprueba que, con la caché de figuras ya
+    generada, literacy_global.png se vuelve a dibujar. Restaura el dataset al terminar.
+    '''
+
+    path = os.path.join(figures_dir, "literacy_global.png")
+    original = context.processed["literacy"]
+    edited = original.copy()
+    position = edited.columns.get_loc("Tasa de alfabetización")
+    edited.iloc[len(edited) // 2, position] = edited.iloc[len(edited) // 2, position] / 2
+    before = os.stat(path).st_mtime_ns
+    try:
+        context.processed["literacy"] = edited
+        context.index, context.aggregates, context.panel, context.tensors = None, None, None, None
+        render_all(context, figures_dir, reuse=True)
+    finally:
+        context.processed["literacy"] = original
+        context.index, context.aggregates, context.panel, context.tensors = None, None, None, None
+    return os.stat(path).st_mtime_ns != before
+
+
+def main(repeat=2):
+    '''
+    Mide el rendimiento de dibujo de todas las figuras de run_stats: con una figura nueva por gráfico,
+    reutilizando las figuras y sus ejes (el mejor de "repeat" intentos de cada modo, alternados) y con
+    la caché de figuras ya generada (no se dibuja ninguna). Comprueba que los .png con y sin
+    reutilización sean idénticos byte a byte. La caché de figuras se guarda en un directorio temporal.
+    '''
+
+    context = build_context()
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_eda(context, incremental=False)
+
+    cache_dir = tempfile.mkdtemp(prefix="figure_cache_")
+    figure_render.FIGURE_CACHE_PATH = cache_dir
+    new_dir, reuse_dir = tempfile.mkdtemp(prefix="figures_new_"), tempfile.mkdtemp(prefix="figures_reuse_")
+    times = {False: [], True: []}
+    try:
+        # UNA PRIMERA EJECUCIÓN, CUYO TIEMPO NO SE CUENTA, IMPORTA LAS LIBRERÍAS DE GRÁFICOS. EN CADA
+        # INTENTO SE VACÍA LA CACHÉ, PARA QUE SE DIBUJEN TODAS LAS FIGURAS
+        for attempt in range(repeat + 1):
+            for reuse, directory in ((False, new_dir), (True, reuse_dir)):
+                shutil.rmtree(cache_dir, ignore_errors=True)
+                elapsed, drawn = render_all(context, directory, reuse)
+                if attempt:
+                    times[reuse].append(elapsed)
+        cached, redrawn = render_all(context, reuse_dir, reuse=True)
+        names = sorted(os.listdir(new_dir))
+        _, mismatch, errors = filecmp.cmpfiles(new_dir, reuse_dir, names, shallow=False)
+        middle_redrawn = middle_edit_redraws(context, reuse_dir)
+    finally:
+        for directory in (new_dir, reuse_dir, cache_dir):
+            shutil.rmtree(directory, ignore_errors=True)
+
+    new, reuse = min(times[False]), min(times[True])
+    print(f"→ figuras de run_stats: {len(names)} .png ({drawn} dibujados por ejecución)")
+    print(f"→ figura nueva por gráfico: {new:.1f} s ({drawn / new:.2f} .png/s)")
+    print(f"→ figuras y ejes reutilizados: {reuse:.1f} s ({drawn / reuse:.2f} .png/s, {new / reuse:.2f}x)")
+    print(f"→ con la caché de figuras: {cached:.1f} s ({redrawn} .png vueltos a dibujar, {new / cached:.1f}x)")
+    print(f"→ .png distintos entre figura nueva y reutilizada: {len(mismatch) + len(errors)}")
+    assert middle_redrawn, "literacy_global.png no se volvió a dibujar tras cambiar un valor del medio"
+    print("→ un cambio en el medio de la tasa de alfabetización vuelve a dibujar literacy_global.png")
+
+
+if __name__ == "__main__":
+    main()
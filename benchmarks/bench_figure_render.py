@@ -0,0 +1,61 @@
+import sys
+import os
+import io
+import time
+import shutil
+import filecmp
+import tempfile
+import contextlib
+
+# RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (BENCHMARKS/BENCH_FIGURE_RENDER.PY) HACIA SRC.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import figure_render
+from etl import build_context
+from eda import run_eda
+from stats import run_stats
+
+
+def render_all(context, figures_dir, workers):
+    '''
+    Ejecuta run_stats completo (sin ejecución incremental) guardando los gráficos en figures_dir y
+    devuelve el tiempo en segundos.
+    '''
+
+    figure_render.FIGURES_PATH = figures_dir
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_stats(context, incremental=False, workers=workers)
+    return time.perf_counter() - start
+
+
+def main(workers=None):
+    '''
+    Compara el tiempo de run_stats dibujando los gráficos en serie y en un pool de procesos, y
+    comprueba que los .png de ambos modos sean idénticos byte a byte.
+    '''
+
+    workers = workers or os.cpu_count()
+    context = build_context()
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_eda(context, incremental=False)
+
+    serial_dir = tempfile.mkdtemp(prefix="figures_serial_")
+    pool_dir = tempfile.mkdtemp(prefix="figures_pool_")
+    try:
+        serial = render_all(context, serial_dir, workers=None)
+        pool = render_all(context, pool_dir, workers=workers)
+        names = sorted(os.listdir(serial_dir))
+        _, mismatch, errors = filecmp.cmpfiles(serial_dir, pool_dir, names, shallow=False)
+    finally:
+        shutil.rmtree(serial_dir, ignore_errors=True)
+        shutil.rmtree(pool_dir, ignore_errors=True)
+
+    print(f"Gráficos generados: {len(names)}")
+    print(f"En serie: {serial:.1f} s")
+    print(f"Pool de {workers} procesos: {pool:.1f} s")
+    print(f"Aceleración: {serial / pool:.1f}x")
+    print(f"Gráficos distintos entre ambos modos: {len(mismatch) + len(errors)}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else None)
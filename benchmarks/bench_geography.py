@@ -0,0 +1,76 @@
+import sys
+import os
+import io
+import time
+import contextlib
+
+# RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (BENCHMARKS/BENCH_GEOGRAPHY.PY) HACIA SRC.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import pandas as pd
+from etl import load_data, build_context
+from eda import run_eda
+from geography import GEOGRAPHIES, normalize_geography, geography_report
+
+
+# COLUMNA DE GEOGRAFÍAS DE CADA DATASET CRUDO
+COLUMNS = {
+    "vaccination_coverage": "Entity",
+    "life_expectancy": "Entity",
+    "preventable_deaths": "location_name",
+    "gdp": "Entity",
+    "literacy": "Entity",
+    "child_mortality": "Entity"
+}
+
+
+def by_rows(df, column, repeated_geographies, country_translation_dict):
+    '''
+    Versión anterior: isin() y replace() sobre todas las filas.
+    '''
+
+    df = df[~df[column].isin(repeated_geographies)].copy()
+    df[column] = df[column].replace(country_translation_dict)
+    return df
+
+
+def timed(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(repeat=5):
+    '''
+    Compara, para cada dataset, el filtrado y la traducción de geografías fila a fila con el
+    normalizador de geography.py, y comprueba que ambos den el mismo resultado y que el informe del
+    normalizador cuente bien los lugares distintos y las filas eliminadas. Comprueba también que
+    run_eda reúna el informe de los seis datasets cuando la limpieza se hace en un pool de procesos.
+    '''
+
+    raw = load_data()
+    rows, reports = [], {}
+    for dataset, column in COLUMNS.items():
+        df = raw[dataset]
+        old, expected = timed(lambda: by_rows(df, column, *GEOGRAPHIES[dataset]), repeat)
+        new, result = timed(lambda: normalize_geography(df, column, dataset, reports=reports), repeat)
+        assert reports[dataset]["lugares distintos"] == df[column].nunique(), dataset
+        assert reports[dataset]["filas eliminadas"] == len(df) - len(result), dataset
+        rows.append({"dataset": dataset, "fila a fila (ms)": old * 1000, "normalizador (ms)": new * 1000,
+                     "aceleración": old / new, "iguales": expected.equals(result)})
+
+    print(geography_report(reports).round(4).to_string())
+    print()
+    print(pd.DataFrame(rows).set_index("dataset").round(2).to_string())
+
+    context = build_context(verbosity=0)
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_eda(context, incremental=False, workers=2)
+    assert set(context.geography) == set(COLUMNS), sorted(context.geography)
+    print(f"\n→ run_eda con 2 procesos: informe de {len(context.geography)} datasets")
+
+
+if __name__ == "__main__":
+    main()
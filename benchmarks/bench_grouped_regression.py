@@ -0,0 +1,64 @@
+import sys
+import os
+import time
+
+# RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (BENCHMARKS/BENCH_GROUPED_REGRESSION.PY) HACIA SRC.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import numpy as np
+import pandas as pd
+from panel import load_panel
+from regression import fit_regression, grouped_regressions
+
+Y_COLS = ["Esperanza de vida al nacer", "Mortalidad infantil"]
+
+
+def loop_regressions(panel, x_cols, y_cols):
+    '''
+    Las mismas regresiones ajustadas una por una: para cada país y cada par (x, y), las filas del país
+    con dato en ambas columnas y un fit_regression().
+    '''
+
+    rows = []
+    for country, df in panel.groupby("País", observed=True):
+        for x_col in x_cols:
+            for y_col in y_cols:
+                data = df[[x_col, y_col]].dropna()
+                if len(data) < 3 or data[x_col].nunique() < 2:
+                    continue
+                fit = fit_regression(data, x_col, y_col)
+                rows.append({"País": country, "variable explicativa": x_col, "variable explicada": y_col,
+                             "pendiente": fit.params.loc[x_col, y_col], "p-valor de la pendiente": fit.pvalues.loc[x_col, y_col]})
+    return pd.DataFrame(rows)
+
+
+def main():
+    '''
+    Compara el ajuste país por país de las regresiones de la esperanza de vida y la mortalidad infantil
+    sobre la vacunación promedio y cada vacuna con grouped_regressions() (todas a la vez desde sumas
+    agrupadas). Comprueba que las pendientes y los p-valores coinciden.
+    '''
+
+    panel = load_panel()
+    vaccines = [column for column in panel.columns if column.startswith("Porcentaje")]
+    panel = panel.assign(**{"Vacunación promedio (%)": panel[vaccines].mean(axis=1)})
+    x_cols = ["Vacunación promedio (%)"] + vaccines
+
+    # LOS PAÍSES EN LOS QUE y NO VARÍA DAN R² Y p-VALOR NaN EN AMBOS CASOS
+    start = time.perf_counter()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        expected = loop_regressions(panel, x_cols, Y_COLS)
+    loop_time = time.perf_counter() - start
+    start = time.perf_counter()
+    table = grouped_regressions(panel, "País", x_cols, Y_COLS)
+    grouped_time = time.perf_counter() - start
+
+    keys = ["País", "variable explicativa", "variable explicada"]
+    merged = expected.merge(table.astype({"País": str}), on=keys, suffixes=("", " agrupada"))
+    for column in ("pendiente", "p-valor de la pendiente"):
+        assert np.allclose(merged[column], merged[f"{column} agrupada"], rtol=1e-6, atol=1e-10, equal_nan=True), column
+    print(f"→ {len(table)} regresiones ({len(merged)} con x variable comparadas)")
+    print(f"→ país por país: {loop_time * 1000:.0f} ms, agrupadas: {grouped_time * 1000:.1f} ms ({loop_time / grouped_time:.0f}x), mismos resultados")
+
+
+if __name__ == "__main__":
+    main()
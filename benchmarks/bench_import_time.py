@@ -0,0 +1,69 @@
+import sys
+import os
+import json
+import subprocess
+
+# RUTAS DE SRC Y NOTEBOOKS, DESDE EL ARCHIVO ACTUAL (BENCHMARKS/BENCH_IMPORT_TIME.PY)
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+PATHS = [os.path.join(BASE_DIR, 'src'), os.path.join(BASE_DIR, 'notebooks')]
+
+# LIBRERÍAS PESADAS QUE SÓLO DEBEN CARGARSE AL DIBUJAR UNA FIGURA O AJUSTAR UN MODELO
+HEAVY_MODULES = ["matplotlib", "seaborn", "scipy", "statsmodels", "sklearn"]
+
+# IMPORTACIONES QUE SE MIDEN: LA REFERENCIA (PANDAS, QUE EL ETL SIEMPRE NECESITA) Y LOS PUNTOS DE ENTRADA
+# DEL ETL. "stats" SE MIDE PARA VER QUE TAMPOCO CARGA LAS LIBRERÍAS PESADAS AL IMPORTARSE
+IMPORTS = {
+    "pandas (referencia)": "import pandas",
+    "etl": "from etl import build_context",
+    "main.py (todas las etapas)": "from main import main",
+    "stats": "import stats"
+}
+
+# MARGEN, SOBRE EL TIEMPO DE IMPORTAR PANDAS, QUE PUEDEN TARDAR LOS PUNTOS DE ENTRADA DEL ETL. CON
+# MATPLOTLIB, SEABORN, SCIPY, STATSMODELS Y SCIKIT-LEARN SE SUPERABA EN MÁS DE DOS SEGUNDOS
+BUDGET = 0.25
+
+
+def import_time(statement, repeat=5):
+    '''
+    Ejecuta "statement" en un intérprete nuevo (sin módulos ya importados) "repeat" veces. Devuelve el
+    mejor tiempo en segundos y las librerías pesadas que quedaron cargadas.
+    '''
+
+    code = (f"import sys, time, json; sys.path[:0] = {PATHS!r}; start = time.perf_counter(); {statement}; "
+            f"print(json.dumps([time.perf_counter() - start, sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules)]))")
+    best, heavy = float("inf"), []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        elapsed, heavy = json.loads(output.splitlines()[-1])
+        best = min(best, elapsed)
+    return best, heavy
+
+
+def main(repeat=5):
+    '''
+    Mide el tiempo de importación de los puntos de entrada del ETL en intérpretes nuevos. Termina con
+    código 1 si alguno carga una librería pesada o si tarda más de BUDGET segundos por encima de
+    importar pandas, de modo que puede usarse como prueba de regresión.
+    '''
+
+    times, failures = {}, []
+    for name, statement in IMPORTS.items():
+        times[name], heavy = import_time(statement, repeat)
+        print(f"→ {name}: {times[name] * 1000:.0f} ms" + (f" (carga {', '.join(heavy)})" if heavy else ""))
+        if heavy:
+            failures.append(f"{name} importa {', '.join(heavy)}")
+
+    reference = times.pop("pandas (referencia)")
+    for name, elapsed in times.items():
+        if elapsed - reference > BUDGET:
+            failures.append(f"{name} tarda {elapsed - reference:.2f} s más que importar pandas (máximo {BUDGET} s)")
+
+    if failures:
+        print("\nREGRESIÓN EN EL TIEMPO DE ARRANQUE:\n" + "\n".join(f"  {failure}" for failure in failures))
+        sys.exit(1)
+    print("\nSin regresiones en el tiempo de arranque.")
+
+
+if __name__ == "__main__":
+    main()
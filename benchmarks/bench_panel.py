@@ -0,0 +1,96 @@
+import sys
+import os
+import time
+import warnings
+import shutil
+import tempfile
+
+# RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (BENCHMARKS/BENCH_PANEL.PY) HACIA SRC.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import pandas as pd
+from etl import build_context
+from eda import run_eda
+from dtype_optimizer import run_dtype_optimizer
+from panel import build_panel, save_panel, load_panel, panel_format
+
+VACCINE = "Porcentaje de niños de un año que han recibido su primera dosis de vacuna contra el sarampión (MCV1)"
+LIFE = "Esperanza de vida al nacer"
+
+
+def timed(function, repeat=5):
+    '''
+    Ejecuta la función "repeat" veces y devuelve el mejor tiempo en segundos y el último resultado.
+    '''
+
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def merge_panel(processed):
+    '''
+    El mismo panel construido con merges externos de pandas sobre (País, Año), uno por dataset.
+    '''
+
+    deaths = processed["preventable_deaths"].pivot_table(index=["País", "Año"], columns="Causa de muerte", values="Muertes", aggfunc="sum", observed=True).reset_index()
+    panel = None
+    for df in [processed["vaccination_coverage"], processed["life_expectancy"], processed["child_mortality"], deaths, processed["literacy"], processed["gdp"]]:
+        df = df.assign(País=df["País"].astype(str))
+        panel = df if panel is None else panel.merge(df, on=["País", "Año"], how="outer")
+    return panel.sort_values(["País", "Año"], ignore_index=True)
+
+
+def main():
+    '''
+    Mide, con los datos ya limpios y optimizados: la construcción del panel país-año sobre claves
+    enteras frente a encadenar merges de pandas, su lectura desde data/processed/panel frente a
+    reconstruirlo, y una consulta por país (correlación entre vacunación contra el sarampión y
+    esperanza de vida en cada país) sobre el panel frente a filtrar y unir los dos datasets país por país.
+    '''
+
+    context = build_context(verbosity=0)
+    run_eda(context, incremental=False)
+    run_dtype_optimizer(context, verbose=False)
+    processed = context.processed
+
+    merge_time, merged = timed(lambda: merge_panel(processed))
+    build_time, panel = timed(lambda: build_panel(processed))
+    print(f"→ construcción: merges de pandas {merge_time * 1000:.1f} ms, claves enteras {build_time * 1000:.1f} ms "
+          f"({merge_time / build_time:.1f}x), {len(panel)} filas (merges: {len(merged)})")
+
+    directory = tempfile.mkdtemp(prefix="panel_")
+    try:
+        save_panel(panel, directory)
+        load_time, loaded = timed(lambda: load_panel(directory))
+        pd.testing.assert_frame_equal(loaded, panel)
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory)) / 2**20
+        print(f"→ lectura del panel guardado ({panel_format()}, {size:.1f} MB): {load_time * 1000:.1f} ms ({build_time / load_time:.1f}x frente a reconstruirlo)")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    # LOS PAÍSES CON UNA SERIE CONSTANTE DAN CORRELACIÓN NaN (Y UN AVISO DE NUMPY) EN AMBOS CASOS
+    warnings.simplefilter("ignore", RuntimeWarning)
+    vaccination, life = processed["vaccination_coverage"], processed["life_expectancy"]
+
+    def per_country_joins():
+        result = {}
+        for country in vaccination["País"].unique():
+            joined = vaccination[vaccination["País"] == country][["Año", VACCINE]].merge(life[life["País"] == country][["Año", LIFE]], on="Año")
+            result[country] = joined[VACCINE].corr(joined[LIFE])
+        return pd.Series(result).sort_index()
+
+    def per_country_panel():
+        return panel.groupby("País", observed=True)[[VACCINE, LIFE]].corr().xs(VACCINE, level=1)[LIFE].reindex(sorted(vaccination["País"].unique()))
+
+    joins_time, expected = timed(per_country_joins, repeat=3)
+    panel_time, result = timed(per_country_panel, repeat=3)
+    error = (result.astype(float) - expected.reindex(result.index).astype(float)).abs().max()
+    print(f"→ correlación por país: filtros y merges {joins_time * 1000:.0f} ms, panel {panel_time * 1000:.1f} ms "
+          f"({joins_time / panel_time:.0f}x), diferencia máxima {error:.1e}")
+
+
+if __name__ == "__main__":
+    main()
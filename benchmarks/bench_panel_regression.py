@@ -0,0 +1,71 @@
+import sys
+import os
+import time
+
+# RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (BENCHMARKS/BENCH_PANEL_REGRESSION.PY) HACIA SRC.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import numpy as np
+import pandas as pd
+from panel import load_panel
+from regression import fit_panel_regression, _drop_singletons
+
+Y_COL = "Esperanza de vida al nacer"
+X_COLS = ["Vacunación promedio (%)", "PIB per cápita (log)"]
+
+
+def dummy_regression(df):
+    '''
+    La misma regresión con una columna indicadora por país y por año (menos un año) y np.linalg.lstsq
+    sobre la matriz densa, con la covarianza agrupada por país de la matriz completa (la corrección
+    G / (G - 1) · (N - 1) / (N - K) con K = columnas de la matriz). Devuelve los coeficientes de X_COLS,
+    sus errores estándar y la forma de la matriz.
+    '''
+
+    countries = pd.get_dummies(df["País"].astype(str), dtype=np.float64)
+    years = pd.get_dummies(df["Año"], dtype=np.float64, drop_first=True)
+    design = np.hstack([df[X_COLS].to_numpy(dtype=np.float64), countries.to_numpy(), years.to_numpy()])
+    y = df[Y_COL].to_numpy(dtype=np.float64)
+    params = np.linalg.lstsq(design, y, rcond=None)[0]
+
+    clusters = pd.factorize(df["País"])[0]
+    groups = clusters.max() + 1
+    scores = np.stack([np.bincount(clusters, weights=design[:, j] * (y - design @ params), minlength=groups) for j in range(design.shape[1])], axis=1)
+    bread = np.linalg.inv(design.T @ design)
+    correction = groups / (groups - 1) * (len(y) - 1) / (len(y) - design.shape[1])
+    covariance = correction * bread @ (scores.T @ scores) @ bread
+    return params[:len(X_COLS)], np.sqrt(np.diag(covariance))[:len(X_COLS)], design.shape
+
+
+def main():
+    '''
+    Compara la regresión de panel con efectos fijos de país y de año ajustada con la matriz densa de
+    indicadoras con fit_panel_regression() (transformación within con np.bincount). Comprueba que los
+    coeficientes y los errores estándar agrupados por país coinciden.
+    '''
+
+    panel = load_panel()
+    vaccines = [column for column in panel.columns if column.startswith("Porcentaje")]
+    panel = panel.assign(**{"Vacunación promedio (%)": panel[vaccines].mean(axis=1),
+                            "PIB per cápita (log)": np.log(panel["PIB per cápita a precios constantes"])})
+
+    # LAS MISMAS FILAS QUE USA fit_panel_regression: CON DATO Y SIN GRUPOS DE UNA SOLA FILA
+    rows = panel[[Y_COL] + X_COLS + ["País", "Año"]].dropna()
+    rows = rows[_drop_singletons([pd.factorize(rows[column])[0] for column in ("País", "Año")])]
+
+    start = time.perf_counter()
+    expected, expected_stderr, shape = dummy_regression(rows)
+    dummy_time = time.perf_counter() - start
+    # LA PRIMERA LLAMADA IMPORTA SCIPY (PARA LOS p-VALORES); NO SE MIDE
+    fit_panel_regression(panel, Y_COL, X_COLS)
+    start = time.perf_counter()
+    fit = fit_panel_regression(panel, Y_COL, X_COLS)
+    within_time = time.perf_counter() - start
+
+    assert np.allclose(expected, fit.params.to_numpy(), rtol=1e-8), (expected, fit.params)
+    assert np.allclose(expected_stderr, fit.stderr.to_numpy(), rtol=1e-6), (expected_stderr, fit.stderr)
+    print(f"→ {fit.nobs} observaciones, matriz de indicadoras de {shape[0]} x {shape[1]}")
+    print(f"→ indicadoras: {dummy_time * 1000:.0f} ms, within: {within_time * 1000:.1f} ms ({dummy_time / within_time:.0f}x), mismos coeficientes y errores estándar agrupados")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import sys
+import os
+import time
+import itertools
+
+# RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (BENCHMARKS/BENCH_PERMUTATION.PY) HACIA SRC.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import numpy as np
+from panel import load_panel
+from permutation import permutation_test, PERMUTATIONS, BLOCK_SIZE, SEED
+from process_pool import start_process_pool, close_process_pool
+
+# SERIE ANUAL QUE SE TESTEA: PROMEDIOS GLOBALES POR AÑO DE LA VACUNACIÓN Y DE LA ESPERANZA DE VIDA
+YEARS = range(1980, 2020)
+Y_COL = "Esperanza de vida al nacer"
+
+
+def loop_permutations(x, y, permutations=PERMUTATIONS, seed=SEED):
+    '''
+    El mismo test permutación por permutación, sin parada anticipada: rng.permutation y np.polyfit por
+    vuelta de bucle. Devuelve el p-valor.
+    '''
+
+    rng = np.random.default_rng(seed)
+    observed = abs(np.polyfit(x, y, 1)[0])
+    exceed = sum(abs(np.polyfit(x, y[rng.permutation(len(y))], 1)[0]) >= observed * (1 - 1e-12) for _ in range(permutations))
+    return (exceed + 1) / (permutations + 1)
+
+
+def exact_blocks(x, y, block_size):
+    '''
+    p-valor exacto del test por bloques recorriendo con itertools.permutations todos los órdenes de los
+    bloques, con np.polyfit por orden.
+    '''
+
+    blocks = [np.arange(start, min(start + block_size, len(y))) for start in range(0, len(y), block_size)]
+    observed = abs(np.polyfit(x, y, 1)[0])
+    slopes = [abs(np.polyfit(x, y[np.concatenate([blocks[i] for i in order])], 1)[0]) for order in itertools.permutations(range(len(blocks)))]
+    return sum(slope >= observed * (1 - 1e-12) for slope in slopes) / len(slopes), len(slopes)
+
+
+def main(workers=(1, 2, 4)):
+    '''
+    Compara el test de permutaciones de la pendiente vuelta por vuelta con permutation_test() (matriz
+    de índices por bloque, pendientes por lotes y parada anticipada), con permutaciones libres y por
+    bloques, en serie y con pools de distintos tamaños. Comprueba que el resultado no depende de la
+    cantidad de procesos y que, con pocos bloques, el p-valor exacto coincide con el de recorrer todos
+    los órdenes uno por uno.
+    '''
+
+    panel = load_panel()
+    vaccines = [column for column in panel.columns if column.startswith("Porcentaje")]
+    yearly = panel.assign(x=panel[vaccines].mean(axis=1)).groupby("Año")[["x", Y_COL]].mean().reindex(YEARS).dropna()
+    x, y = yearly["x"].to_numpy(), yearly[Y_COL].to_numpy()
+    print(f"→ {len(x)} años, hasta {PERMUTATIONS} permutaciones")
+
+    start = time.perf_counter()
+    expected = loop_permutations(x, y)
+    loop_time = time.perf_counter() - start
+    print(f"→ bucle por permutación: {loop_time * 1000:.0f} ms, p-valor {expected:.4f}")
+
+    for block_size in (None, BLOCK_SIZE):
+        reference = None
+        for count in workers:
+            start_process_pool(count)
+            try:
+                permutation_test(x, y, block_size=block_size)
+                start = time.perf_counter()
+                result = permutation_test(x, y, block_size=block_size)
+                elapsed = time.perf_counter() - start
+            finally:
+                close_process_pool()
+            reference = reference or result
+            assert result == reference, (result, reference)
+            print(f"→ bloques de {block_size or 1}, {count} proceso(s): {elapsed * 1000:.1f} ms ({loop_time / elapsed:.0f}x), "
+                  f"p-valor {result['p-valor']:.4f} con {result['permutaciones']} permutaciones, mismo resultado")
+
+    # CON LOS ÚLTIMOS 28 AÑOS HAY 6 BLOQUES (EL ÚLTIMO MÁS CORTO) Y 6! = 720 ÓRDENES: SE ENUMERAN TODOS
+    x, y = x[-28:], y[-28:]
+    start = time.perf_counter()
+    expected, orders = exact_blocks(x, y, BLOCK_SIZE)
+    loop_time = time.perf_counter() - start
+    start = time.perf_counter()
+    result = permutation_test(x, y, block_size=BLOCK_SIZE)
+    elapsed = time.perf_counter() - start
+    assert result["exacto"] and result["permutaciones"] == orders == 720, result
+    assert result["error de Monte Carlo del p-valor"] == 0.0 and np.isclose(result["p-valor"], expected), (result, expected)
+    print(f"→ {len(x)} años en bloques de {BLOCK_SIZE}: {orders} órdenes exactos en {elapsed * 1000:.1f} ms "
+          f"(bucle {loop_time * 1000:.0f} ms), p-valor {result['p-valor']:.4f}, mismo resultado")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import sys
+import os
+import io
+import time
+import shutil
+import tempfile
+import contextlib
+
+# RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (BENCHMARKS/BENCH_PROFILING.PY) HACIA SRC.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from etl import load_data
+from profiling import ProfileReport, print_frame
+
+
+def timed(function, repeat=3):
+    '''
+    Ejecuta la función "repeat" veces y devuelve el mejor tiempo en segundos y el último resultado.
+    '''
+
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    '''
+    Compara, para cada dataset crudo, el volcado por consola que hacía el EDA (head(10000), info() y
+    unique() de cada columna) con el perfil de una pasada escrito como JSON y Markdown.
+    '''
+
+    raw = load_data()
+    directory = tempfile.mkdtemp(prefix="profiles_")
+    try:
+        for name, df in raw.items():
+            def dump():
+                buffer = io.StringIO()
+                with contextlib.redirect_stdout(buffer):
+                    print_frame(df)
+                return len(buffer.getvalue().encode("utf-8"))
+
+            def profile():
+                report = ProfileReport(name, verbosity=0)
+                report.add("crudo", df)
+                return sum(os.path.getsize(path) for path in report.write(directory))
+
+            dump_time, dump_bytes = timed(dump)
+            profile_time, profile_bytes = timed(profile)
+            print(f"→ {name}: volcado {dump_time * 1000:.0f} ms ({dump_bytes / 1024:.0f} KB), "
+                  f"perfil {profile_time * 1000:.0f} ms ({profile_bytes / 1024:.0f} KB), {dump_time / profile_time:.1f}x")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import sys
+import os
+import time
+
+# RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (BENCHMARKS/BENCH_QUERY.PY) HACIA SRC.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import numpy as np
+from etl import build_context
+from eda import run_eda
+from dtype_optimizer import run_dtype_optimizer
+from panel import build_panel
+from query import DatasetIndex
+
+COUNTRIES = ["España", "Francia", "Italia", "Portugal", "Alemania"]
+
+
+def timed(function, repeat=100):
+    '''
+    Ejecuta la función "repeat" veces y devuelve el mejor tiempo en segundos y el último resultado.
+    '''
+
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    '''
+    Compara, para cada dataset limpio y para el panel país-año, las selecciones que stats.py hacía con
+    máscaras booleanas (un país, un año, un rango de años con isin() y un conjunto de países en un
+    rango de años) con las mismas selecciones hechas con DatasetIndex.select() sobre el índice
+    (País, Año) ordenado. También mide lo que cuesta indexar, que se paga una única vez.
+    '''
+
+    context = build_context(verbosity=0)
+    run_eda(context, incremental=False)
+    run_dtype_optimizer(context, verbose=False)
+    datasets = dict(context.processed, panel=build_panel(context.processed))
+
+    index_time, index = timed(lambda: DatasetIndex(datasets), repeat=5)
+    print(f"→ indexar los {len(datasets)} datasets (una vez): {index_time * 1000:.1f} ms")
+
+    years = list(range(1980, 2020))
+    for name, df in datasets.items():
+        queries = {
+            "país": (lambda: df[df["País"] == "España"], dict(country="España")),
+            "año": (lambda: df[df["Año"] == 2019], dict(years=2019)),
+            "rango de años": (lambda: df[df["Año"].isin(years)], dict(years=(1980, 2019))),
+            "países y rango": (lambda: df[df["País"].isin(COUNTRIES) & df["Año"].isin(years)], dict(country=COUNTRIES, years=(1980, 2019)))
+        }
+        results = []
+        for query, (mask, arguments) in queries.items():
+            mask_time, expected = timed(mask)
+            select_time, selected = timed(lambda: index.select(name, **arguments))
+            assert len(selected) == len(expected), (name, query)
+            results.append(f"{query} {mask_time * 1e6:.0f} → {select_time * 1e6:.0f} µs ({mask_time / select_time:.1f}x)")
+        print(f"→ {name} ({len(df)} filas): " + ", ".join(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import sys
+import os
+import json
+import subprocess
+
+# RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (BENCHMARKS/BENCH_READ_SCHEMA.PY) HACIA SRC.
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(SRC_PATH)
+from etl import RAW_SCHEMAS, csv_engine
+
+DATA_PATH = os.path.join(os.path.dirname(SRC_PATH), "data", "raw")
+FILENAMES = ["Deaths vaccines could have prevented 1.csv", "Deaths vaccines could have prevented 2.csv"]
+
+# SCRIPT QUE SE EJECUTA EN UN PROCESO NUEVO PARA CADA MEDICIÓN, DE MODO QUE EL PICO DE MEMORIA (RU_MAXRSS)
+# DE UNA LECTURA NO SE MEZCLE CON EL DE LAS DEMÁS
+CHILD = '''
+import sys, json, time, resource
+import pandas as pd
+paths, read_csv_kwargs = json.loads(sys.argv[1])
+base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+df = pd.concat([pd.read_csv(path, **read_csv_kwargs) for path in paths], ignore_index=True)
+elapsed = time.perf_counter() - start
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps([elapsed, (peak - base) / 1024, df.shape[1]]))
+'''
+
+
+def measure(read_csv_kwargs, repeat):
+    '''
+    Lee los dos CSV de "Deaths vaccines could have prevented" "repeat" veces, cada vez en un proceso
+    nuevo, y devuelve el mejor tiempo (s), el menor pico de memoria por encima del de arranque (MB) y
+    el número de columnas leídas.
+    '''
+
+    paths = [os.path.join(DATA_PATH, filename) for filename in FILENAMES]
+    results = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", CHILD, json.dumps([paths, read_csv_kwargs])], capture_output=True, text=True, check=True).stdout
+        results.append(json.loads(output))
+    return min(r[0] for r in results), min(r[1] for r in results), results[0][2]
+
+
+def main(repeat=5):
+    '''
+    Compara tiempo de parseo y pico de memoria de la exportación del IHME (preventable deaths) leída
+    completa, leída con su esquema de RAW_SCHEMAS y, si pyarrow está instalado, con el esquema y el
+    motor multihilo.
+    '''
+
+    schema = RAW_SCHEMAS[FILENAMES[0]]
+    modes = {"completo (motor c)": {}, "esquema (motor c)": dict(schema)}
+    if csv_engine(multithreaded=True) == "pyarrow":
+        modes["esquema (motor pyarrow)"] = dict(schema, engine="pyarrow")
+
+    results = {name: measure(read_csv_kwargs, repeat) for name, read_csv_kwargs in modes.items()}
+
+    full_time, full_memory, _ = results["completo (motor c)"]
+    for name, (elapsed, memory, columns) in results.items():
+        print(f"{name}: {columns} columnas, {elapsed * 1000:.1f} ms ({full_time / elapsed:.1f}x), pico de memoria {memory:.1f} MB ({full_memory / memory:.1f}x menos)")
+    if len(modes) == 2:
+        print("pyarrow no está instalado: no se mide el motor multihilo.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import sys
+import os
+import json
+import shutil
+import tempfile
+import subprocess
+
+# RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (BENCHMARKS/BENCH_STREAMING.PY) HACIA SRC.
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(SRC_PATH)
+
+DATA_PATH = os.path.join(os.path.dirname(SRC_PATH), "data", "raw")
+FILENAMES = ["Deaths vaccines could have prevented 1.csv", "Deaths vaccines could have prevented 2.csv"]
+
+# SCRIPT QUE SE EJECUTA EN UN PROCESO NUEVO PARA CADA MEDICIÓN, DE MODO QUE EL PICO DE MEMORIA (RU_MAXRSS)
+# DE UNA LECTURA NO SE MEZCLE CON EL DE LAS DEMÁS. SIN CHUNKSIZE, SE LEEN LOS ARCHIVOS COMPLETOS Y SE
+# FILTRAN DESPUÉS, COMO HACEN LOAD_DATA Y EDA_PREVENTABLE_DEATHS
+CHILD = '''
+import sys, json, time, resource
+sys.path.append(sys.argv[1])
+import pandas as pd
+from etl import PREVENTABLE_DEATHS_SCHEMA, PREVENTABLE_DEATHS_EXCLUDED_METRICS, stream_preventable_deaths
+from geography import get_normalizer
+paths, chunksize = json.loads(sys.argv[2])
+base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+if chunksize:
+    df = stream_preventable_deaths(paths, chunksize)
+else:
+    df = pd.concat([pd.read_csv(path, **PREVENTABLE_DEATHS_SCHEMA) for path in paths], ignore_index=True)
+    df = get_normalizer("preventable_deaths").normalize(df, 'location_name')
+    df = df[~df['metric_name'].isin(PREVENTABLE_DEATHS_EXCLUDED_METRICS)]
+elapsed = time.perf_counter() - start
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps([elapsed, (peak - base) / 1024, len(df)]))
+'''
+
+
+def enlarge(directory, copies):
+    '''
+    Escribe en "directory" los dos CSV de muestra repetidos "copies" veces (con una sola cabecera),
+    para simular exportaciones del IHME más grandes. Devuelve las rutas.
+    '''
+
+    paths = []
+    for filename in FILENAMES:
+        with open(os.path.join(DATA_PATH, filename), encoding="utf-8") as f:
+            header, body = f.readline(), f.read()
+        path = os.path.join(directory, filename)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(header)
+            for _ in range(copies):
+                f.write(body)
+        paths.append(path)
+    return paths
+
+
+def measure(paths, chunksize):
+    '''
+    Devuelve el tiempo (s), el pico de memoria por encima del de arranque (MB) y las filas resultantes
+    de leer y filtrar "paths" en un proceso nuevo, completos (chunksize=None) o por bloques.
+    '''
+
+    output = subprocess.run([sys.executable, "-c", CHILD, SRC_PATH, json.dumps([paths, chunksize])], capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+def main(copies=(1, 4), chunksizes=(None, 10_000, 50_000)):
+    '''
+    Compara el pico de memoria de la lectura completa y de la lectura por bloques de la exportación
+    de "Deaths vaccines could have prevented", con los archivos de muestra y con versiones agrandadas.
+    Con la lectura por bloques, el pico debe crecer con las filas que sobreviven al filtro y no con el
+    tamaño de los archivos.
+    '''
+
+    directory = tempfile.mkdtemp(prefix="streaming_")
+    try:
+        for n in copies:
+            paths = enlarge(directory, n)
+            size = sum(os.path.getsize(path) for path in paths) / 2**20
+            print(f"\n Archivos de {size:.0f} MB ({n}x la muestra):")
+            for chunksize in chunksizes:
+                elapsed, memory, rows = measure(paths, chunksize)
+                mode = f"por bloques de {chunksize} filas" if chunksize else "completo"
+                print(f"→ {mode}: {elapsed * 1000:.0f} ms, pico de memoria {memory:.1f} MB, {rows} filas")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import sys
+import os
+import time
+import shutil
+import tempfile
+import subprocess
+
+# RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (BENCHMARKS/BENCH_TENSOR_STORE.PY) HACIA SRC.
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(SRC_PATH)
+import numpy as np
+from etl import build_context
+from eda import run_eda
+from dtype_optimizer import run_dtype_optimizer, to_float64
+from panel import build_panel
+from tensor_store import build_tensor
+
+LIFE = "Esperanza de vida al nacer"
+GDP = "PIB per cápita a precios constantes"
+
+# SCRIPT QUE SE EJECUTA EN UN PROCESO NUEVO: ABRE EL TENSOR YA GUARDADO Y LEE UN RECORTE, SIN PARSEAR CSV
+CHILD = '''
+import sys, time
+start = time.perf_counter()
+sys.path.append(sys.argv[1])
+from tensor_store import TensorStore
+store = TensorStore.open(sys.argv[2])
+values = store.series(sys.argv[3], country="España", dropna=True)
+print(time.perf_counter() - start, len(values))
+'''
+
+
+def timed(function, repeat=200):
+    '''
+    Ejecuta la función "repeat" veces y devuelve el mejor tiempo en segundos y el último resultado.
+    '''
+
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    '''
+    Compara los recortes "España a lo largo de los años" y "todos los países en 2019" de la esperanza
+    de vida hechos con máscaras booleanas sobre el dataset (como hacía stats.py) y como vistas del
+    tensor país x año x indicador, y comprueba que el tensor guarde los mismos valores que los
+    datasets limpios: el PIB, que quedó en float64, sin pasar por float32, y la esperanza de vida,
+    float32, redondeada a sus decimales. También mide cuánto tarda un proceso nuevo en abrir el
+    tensor guardado y leer un recorte.
+    '''
+
+    context = build_context(verbosity=0)
+    run_eda(context, incremental=False)
+    run_dtype_optimizer(context, verbose=False)
+    life, gdp = context.processed["life_expectancy"], context.processed["gdp"]
+
+    directory = tempfile.mkdtemp(prefix="tensor_")
+    try:
+        store = build_tensor(build_panel(context.processed), directory)
+        print(f"→ tensor {' x '.join(map(str, store.tensor.shape))}, {store.tensor.nbytes / 2**20:.1f} MB")
+
+        cases = {
+            "España, todos los años": (lambda: life[life["País"] == "España"][LIFE], lambda: store.view(country="España", indicator=LIFE)),
+            "todos los países en 2019": (lambda: life[life["Año"] == 2019][LIFE], lambda: store.view(year=2019, indicator=LIFE))
+        }
+        for name, (mask, view) in cases.items():
+            mask_time, expected = timed(mask)
+            view_time, values = timed(view)
+            same = np.array_equal(np.sort(to_float64(expected)), np.sort(values[~np.isnan(values)]))
+            assert same, name
+            print(f"→ {name}: máscara {mask_time * 1e6:.0f} µs, vista {view_time * 1e6:.1f} µs ({mask_time / view_time:.0f}x), "
+                  f"sin copia: {np.shares_memory(values, store.tensor)}, mismos valores: {same}")
+
+        for name, values in (("España", gdp[gdp["País"] == "España"][GDP]), ("2019", gdp[gdp["Año"] == 2019][GDP])):
+            view = store.view(**({"country": name} if name == "España" else {"year": 2019}), indicator=GDP)
+            assert np.array_equal(np.sort(values.to_numpy()), np.sort(view[~np.isnan(view)])), name
+        print(f"→ tensor {store.tensor.dtype}: el PIB de España y de 2019 coincide exactamente con el dataset limpio")
+
+        output = subprocess.run([sys.executable, "-c", CHILD, SRC_PATH, directory, LIFE], capture_output=True, text=True, check=True).stdout.split()
+        print(f"→ proceso nuevo: importar, abrir el tensor y leer España en {float(output[0]) * 1000:.1f} ms ({output[1]} años), sin leer ningún CSV")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
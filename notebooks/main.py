@@ -3,28 +3,67 @@ import os
 
 # RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (NOTEBOOKS/MAIN.PY) HACIA SRC.
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
-from etl import load_data as run_etl
+from etl import build_context as run_etl
 from eda import run_eda
+from dtype_optimizer import run_dtype_optimizer
+from query import run_dataset_index
+from aggregate_cube import run_aggregate_cube
+from panel import run_panel
+from tensor_store import run_tensor_store
 from stats import run_stats
 
-def main():
+def main(verbosity=1, etl_only=False, headless=False):
     '''
-    Llama a los archivos etl.py, eda.py y stats.py para ejecutar el flujo de trabajo.
+    Llama a los archivos etl.py, eda.py y stats.py para ejecutar el flujo de trabajo. Los datasets se 
+    leen una única vez en el ETL y se comparten a través de un mismo contexto en memoria. La limpieza
+    de los seis datasets y los gráficos del análisis estadístico se ejecutan en paralelo, con un
+    proceso por núcleo. Antes del análisis estadístico, los datasets limpios pasan a tipos de datos
+    más compactos (categorías, enteros chicos y float32) para ocupar menos memoria, se ordenan por
+    (País, Año) para que la estadística tome sus recortes por país y por año con select(), se agregan
+    una única vez por país y año en un cubo que consulta la estadística y se unen en un panel
+    país-año que queda guardado en data/processed/panel, junto con su tensor país x año x indicador
+    (un memmap que pueden compartir otros procesos). "verbosity" es el
+    nivel de detalle de lo que se imprime de cada dataset: 0 nada, 1 una línea por perfil (los
+    perfiles completos quedan en data/profiles) y 2 el volcado completo de cada dataset.
+    Con etl_only=True (o "--etl-only" en la línea de comandos) sólo se ejecuta el ETL, para los
+    trabajos programados que sólo necesitan leer los datos: matplotlib, seaborn, scipy, statsmodels y
+    scikit-learn no se importan, porque sólo se cargan al dibujar una figura o ajustar un modelo.
+    Con headless=True (o "--headless") el análisis estadístico no dibuja ningún gráfico y sólo
+    escribe sus resultados numéricos en data/results/stats.json.
     '''
     
     print("Iniciando ETL...")
-    datasets = run_etl()
+    context = run_etl(verbosity=verbosity)
     print("\n Datasets cargados:")
-    for nombre, df in datasets.items():
+    for nombre, df in context.raw.items():
         print(f"→ {nombre}: {df.shape[0]} filas, {df.shape[1]} columnas")
     print ("ETL completado.")
+    if etl_only:
+        return context
 
     print("\n Iniciando EDA...")
-    run_eda()
+    run_eda(context, workers=os.cpu_count())
     print ("EDA completado.")
 
+    print("\n Optimizando tipos de datos...")
+    run_dtype_optimizer(context)
+    print ("Tipos de datos optimizados.")
+
+    print("\n Indexando los datasets por país y año...")
+    run_dataset_index(context)
+    print ("Datasets indexados.")
+
+    print("\n Precalculando agregados por país y año...")
+    run_aggregate_cube(context)
+    print ("Agregados precalculados.")
+
+    print("\n Construyendo el panel país-año...")
+    run_panel(context)
+    run_tensor_store(context)
+    print ("Panel país-año construido.")
+
     print("\n Iniciando análisis estadístico...")
-    run_stats()
+    run_stats(context, workers=os.cpu_count(), headless=headless)
     print ("Análisis estadístico completado.")
 
 '''
@@ -63,4 +102,4 @@ masiva a nivel mundial.
 '''
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(etl_only="--etl-only" in sys.argv[1:], headless="--headless" in sys.argv[1:])
\ No newline at end of file
@@ -0,0 +1,174 @@
+import numpy as np
+import pandas as pd
+
+# AGREGADOS QUE SE GUARDAN PARA CADA INDICADOR EN CADA CELDA DEL CUBO Y ESTADÍSTICAS QUE SE DERIVAN DE
+# ELLOS AL CONSTRUIRLO, DE MODO QUE CADA CONSULTA ES SÓLO BUSCAR UNA COLUMNA
+AGGREGATES = ["Conteo", "Suma", "Suma de cuadrados", "Mínimo", "Máximo"]
+DERIVED = ["Media", "Varianza", "Desviación estándar", "Rango"]
+
+# NIVELES DEL CUBO Y COLUMNAS POR LAS QUE SE AGRUPA EN CADA UNO (ADEMÁS, EL NIVEL "total" TIENE UNA
+# ÚNICA FILA CON EL DATASET COMPLETO)
+LEVELS = {"país-año": ["País", "Año"], "año": ["Año"], "país": ["País"]}
+
+
+class AggregateCube:
+    '''
+    Cubo de agregados de los datasets limpios: para cada dataset e indicador (columna numérica que no
+    sea el año) guarda el conteo de valores no nulos, la suma, la suma de cuadrados, el mínimo y el
+    máximo por (país, año), por año y por país. Los datasets se recorren una única vez, al agregarlos
+    con add(), y después las consultas de series y valores (medias anuales, totales por país, ...) se
+    resuelven buscando en tablas ya agregadas, sin volver a filtrar ni agrupar las filas.
+    '''
+
+    def __init__(self):
+        self.tables = {}
+
+    def __contains__(self, dataset):
+        return dataset in self.tables
+
+    def add(self, dataset, df, indicators=None):
+        '''
+        Agrega "df" bajo el nombre "dataset" (si ya estaba, lo reemplaza). Sólo las celdas (país, año)
+        se calculan a partir de las filas; los niveles de año y de país se obtienen sumando (o tomando
+        el mínimo y el máximo de) esas celdas.
+        '''
+
+        if indicators is None:
+            indicators = [column for column in df.columns if column != "Año" and pd.api.types.is_numeric_dtype(df[column])]
+
+        # CADA FILA ES UNA "CELDA" CON CONTEO 1 (O 0 SI EL VALOR ES NULO), SUMA X, SUMA DE CUADRADOS X² Y
+        # MÍNIMO Y MÁXIMO X; LAS CELDAS (PAÍS, AÑO) SE REDUCEN DESDE LAS FILAS Y LAS DE AÑO Y PAÍS DESDE ELLAS
+        # LAS FILAS SIN PAÍS O SIN AÑO NO PERTENECEN A NINGUNA CELDA
+        country_codes, countries = pd.factorize(df["País"], sort=True)
+        year_codes, years = pd.factorize(df["Año"], sort=True)
+        keep = (country_codes >= 0) & (year_codes >= 0)
+
+        values = np.column_stack([df[column].to_numpy(dtype=np.float64, na_value=np.nan)[keep] for column in indicators])
+        valid = ~np.isnan(values)
+        rows = {"Conteo": valid.astype(np.float64), "Suma": np.where(valid, values, 0), "Suma de cuadrados": np.where(valid, values ** 2, 0),
+                "Mínimo": values, "Máximo": values}
+
+        # CÓDIGO DE CELDA DE CADA FILA: PAÍS Y AÑO COMBINADOS EN UN ÚNICO ENTERO, ORDENADO POR PAÍS Y AÑO
+        cell_keys, cell_codes = np.unique(country_codes[keep] * len(years) + year_codes[keep], return_inverse=True)
+        cell_countries, cell_years = cell_keys // len(years), cell_keys % len(years)
+        cells = _reduce(rows, cell_codes, len(cell_keys))
+
+        countries = pd.Index(np.asarray(countries).astype(str), name="País")
+        years = pd.Index(np.asarray(years), name="Año")
+        cell_index = pd.MultiIndex.from_arrays([countries[cell_countries], years[cell_years]])
+        self.tables[dataset] = {
+            "país-año": _table(cells, cell_index, indicators),
+            "año": _table(_reduce(cells, cell_years, len(years)), years, indicators),
+            "país": _table(_reduce(cells, cell_countries, len(countries)), countries, indicators),
+            "total": _table(_reduce(cells, np.zeros(len(cell_keys), dtype=np.intp), 1), pd.RangeIndex(1), indicators)
+        }
+        return self
+
+    def series(self, dataset, indicator, statistic="Media", by="Año", country=None, year=None):
+        '''
+        Devuelve "statistic" del indicador como una Series indexada por "by" ("Año" o "País"). Con
+        by="Año" puede restringirse a un país ("country") y con by="País" a un año ("year"); por
+        ejemplo, series("life_expectancy", "Esperanza de vida al nacer") son las medias anuales de
+        todos los países y series(..., "Suma", by="País", year=2019) los totales de cada país en 2019.
+        '''
+
+        levels = self.tables[dataset]
+        if by == "Año":
+            return _statistic(levels["año"], indicator, statistic) if country is None else _cross_section(levels["país-año"], indicator, statistic, country, "País")
+        if by == "País":
+            return _statistic(levels["país"], indicator, statistic) if year is None else _cross_section(levels["país-año"], indicator, statistic, year, "Año")
+        raise ValueError(f"Nivel de agregación desconocido: {by}")
+
+    def value(self, dataset, indicator, statistic="Media", country=None, year=None):
+        '''
+        Devuelve "statistic" del indicador para un país y/o un año, o para el dataset completo si no se
+        indica ninguno de los dos. Si no hay datos para esa combinación, devuelve NaN.
+        '''
+
+        levels = self.tables[dataset]
+        if country is not None and year is not None:
+            row = levels["país-año"].reindex([(country, year)])
+        elif year is not None:
+            row = levels["año"].reindex([year])
+        elif country is not None:
+            row = levels["país"].reindex([country])
+        else:
+            row = levels["total"]
+        return _statistic(row, indicator, statistic).iloc[0]
+
+    def summary(self):
+        '''
+        Tabla con el tamaño de cada dataset en el cubo: indicadores y celdas de cada nivel.
+        '''
+
+        rows = []
+        for dataset, levels in self.tables.items():
+            row = {"dataset": dataset, "indicadores": len(levels["país-año"].columns.unique(level=0))}
+            row.update({f"celdas {level}": len(levels[level]) for level in LEVELS})
+            rows.append(row)
+        return pd.DataFrame(rows).set_index("dataset")
+
+
+def run_aggregate_cube(context, verbose=True):
+    '''
+    Etapa del pipeline que se ejecuta después del EDA (y de la optimización de tipos): construye el
+    AggregateCube de todos los datasets de context.processed y lo deja en context.aggregates para que
+    la estadística lo consulte. Con verbose=True imprime el tamaño de cada nivel del cubo.
+    '''
+
+    cube = AggregateCube()
+    for name, df in context.processed.items():
+        cube.add(name, df)
+    context.aggregates = cube
+
+    if verbose:
+        print(cube.summary())
+    return cube
+
+
+def _reduce(aggregates, codes, n_groups):
+    # REDUCE LOS AGREGADOS DE LAS FILAS (O CELDAS) DE CADA GRUPO: CONTEO, SUMA Y SUMA DE CUADRADOS SE
+    # SUMAN CON BINCOUNT Y EL MÍNIMO Y EL MÁXIMO SE ACUMULAN CON FMIN/FMAX, QUE IGNORAN LOS NULOS
+    reduced = {}
+    for name, values in aggregates.items():
+        result = np.full((n_groups, values.shape[1]), np.nan if name in ("Mínimo", "Máximo") else 0.0)
+        for j in range(values.shape[1]):
+            if name == "Mínimo":
+                np.fmin.at(result[:, j], codes, values[:, j])
+            elif name == "Máximo":
+                np.fmax.at(result[:, j], codes, values[:, j])
+            else:
+                result[:, j] = np.bincount(codes, weights=values[:, j], minlength=n_groups)
+        reduced[name] = result
+    return reduced
+
+
+def _table(aggregates, index, indicators):
+    # TABLA DE UN NIVEL: UNA FILA POR GRUPO Y UNA COLUMNA (INDICADOR, ESTADÍSTICA) POR CADA AGREGADO Y
+    # CADA ESTADÍSTICA DERIVADA. LA VARIANZA ES LA MUESTRAL (DDOF=1), COMO LA DE PANDAS
+    count, total, squares = aggregates["Conteo"], aggregates["Suma"], aggregates["Suma de cuadrados"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(count > 0, total / count, np.nan)
+        variance = np.where(count > 1, np.maximum(squares - total * mean, 0) / (count - 1), np.nan)
+    statistics = dict(aggregates, **{"Media": mean, "Varianza": variance, "Desviación estándar": np.sqrt(variance),
+                                     "Rango": aggregates["Máximo"] - aggregates["Mínimo"]})
+
+    columns = {}
+    for j, indicator in enumerate(indicators):
+        for statistic in AGGREGATES + DERIVED:
+            columns[(indicator, statistic)] = statistics[statistic][:, j]
+    return pd.DataFrame(columns, index=index)
+
+
+def _cross_section(table, indicator, statistic, key, level):
+    # SE TOMA PRIMERO LA COLUMNA Y LUEGO LAS CELDAS DEL PAÍS O DEL AÑO, PARA NO RECORTAR LA TABLA ENTERA
+    column = _statistic(table, indicator, statistic)
+    if key not in column.index.levels[column.index.names.index(level)]:
+        return column.iloc[:0].droplevel(level)
+    return column.xs(key, level=level)
+
+
+def _statistic(table, indicator, statistic):
+    if statistic not in AGGREGATES + DERIVED:
+        raise ValueError(f"Estadística desconocida: {statistic}")
+    return table[(indicator, statistic)].rename(indicator)
@@ -0,0 +1,142 @@
+import numpy as np
+import pandas as pd
+from regression import least_squares
+from process_pool import process_pool
+
+# CANTIDAD DE REMUESTRAS, NIVEL DE CONFIANZA DE LOS INTERVALOS Y SEMILLA BASE
+REPLICATES = 10_000
+CONFIDENCE = 0.95
+SEED = 2024
+
+# LAS REMUESTRAS SE GENERAN EN BLOQUES DE CHUNK_SIZE, CADA UNO CON SU PROPIA SEMILLA DERIVADA DE LA BASE
+# (np.random.SeedSequence.spawn). LOS BLOQUES NO DEPENDEN DE LA CANTIDAD DE PROCESOS, DE MODO QUE LOS
+# INTERVALOS SON LOS MISMOS EN SERIE Y CON CUALQUIER CANTIDAD DE PROCESOS
+CHUNK_SIZE = 1_000
+
+
+# ---------------------- ESTADÍSTICOS POR LOTES ----------------------
+# CADA ESTADÍSTICO RECIBE UN LOTE DE MUESTRAS DE FORMA (..., n, columnas) Y DEVUELVE EL ESTADÍSTICO DE
+# CADA MUESTRA, SIN RECORRERLAS CON UN BUCLE DE PYTHON
+
+def regression_statistics(samples):
+    '''
+    Ordenada al origen, pendiente y R² de la regresión lineal por mínimos cuadrados de la segunda
+    columna sobre la primera, para cada muestra del lote, con el mismo ajuste en forma cerrada que
+    regression.py. Devuelve un array de forma (..., 3).
+    '''
+
+    return np.stack(least_squares(samples[..., 0], samples[..., 1]), axis=-1)
+
+
+def correlation_statistics(samples):
+    '''
+    Matriz de correlación de Pearson entre las columnas de cada muestra del lote. Devuelve un array de
+    forma (..., columnas, columnas).
+    '''
+
+    centered = samples - samples.mean(axis=-2, keepdims=True)
+    covariance = np.swapaxes(centered, -1, -2) @ centered
+    scale = np.sqrt(np.diagonal(covariance, axis1=-2, axis2=-1))
+    return covariance / (scale[..., :, None] * scale[..., None, :])
+
+
+# ---------------------- INTERVALOS DE CONFIANZA ----------------------
+
+def bootstrap_intervals(statistic, data, replicates=REPLICATES, confidence=CONFIDENCE, seed=SEED):
+    '''
+    Intervalos de confianza bootstrap de "statistic" (una función por lotes, como
+    regression_statistics) sobre las filas de "data" (array de forma (n, columnas)).
+    Las "replicates" remuestras con reposición se sortean como una única matriz de índices por bloque
+    y el estadístico de todas las remuestras de un bloque se calcula en una sola operación; los
+    bloques se reparten en el pool compartido de process_pool.py, si está activo. Devuelve un dict con la
+    estimación sobre los datos originales ("estimate") y los extremos de los intervalos percentil
+    ("percentile") y BCa ("bca"), como pares (inferior, superior) de arrays de la forma del estadístico.
+    '''
+
+    data = np.asarray(data, dtype=np.float64)
+    estimate = statistic(data)
+    sizes = [min(CHUNK_SIZE, replicates - start) for start in range(0, replicates, CHUNK_SIZE)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    arguments = ([statistic] * len(sizes), [data] * len(sizes), sizes, seeds)
+    pool = process_pool()
+    chunks = list(pool.map(_bootstrap_chunk, *arguments) if pool is not None else map(_bootstrap_chunk, *arguments))
+    replicated = np.sort(np.concatenate(chunks), axis=0)
+
+    alpha = (1 - confidence) / 2
+    probabilities = np.full(estimate.shape, alpha), np.full(estimate.shape, 1 - alpha)
+    return {"estimate": estimate,
+            "percentile": tuple(_quantiles(replicated, p) for p in probabilities),
+            "bca": tuple(_quantiles(replicated, p) for p in _bca_probabilities(statistic, data, estimate, replicated, alpha))}
+
+
+def regression_intervals(df, x_col, y_col, **kwargs):
+    '''
+    Intervalos bootstrap de la pendiente, la ordenada al origen y el R² de la regresión lineal de
+    y_col sobre x_col, en el formato de las secciones de context.results (ver results.py).
+    '''
+
+    intervals = bootstrap_intervals(regression_statistics, df[[x_col, y_col]].to_numpy(dtype=np.float64), **kwargs)
+    values = {"réplicas": kwargs.get("replicates", REPLICATES), "confianza": kwargs.get("confidence", CONFIDENCE)}
+    for position, name in enumerate(["ordenada al origen", "pendiente", "R²"]):
+        values[name] = {method: [float(low[position]), float(high[position])] for method, (low, high) in
+                        (("percentil", intervals["percentile"]), ("BCa", intervals["bca"]))}
+    return values
+
+
+def correlation_intervals(df, **kwargs):
+    '''
+    Intervalos bootstrap de cada coeficiente de la matriz de correlación de Pearson entre las columnas
+    de df (como df.corr(), sin nulos), en el formato de las secciones de context.results: para cada
+    método, una matriz con el extremo inferior y otra con el superior.
+    '''
+
+    intervals = bootstrap_intervals(correlation_statistics, df.to_numpy(dtype=np.float64), **kwargs)
+    values = {"réplicas": kwargs.get("replicates", REPLICATES), "confianza": kwargs.get("confidence", CONFIDENCE)}
+    for method, key in (("percentil", "percentile"), ("BCa", "bca")):
+        low, high = intervals[key]
+        values[method] = {"inferior": pd.DataFrame(low, index=df.columns, columns=df.columns),
+                          "superior": pd.DataFrame(high, index=df.columns, columns=df.columns)}
+    return values
+
+
+def _bootstrap_chunk(statistic, data, size, seed):
+    # UN BLOQUE DE REMUESTRAS: LA MATRIZ DE ÍNDICES (size x n) INDEXA LOS DATOS DE UNA VEZ
+    indices = np.random.default_rng(seed).integers(0, len(data), size=(size, len(data)))
+    return statistic(data[indices])
+
+
+def _bca_probabilities(statistic, data, estimate, replicated, alpha):
+    # CORRECCIÓN DE SESGO (z0) Y ACELERACIÓN (a, POR JACKKNIFE) DEL INTERVALO BCa. LAS n MUESTRAS
+    # JACKKNIFE (SIN UNA FILA CADA UNA) TAMBIÉN SE CALCULAN COMO UN SOLO LOTE
+    from scipy.special import ndtr, ndtri
+
+    n = len(data)
+    below = (replicated < estimate).mean(axis=0) + 0.5 * (replicated == estimate).mean(axis=0)
+    bias = ndtri(below)
+
+    positions = np.arange(n - 1)[None, :]
+    leave_one_out = positions + (positions >= np.arange(n)[:, None])
+    jackknife = statistic(data[leave_one_out])
+    deviations = jackknife.mean(axis=0) - jackknife
+    denominator = 6 * ((deviations ** 2).sum(axis=0)) ** 1.5
+    with np.errstate(divide="ignore", invalid="ignore"):
+        acceleration = np.where(denominator > 0, (deviations ** 3).sum(axis=0) / denominator, 0.0)
+
+    probabilities = []
+    for z in (ndtri(alpha), ndtri(1 - alpha)):
+        # SI TODAS LAS RÉPLICAS SON IGUALES A LA ESTIMACIÓN (POR EJEMPLO, LA DIAGONAL DE UNA MATRIZ DE
+        # CORRELACIÓN), z0 ES 0 Y EL INTERVALO SE REDUCE A ESE VALOR
+        probability = ndtr(bias + (bias + z) / (1 - acceleration * (bias + z)))
+        probabilities.append(np.where(np.isnan(probability), 0.5, probability))
+    return probabilities
+
+
+def _quantiles(replicated, probabilities):
+    # CUANTIL (CON INTERPOLACIÓN LINEAL, COMO np.quantile) DE CADA ELEMENTO DEL ESTADÍSTICO A SU PROPIA
+    # PROBABILIDAD, SOBRE LAS RÉPLICAS YA ORDENADAS A LO LARGO DEL PRIMER EJE
+    position = (len(replicated) - 1) * probabilities
+    low = np.floor(position).astype(np.intp)
+    high = np.minimum(low + 1, len(replicated) - 1)
+    low_values = np.take_along_axis(replicated, low[None, ...], axis=0)[0]
+    high_values = np.take_along_axis(replicated, high[None, ...], axis=0)[0]
+    return low_values + (high_values - low_values) * (position - low)
@@ -0,0 +1,164 @@
+import numpy as np
+import pandas as pd
+
+# MÉTODOS DE CORRELACIÓN DISPONIBLES
+METHODS = ["pearson", "spearman"]
+
+# UN PAR SIN VARIACIÓN EN SUS FILAS COMUNES TIENE UNA SUMA DE CUADRADOS (DE VALORES ESTANDARIZADOS)
+# DE ORDEN 1e-16 POR FILA POR REDONDEO; POR DEBAJO DE ESTA TOLERANCIA POR FILA SE CONSIDERA NULA
+VARIANCE_TOLERANCE = 1e-12
+
+# COLUMNAS DEL PANEL PAÍS-AÑO QUE NO SON INDICADORES
+ID_COLUMNS = ["País", "Año"]
+
+
+def pairwise_correlation(df, method="pearson", min_periods=1):
+    '''
+    Matriz de correlación entre todas las columnas numéricas de df, cada par sobre las filas en las
+    que ambas columnas tienen dato (como df.corr(), que ignora los nulos par a par). Los pares con
+    menos de "min_periods" filas en común (o sin variación) quedan en NaN.
+    - Pearson: en lugar de recorrer los pares, las sumas de todos los pares se obtienen a la vez como
+      productos de matrices enmascaradas (ver _masked_pearson), de modo que cientos de columnas y
+      decenas de miles de filas se resuelven en una fracción de segundo.
+    - Spearman: los rangos de cada par se calculan sobre sus filas comunes, como en
+      df.corr(method="spearman"). Las columnas con el mismo patrón de nulos comparten las filas
+      comunes con cualquier otra columna, de modo que se agrupan por patrón: cada columna se ordena
+      una única vez y, para cada par de patrones, los rangos de todas sus columnas sobre las filas
+      comunes salen de ese orden en tiempo lineal y sus correlaciones, de un producto de matrices
+      (ver _masked_spearman). El costo crece con los pares de patrones distintos: con pocos patrones
+      (como en el panel país-año) es una fracción de segundo, pero si cada columna tiene el suyo
+      sigue habiendo un ranking por par, y cientos de columnas tardan decenas de segundos.
+    '''
+
+    if method not in METHODS:
+        raise ValueError(f"Método de correlación desconocido: {method} (opciones: {', '.join(METHODS)})")
+    numeric = df.select_dtypes("number")
+
+    values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+    mask = ~np.isnan(values)
+    if method == "spearman":
+        correlation = _masked_spearman(values, mask)
+        weights = mask.astype(np.float64)
+        counts = weights.T @ weights
+    else:
+        correlation, counts = _masked_pearson(values, mask)
+    correlation[counts < min_periods] = np.nan
+    return pd.DataFrame(correlation, index=numeric.columns, columns=numeric.columns)
+
+
+def pairwise_counts(df):
+    '''
+    Cantidad de filas en las que cada par de columnas numéricas de df tiene dato en ambas.
+    '''
+
+    numeric = df.select_dtypes("number")
+    mask = numeric.notna().to_numpy(dtype=np.float64)
+    return pd.DataFrame((mask.T @ mask).astype(np.int64), index=numeric.columns, columns=numeric.columns)
+
+
+def panel_correlations(panel, min_periods=1):
+    '''
+    Correlaciones de Pearson y de Spearman, par a par, entre todos los indicadores del panel país-año
+    (ver panel.py), más la cantidad de (país, año) con dato en cada par.
+    '''
+
+    indicators = panel.drop(columns=ID_COLUMNS, errors="ignore")
+    correlations = {method: pairwise_correlation(indicators, method, min_periods) for method in METHODS}
+    correlations["observaciones"] = pairwise_counts(indicators)
+    return correlations
+
+
+def _masked_pearson(values, mask):
+    # CADA COLUMNA SE ESTANDARIZA CON SUS VALORES NO NULOS (PARA QUE LAS SUMAS DE CUADRADOS NO PIERDAN
+    # PRECISIÓN) Y LOS NULOS PASAN A 0. ASÍ, CON M LA MÁSCARA Y Z LOS VALORES, PARA CADA PAR (i, j):
+    #   n[i, j] = Σ M_i M_j, sx[i, j] = Σ Z_i M_j, sxx[i, j] = Σ Z_i² M_j, sxy[i, j] = Σ Z_i Z_j
+    # SON PRODUCTOS DE MATRICES, Y LA CORRELACIÓN SOBRE LAS FILAS COMUNES SALE DE ESAS SUMAS
+    weights = mask.astype(np.float64)
+    observed = np.maximum(weights.sum(axis=0), 1)
+    mean = np.where(mask, values, 0.0).sum(axis=0) / observed
+    centered = np.where(mask, values - mean, 0.0)
+    scale = np.sqrt((centered * centered).sum(axis=0) / observed)
+    z = centered / np.where(scale > 0, scale, 1.0)
+
+    counts = weights.T @ weights
+    sx = z.T @ weights
+    sxx = (z * z).T @ weights
+    sxy = z.T @ z
+    with np.errstate(invalid="ignore", divide="ignore"):
+        covariance = sxy - sx * sx.T / counts
+        variance = sxx - sx * sx / counts
+        correlation = covariance / np.sqrt(variance * variance.T)
+    # LAS VARIANZAS NULAS (O APENAS DISTINTAS DE CERO POR REDONDEO) DAN NaN, COMO EN df.corr()
+    constant = variance <= VARIANCE_TOLERANCE * counts
+    correlation[constant | constant.T] = np.nan
+    return np.clip(correlation, -1, 1), counts
+
+
+def _masked_spearman(values, mask):
+    # LAS COLUMNAS SE AGRUPAN POR PATRÓN DE NULOS. DOS COLUMNAS DE LOS PATRONES a Y b TIENEN DATO EN
+    # COMÚN EN LAS FILAS a & b, LAS MISMAS PARA TODAS LAS COLUMNAS DE AMBOS GRUPOS: SUS RANGOS SOBRE ESAS
+    # FILAS SE CALCULAN UNA VEZ POR PAR DE PATRONES Y NO UNA VEZ POR PAR DE COLUMNAS
+    n_columns = values.shape[1]
+    # (CADA PATRÓN SE IDENTIFICA POR SUS BYTES EMPAQUETADOS, MÁS RÁPIDO QUE np.unique(axis=0))
+    keys = {}
+    for column, packed in enumerate(np.packbits(mask, axis=0).T):
+        keys.setdefault(packed.tobytes(), []).append(column)
+    groups = [np.array(columns) for columns in keys.values()]
+    patterns = [mask[:, columns[0]] for columns in groups]
+
+    # ORDEN DE LAS FILAS CON DATO DE CADA COLUMNA, DE MENOR A MAYOR VALOR (UNA COLUMNA POR COLUMNA DEL GRUPO)
+    orders = []
+    for pattern, columns in zip(patterns, groups):
+        rows = np.flatnonzero(pattern)
+        orders.append(rows[np.argsort(values[np.ix_(rows, columns)], axis=0, kind="stable")])
+
+    correlation = np.full((n_columns, n_columns), np.nan)
+    for a in range(len(patterns)):
+        for b in range(a, len(patterns)):
+            common = patterns[a] & patterns[b]
+            if common.sum() < 2:
+                continue
+            ranks_a = _subset_ranks(values, orders[a], groups[a], common)
+            ranks_b = ranks_a if a == b else _subset_ranks(values, orders[b], groups[b], common)
+            block = _rank_correlation(ranks_a, ranks_b)
+            correlation[np.ix_(groups[a], groups[b])] = block
+            correlation[np.ix_(groups[b], groups[a])] = block.T
+
+    # LA DIAGONAL ES 1 SALVO EN LAS COLUMNAS SIN VARIACIÓN, COMO EN df.corr()
+    diagonal = np.diag(correlation).copy()
+    np.fill_diagonal(correlation, np.where(np.isnan(diagonal), np.nan, 1.0))
+    return correlation
+
+
+def _subset_ranks(values, order, columns, common):
+    # RANGOS PROMEDIO (COMO rank(method="average")) DE "columns" ENTRE LAS FILAS "common", A PARTIR DE SU
+    # ORDEN YA CALCULADO: SE CONSERVAN, EN ORDEN, LAS FILAS COMUNES (TODAS LAS COLUMNAS DEL GRUPO CONSERVAN
+    # LAS MISMAS m) Y CADA TRAMO DE VALORES IGUALES TOMA EL PROMEDIO DE SUS POSICIONES. DEVUELVE UNA MATRIZ
+    # m x columnas CON LAS FILAS COMUNES EN SU ORDEN ORIGINAL
+    m = int(common.sum())
+    rows = order.T[common[order].T].reshape(len(columns), m).T
+    ordered = values[rows, columns]
+
+    positions = np.broadcast_to(np.arange(m)[:, None], ordered.shape)
+    starts = np.ones(ordered.shape, dtype=bool)
+    starts[1:] = ordered[1:] != ordered[:-1]
+    ends = np.ones(ordered.shape, dtype=bool)
+    ends[:-1] = starts[1:]
+    first = np.maximum.accumulate(np.where(starts, positions, 0), axis=0)
+    last = np.minimum.accumulate(np.where(ends, positions, m)[::-1], axis=0)[::-1]
+
+    ranks = np.empty(ordered.shape)
+    ranks[(np.cumsum(common) - 1)[rows], np.arange(len(columns))] = (first + last) / 2 + 1
+    return ranks
+
+
+def _rank_correlation(ranks_a, ranks_b):
+    # CORRELACIÓN DE PEARSON ENTRE CADA COLUMNA DE RANGOS DE ranks_a Y CADA UNA DE ranks_b, SIN NULOS. LOS
+    # RANGOS PROMEDIO DE m FILAS SIEMPRE TIENEN MEDIA (m + 1) / 2; UNA COLUMNA CONSTANTE TIENE VARIANZA 0
+    center = (len(ranks_a) + 1) / 2
+    a, b = ranks_a - center, ranks_b - center
+    variance_a, variance_b = (a * a).sum(axis=0), (b * b).sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        correlation = (a.T @ b) / np.sqrt(np.outer(variance_a, variance_b))
+    correlation[(variance_a == 0)[:, None] | (variance_b == 0)[None, :]] = np.nan
+    return np.clip(correlation, -1, 1)
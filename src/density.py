@@ -0,0 +1,103 @@
+import numpy as np
+
+# PARÁMETROS DEL KDE, LOS MISMOS QUE USA sns.kdeplot POR DEFECTO: LA CURVA SE EVALÚA EN GRIDSIZE PUNTOS
+# ENTRE EL MÍNIMO Y EL MÁXIMO EXTENDIDOS EN CUT ANCHOS DE BANDA (REGLA DE SCOTT)
+GRIDSIZE = 200
+CUT = 3
+
+# LA GRILLA FINA SOBRE LA QUE SE AGRUPAN LOS DATOS PARA EL KDE POR FFT TIENE AL MENOS OVERSAMPLING PUNTOS
+# POR CADA PUNTO DE LA CURVA Y AL MENOS STEPS_PER_BANDWIDTH PUNTOS POR ANCHO DE BANDA (PARA DATOS CON COLAS
+# LARGAS, EN LOS QUE EL ANCHO DE BANDA ES CHICO RESPECTO DEL RANGO), SIN PASAR DE MAX_FINE_SIZE PUNTOS
+OVERSAMPLING = 10
+STEPS_PER_BANDWIDTH = 8
+MAX_FINE_SIZE = 2 ** 20
+
+# LOS BIGOTES DEL BOXPLOT LLEGAN HASTA EL ÚLTIMO DATO A MENOS DE WHIS RANGOS INTERCUARTÍLICOS DE LA CAJA
+WHIS = 1.5
+
+
+def distribution_arrays(values, bins=30, gridsize=GRIDSIZE, cut=CUT):
+    '''
+    Calcula de una sola vez los tres paneles del gráfico de distribución de "values" (ver
+    draw_distribution en figure_render.py), ignorando los nulos:
+
+    - "edges" y "counts": bordes y conteos del histograma de "bins" intervalos iguales entre el mínimo
+      y el máximo (los mismos que np.histogram).
+    - "box": estadísticas del boxplot (cuartiles, bigotes y valores atípicos) en el formato de
+      matplotlib.cbook.boxplot_stats, que recibe Axes.bxp.
+    - "support" y "density": el KDE gaussiano (ancho de banda de Scott) evaluado en "gridsize" puntos,
+      o None si hay menos de dos valores distintos.
+
+    Los valores se ordenan una única vez: los conteos del histograma, los cuartiles y los bigotes son
+    búsquedas binarias sobre el array ordenado. El KDE no evalúa el núcleo en cada par (valor, punto
+    de la curva), sino que agrupa los valores en una grilla fina (agrupamiento lineal) y la convoluciona
+    con el núcleo mediante la FFT, en O(n + grilla · log grilla) en lugar de O(n · grilla).
+    '''
+
+    values = np.asarray(values, dtype=np.float64)
+    unsorted = values[~np.isnan(values)]
+    values = np.sort(unsorted)
+    n = len(values)
+
+    # HISTOGRAMA: LOS BORDES SÓLO DEPENDEN DEL MÍNIMO Y EL MÁXIMO; CADA INTERVALO ES [a, b), SALVO EL
+    # ÚLTIMO, QUE INCLUYE EL MÁXIMO
+    edges = np.histogram_bin_edges(values[[0, -1]] if n else values, bins=bins)
+    starts = np.searchsorted(values, edges[:-1], side="left")
+    counts = np.diff(np.append(starts, n)).astype(np.float64)
+
+    arrays = {"edges": edges, "counts": counts, "box": _box_stats(values, unsorted), "support": None, "density": None}
+    if n > 1 and values[0] != values[-1]:
+        arrays["support"], arrays["density"] = _binned_kde(values, gridsize, cut)
+    return arrays
+
+
+def _box_stats(values, unsorted):
+    # CUARTILES CON INTERPOLACIÓN LINEAL (COMO np.percentile) SOBRE LOS VALORES YA ORDENADOS. LOS VALORES
+    # ATÍPICOS VAN EN EL ORDEN DE boxplot_stats (LOS BAJOS Y LUEGO LOS ALTOS, CADA GRUPO EN EL ORDEN
+    # ORIGINAL), QUE ES EL ORDEN EN QUE SE DIBUJAN SUS MARCADORES
+    n = len(values)
+    if n == 0:
+        return {"med": np.nan, "q1": np.nan, "q3": np.nan, "whislo": np.nan, "whishi": np.nan, "fliers": np.empty(0), "mean": np.nan}
+
+    def quantile(q):
+        position = (n - 1) * q
+        low = int(np.floor(position))
+        high = min(low + 1, n - 1)
+        return values[low] + (values[high] - values[low]) * (position - low)
+
+    q1, median, q3 = quantile(0.25), quantile(0.5), quantile(0.75)
+    iqr = q3 - q1
+    low = np.searchsorted(values, q1 - WHIS * iqr, side="left")
+    high = np.searchsorted(values, q3 + WHIS * iqr, side="right")
+    # SI NINGÚN DATO QUEDA DENTRO DE LOS LÍMITES DE UN LADO, EL BIGOTE SE QUEDA EN EL CUARTIL
+    whislo = min(values[low], q1) if low < n else q1
+    whishi = max(values[high - 1], q3) if high > 0 else q3
+    fliers = np.concatenate([unsorted[unsorted < whislo], unsorted[unsorted > whishi]]) if low > 0 or high < n else np.empty(0)
+    return {"med": median, "q1": q1, "q3": q3, "whislo": whislo, "whishi": whishi, "fliers": fliers, "mean": values.mean()}
+
+
+def _binned_kde(values, gridsize, cut):
+    # ANCHO DE BANDA DE SCOTT: DESVIACIÓN ESTÁNDAR MUESTRAL * n^(-1/5), COMO scipy.stats.gaussian_kde
+    n = len(values)
+    bandwidth = values.std(ddof=1) * n ** (-1 / 5)
+    support = np.linspace(values[0] - cut * bandwidth, values[-1] + cut * bandwidth, gridsize)
+
+    # LA CURVA SE TOMA DE UNO DE CADA "oversampling" PUNTOS DE LA GRILLA FINA
+    oversampling = max(OVERSAMPLING, int(np.ceil(STEPS_PER_BANDWIDTH * (support[1] - support[0]) / bandwidth)))
+    oversampling = min(oversampling, (MAX_FINE_SIZE - 1) // (gridsize - 1))
+    fine_size = (gridsize - 1) * oversampling + 1
+
+    # AGRUPAMIENTO LINEAL: CADA VALOR REPARTE SU PESO ENTRE LOS DOS PUNTOS VECINOS DE LA GRILLA FINA
+    step = (support[-1] - support[0]) / (fine_size - 1)
+    position = (values - support[0]) / step
+    left = np.minimum(np.floor(position).astype(np.intp), fine_size - 2)
+    weight = position - left
+    grid = np.bincount(left, weights=1 - weight, minlength=fine_size) + np.bincount(left + 1, weights=weight, minlength=fine_size)
+
+    # NÚCLEO GAUSSIANO MUESTREADO EN LA GRILLA FINA, A TODA DISTANCIA POSIBLE ENTRE DOS PUNTOS DEL SOPORTE,
+    # Y CONVOLUCIÓN POR FFT, CON RELLENO DE CEROS PARA QUE NO HAYA CONVOLUCIÓN CIRCULAR
+    offsets = np.arange(-(fine_size - 1), fine_size) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (np.sqrt(2 * np.pi) * bandwidth * n)
+    size = 1 << int(np.ceil(np.log2(len(grid) + len(kernel) - 1)))
+    density = np.fft.irfft(np.fft.rfft(grid, size) * np.fft.rfft(kernel, size), size)[fine_size - 1:2 * fine_size - 1]
+    return support, np.maximum(density[::oversampling], 0)
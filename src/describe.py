@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+from dtype_optimizer import to_float64
+
+# ESTADÍSTICAS QUE CALCULA describe(), EN EL ORDEN EN QUE SE IMPRIMEN
+STATISTICS = ["Media", "Mediana", "Moda", "Desviación estándar", "Varianza", "Mínimo", "Máximo", "Rango",
+              "Percentil 25", "Percentil 50", "Percentil 75"]
+
+
+def describe(data, by=None, group_name="Grupo"):
+    '''
+    Calcula las once estadísticas de STATISTICS para cada columna numérica de "data" (un DataFrame o
+    una Series) y, si se indica "by" (etiquetas alineadas con las filas), para cada grupo. Devuelve
+    una tabla ordenada con una fila por variable (o por grupo y variable) y una columna por
+    estadística. Los nulos se ignoran, como en pandas; la moda es la menor de las más frecuentes,
+    como mode().iloc[0], y los percentiles usan interpolación lineal, como quantile().
+    '''
+
+    frame = data.to_frame() if isinstance(data, pd.Series) else data
+    if by is None:
+        return describe_slices({None: frame}).droplevel(0)
+
+    codes, groups = pd.factorize(pd.Series(by, index=frame.index), sort=False)
+    slices = {group: frame[codes == i] for i, group in enumerate(groups)}
+    table = describe_slices(slices)
+    table.index = table.index.set_names([group_name, "Variable"])
+    return table
+
+
+def describe_slices(slices):
+    '''
+    Igual que describe(), pero para varios recortes con nombre (por ejemplo {"Global 2019": ...,
+    "España": ...}) que pueden solaparse o tener distintas columnas. Todos los recortes y todas sus
+    columnas se resuelven en una sola pasada: se apilan en formato largo (recorte, variable, valor) y
+    se ordenan una única vez, de modo que cada par (recorte, variable) queda en un tramo contiguo y
+    ordenado del que salen a la vez la mediana, los percentiles, la moda, el mínimo y el máximo.
+    Las columnas float32 de optimize_dtypes() se pasan a float64 con to_float64(), redondeadas a sus
+    decimales, de modo que las estadísticas son las mismas que con los valores originales.
+    '''
+
+    labels, values, codes = [], [], []
+    for name, data in slices.items():
+        frame = data.to_frame() if isinstance(data, pd.Series) else data
+        for column in frame.columns:
+            if not pd.api.types.is_numeric_dtype(frame[column]):
+                continue
+            column_values = to_float64(frame[column])
+            codes.append(np.full(len(column_values), len(labels)))
+            values.append(column_values)
+            labels.append((name, column))
+
+    values = np.concatenate(values) if values else np.empty(0)
+    codes = np.concatenate(codes) if codes else np.empty(0, dtype=np.intp)
+    result = _describe_long(values, codes, len(labels))
+
+    index = pd.MultiIndex.from_tuples(labels, names=["Recorte", "Variable"])
+    return pd.DataFrame(result, index=index, columns=STATISTICS)
+
+
+def print_description(table, decimals=2):
+    '''
+    Imprime la tabla de describe() o describe_slices(): un bloque por variable (o por recorte y
+    variable) con una línea por estadística.
+    '''
+
+    for key, row in table.iterrows():
+        if isinstance(key, tuple) and key[0] is not None:
+            print(f"\nEstadísticas descriptivas de '{key[1]}' ({key[0]}):")
+        else:
+            print(f"\nEstadísticas descriptivas de '{key[1] if isinstance(key, tuple) else key}':")
+        for statistic, value in row.items():
+            print(f"{statistic}: {value:.{decimals}f}")
+
+
+def _describe_long(values, codes, n_groups):
+    '''
+    Núcleo vectorizado: "values" son todos los valores y "codes" el grupo (par recorte-variable) de
+    cada uno. Devuelve un array de n_groups x len(STATISTICS).
+    '''
+
+    valid = ~np.isnan(values)
+    values, codes = values[valid], codes[valid]
+
+    # UN ÚNICO ORDENAMIENTO: POR GRUPO Y, DENTRO DE CADA GRUPO, POR VALOR
+    order = np.lexsort((values, codes))
+    values, codes = values[order], codes[order]
+
+    counts = np.bincount(codes, minlength=n_groups)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype(np.intp)
+    empty = counts == 0
+    last = np.where(empty, 0, starts + counts - 1)
+    first = np.where(empty, 0, starts)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.bincount(codes, weights=values, minlength=n_groups) / counts
+        var = np.bincount(codes, weights=(values - mean[codes]) ** 2, minlength=n_groups) / (counts - 1)
+
+    def take(positions):
+        return np.where(empty, np.nan, values[positions] if len(values) else np.nan)
+
+    def quantile(q):
+        # INTERPOLACIÓN LINEAL ENTRE LOS DOS VALORES VECINOS, CON LA MISMA FÓRMULA QUE NUMPY
+        position = np.maximum(counts - 1, 0) * q
+        low = np.floor(position).astype(np.intp)
+        high = np.minimum(low + 1, np.maximum(counts - 1, 0))
+        t = position - low
+        a, b = take(starts + low), take(starts + high)
+        return np.where(t >= 0.5, b - (b - a) * (1 - t), a + (b - a) * t)
+
+    minimum, maximum = take(first), take(last)
+
+    # MODA: TRAMOS DE VALORES IGUALES CONSECUTIVOS; EN CADA GRUPO, EL TRAMO MÁS LARGO Y, ENTRE LOS MÁS
+    # LARGOS, EL PRIMERO (EL DE MENOR VALOR)
+    mode = np.full(n_groups, np.nan)
+    if len(values):
+        run_starts = np.flatnonzero(np.concatenate([[True], (values[1:] != values[:-1]) | (codes[1:] != codes[:-1])]))
+        run_lengths = np.diff(np.append(run_starts, len(values)))
+        run_codes = codes[run_starts]
+        best = np.lexsort((run_starts, -run_lengths, run_codes))
+        groups, first_run = np.unique(run_codes[best], return_index=True)
+        mode[groups] = values[run_starts[best[first_run]]]
+
+    return np.column_stack([
+        mean, quantile(0.5), mode, np.sqrt(var), var, minimum, maximum, maximum - minimum,
+        quantile(0.25), quantile(0.5), quantile(0.75)
+    ])
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+
+# MÁXIMA CANTIDAD DE DECIMALES CON LA QUE SE BUSCA LA PRECISIÓN DE UNA COLUMNA DECIMAL. FLOAT32 GUARDA
+# UNOS 7 DÍGITOS SIGNIFICATIVOS, DE MODO QUE UNA COLUMNA CON MÁS DECIMALES QUEDA EN FLOAT64
+FLOAT32_MAX_DECIMALS = 7
+
+# UNA COLUMNA DE TEXTO SE CONVIERTE A CATEGÓRICA SI SUS VALORES DISTINTOS NO SUPERAN ESTA FRACCIÓN DE LAS FILAS
+CATEGORY_MAX_RATIO = 0.5
+
+
+def optimize_dtypes(df, max_decimals=FLOAT32_MAX_DECIMALS):
+    '''
+    Devuelve una copia de df con tipos de datos más compactos, elegidos columna por columna:
+    - Texto con muchos valores repetidos (País, Causa de muerte) -> category.
+    - Enteros (Año) -> el entero más chico en el que entran todos sus valores (int16 para los años).
+    - Decimales -> float32, sólo si la columna no pierde precisión: se busca la menor cantidad de
+      decimales d (hasta "max_decimals") con la que están escritos todos sus valores y, al pasar cada
+      valor a float32 y volver a float64, redondear a d decimales debe devolver exactamente el valor
+      original. Si no, la columna queda en float64.
+    Los decimales de cada columna que pasa a float32 quedan en attrs["decimals"] del resultado (pandas
+    los conserva en sus columnas y recortes), para volver a float64 sin error con to_float64().
+    '''
+
+    columns, decimals = {}, {}
+    for column in df.columns:
+        columns[column], places = _optimize_column(df[column], max_decimals)
+        if places is not None:
+            decimals[column] = places
+    optimized = pd.DataFrame(columns, index=df.index)
+    optimized.attrs["decimals"] = decimals
+    return optimized
+
+
+def to_float64(values):
+    '''
+    Devuelve los valores de una Series como array float64, con los nulos como NaN. Si la Series es
+    float32 y optimize_dtypes() registró los decimales de su columna, cada valor se redondea a esos
+    decimales: así se recupera exactamente el valor float64 original, en lugar de arrastrar el error
+    de representación de float32 a las estadísticas.
+    '''
+
+    array = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    decimals = values.attrs.get("decimals", {}).get(values.name)
+    if values.dtype == np.float32 and decimals is not None:
+        array = np.round(array, decimals)
+    return array
+
+
+def _optimize_column(values, max_decimals):
+    # DEVUELVE LA COLUMNA OPTIMIZADA Y, SI PASÓ A FLOAT32, LOS DECIMALES CON LOS QUE ESTÁ ESCRITA
+    dtype = values.dtype
+
+    if pd.api.types.is_string_dtype(dtype) or dtype == object:
+        if len(values) and values.nunique(dropna=False) <= CATEGORY_MAX_RATIO * len(values):
+            return values.astype("category"), None
+        return values, None
+
+    if pd.api.types.is_integer_dtype(dtype) and not isinstance(dtype, pd.api.extensions.ExtensionDtype):
+        return pd.to_numeric(values, downcast="integer"), None
+
+    if dtype == np.float64:
+        original = values.to_numpy()
+        rounded = original.astype(np.float32)
+        finite = np.isfinite(original)
+        if not np.array_equal(finite, np.isfinite(rounded)):
+            # ALGÚN VALOR SE SALE DEL RANGO DE FLOAT32
+            return values, None
+        # PRECISIÓN DE LA COLUMNA: LOS DECIMALES CON LOS QUE VIENE ESCRITA (POR EJEMPLO, EN EL CSV)
+        exact = original[finite]
+        decimals = next((d for d in range(max_decimals + 1) if np.array_equal(np.round(exact, d), exact)), None)
+        if decimals is not None and np.array_equal(np.round(rounded[finite].astype(np.float64), decimals), exact):
+            return pd.Series(rounded, index=values.index, name=values.name), decimals
+
+    return values, None
+
+
+def memory_report(before, after):
+    '''
+    Compara la memoria (en bytes, con memory_usage(deep=True), que incluye el texto de las columnas de
+    tipo object/str) de dos diccionarios de DataFrames con las mismas claves y devuelve una tabla con
+    una fila por dataset y una fila final con el total.
+    '''
+
+    rows = []
+    for name in before:
+        rows.append({
+            "dataset": name,
+            "antes (MB)": before[name].memory_usage(deep=True).sum() / 2**20,
+            "después (MB)": after[name].memory_usage(deep=True).sum() / 2**20
+        })
+    report = pd.DataFrame(rows).set_index("dataset")
+    report.loc["total"] = report.sum()
+    report["reducción (%)"] = 100 * (1 - report["después (MB)"] / report["antes (MB)"])
+    return report.round(2)
+
+
+def run_dtype_optimizer(context, max_decimals=FLOAT32_MAX_DECIMALS, verbose=True):
+    '''
+    Etapa del pipeline que se ejecuta después del EDA: reemplaza cada dataset limpio de
+    context.processed por su versión con tipos compactos (ver optimize_dtypes()), de modo que el
+    análisis estadístico, y cualquier notebook que use el contexto, trabajen con menos memoria. Los
+    CSV de data/processed no cambian. Con verbose=True imprime la memoria antes y después de cada
+    dataset y cuántas columnas quedaron de cada tipo.
+    Devuelve la tabla de memory_report().
+    '''
+
+    before = dict(context.processed)
+    for name, df in before.items():
+        context.processed[name] = optimize_dtypes(df, max_decimals=max_decimals)
+
+    report = memory_report(before, context.processed)
+    if verbose:
+        print("\n Memoria de los datasets procesados (memory_usage(deep=True)):")
+        print(report)
+        for name, df in context.processed.items():
+            dtypes = df.dtypes.astype(str).value_counts(sort=False)
+            print(f"→ {name}: " + ", ".join(f"{count} {dtype}" for dtype, count in dtypes.items()))
+    return report
@@ -1,27 +1,117 @@
-def load_data():
+# ESQUEMAS DE LECTURA DE CADA CSV CRUDO: COLUMNAS QUE SE USAN EN EL EDA (EL RESTO NO SE PARSEA), SUS
+# TIPOS DE DATOS Y LOS VALORES QUE CUENTAN COMO NULOS (EN ESTOS CSV, SÓLO LAS CELDAS VACÍAS)
+VACCINES_COLUMNS = [
+    'Share of one-year-olds who have received three doses of Hepatitis B containing vaccine (HEPB3)',
+    'Share of one-year-olds who have received three doses of Haemophilus influenzae type b containing vaccine (HIB3)',
+    'Share of one-year-olds who have received their first dose of inactivated polio containing vaccine (IPV1)',
+    'Share of one-year-olds who have received their first dose of measles-containing vaccine (MCV1)',
+    'Share of one-year-olds who have received their pneumococcal conjugate vaccine 3rd dose (PCV3)',
+    'Share of one-year-olds who have received their third dose of either oral or inactivated polio vaccine (POL3)',
+    'Share of one-year-olds who have received one dose of rubella-containing vaccine (RCV1)',
+    'Share of one-year-olds who have received their final recommended dose (2nd or 3rd) of rotavirus vaccine (ROTAC)',
+    'Share of one-year-olds who have received one dose of yellow fever vaccine (YFV)',
+    'Share of one-year-olds who have received three doses of combined diphtheria, tetanus toxoid and pertussis-containing vaccine (DTP3)'
+]
+
+PREVENTABLE_DEATHS_SCHEMA = {
+    "usecols": ['location_name', 'cause_name', 'metric_name', 'year', 'val'],
+    "dtype": {'location_name': "str", 'cause_name': "str", 'metric_name': "str", 'year': "int16", 'val': "float64"},
+    "na_values": [""],
+    "keep_default_na": False
+}
+
+# FILAS DE MÉTRICAS QUE EL EDA DESCARTA DE "DEATHS VACCINES COULD HAVE PREVENTED" (LAS MISMAS QUE EN
+# EDA_PREVENTABLE_DEATHS). SE USAN PARA FILTRAR CADA BLOQUE EN LA LECTURA POR BLOQUES
+PREVENTABLE_DEATHS_EXCLUDED_METRICS = ['Porcentaje', 'Tasa']
+
+RAW_SCHEMAS = {
+    "Global vaccination coverage.csv": {
+        "usecols": ['Entity', 'Year'] + VACCINES_COLUMNS,
+        "dtype": {'Entity': "str", 'Year': "int16", **{column: "float64" for column in VACCINES_COLUMNS}},
+        "na_values": [""],
+        "keep_default_na": False
+    },
+    "Life expectancy.csv": {
+        "usecols": ['Entity', 'Year', 'Period life expectancy at birth - Sex: total - Age: 0'],
+        "dtype": {'Entity': "str", 'Year': "int16", 'Period life expectancy at birth - Sex: total - Age: 0': "float64"},
+        "na_values": [""],
+        "keep_default_na": False
+    },
+    "Under five mortality rate.csv": {
+        "usecols": ['Entity', 'Year', 'Under-five mortality rate'],
+        "dtype": {'Entity': "str", 'Year': "int16", 'Under-five mortality rate': "float64"},
+        "na_values": [""],
+        "keep_default_na": False
+    },
+    "Deaths vaccines could have prevented 1.csv": PREVENTABLE_DEATHS_SCHEMA,
+    "Deaths vaccines could have prevented 2.csv": PREVENTABLE_DEATHS_SCHEMA,
+    "Literacy.csv": {
+        "usecols": ['Entity', 'Year', 'combined_literacy'],
+        "dtype": {'Entity': "str", 'Year': "int16", 'combined_literacy': "float64"},
+        "na_values": [""],
+        "keep_default_na": False
+    },
+    "Gross Domestic Product.csv": {
+        "usecols": ['Entity', 'Year', 'ny_gdp_pcap_pp_kd'],
+        "dtype": {'Entity': "str", 'Year': "int16", 'ny_gdp_pcap_pp_kd': "float64"},
+        "na_values": [""],
+        "keep_default_na": False
+    }
+}
+
+# TIPOS DE DATOS DE LOS DATASETS PROCESADOS QUE read_csv NO INFIERE DEL CSV: EL AÑO CONSERVA EL int16 DE LOS
+# ESQUEMAS DE LECTURA (SIN ÉL SE LEERÍA COMO int64). EL RESTO DE LAS COLUMNAS SE INFIERE IGUAL QUE EN LA LIMPIEZA
+PROCESSED_DTYPES = {'Año': "int16"}
+
+
+def load_data(use_cache=True, cache_dir=None, use_schemas=True, multithreaded=False, stream_chunksize=None):
     """
     Carga los siete datasets, unifica los dos dataset de "Deaths vaccines could have
-    prevented" y devuelve todos los datasets dentro de un diccionario de DataFrames
+    prevented" y devuelve todos los datasets dentro de un diccionario de DataFrames.
+    Con use_cache=True cada CSV se lee a través de la caché binaria de raw_cache.py (data/cache), 
+    que sólo vuelve a parsear el texto cuando el archivo de origen cambió.
+    Con use_schemas=True cada CSV se lee con su esquema de RAW_SCHEMAS: sólo se parsean las columnas
+    que usa el EDA (por ejemplo, 5 de las 16 columnas de "Deaths vaccines could have prevented"), ya
+    con su tipo de datos. Con multithreaded=True se usa el motor de lectura multihilo de pyarrow si
+    está instalado; si no, el motor de C de pandas.
+    Con stream_chunksize=N, los dos CSV de "Deaths vaccines could have prevented" se leen por bloques
+    de N filas con stream_preventable_deaths(), que filtra cada bloque antes de acumularlo, de modo
+    que el pico de memoria depende del tamaño del bloque y no del tamaño de los archivos. En ese modo
+    esos dos CSV no pasan por la caché binaria.
     """
 
     import pandas as pd
     import os
+    from raw_cache import read_csv_cached
 
     # RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (SRC/ETL.PY) HACIA DATA/RAW
     BASE_DIR = os.path.dirname(os.path.dirname(__file__))
     DATA_PATH = os.path.join(BASE_DIR, "data", "raw")
 
+    # LECTOR DE CSV: CON O SIN ESQUEMA, CON O SIN CACHÉ BINARIA
+    engine = csv_engine(multithreaded)
+    def read_csv(filename):
+        path = os.path.join(DATA_PATH, filename)
+        read_csv_kwargs = dict(RAW_SCHEMAS[filename]) if use_schemas else {}
+        if engine != "c":
+            read_csv_kwargs["engine"] = engine
+        if use_cache:
+            return read_csv_cached(path, cache_dir=cache_dir, **read_csv_kwargs)
+        return pd.read_csv(path, **read_csv_kwargs)
+
     # CARGA DE DATASETS
-    vaccination_coverage = pd.read_csv(os.path.join(DATA_PATH, "Global vaccination coverage.csv"))
-    life_expectancy = pd.read_csv(os.path.join(DATA_PATH, "Life expectancy.csv"))
-    child_mortality = pd.read_csv(os.path.join(DATA_PATH, "Under five mortality rate.csv"))
-    preventable_deaths_1 = pd.read_csv(os.path.join(DATA_PATH, "Deaths vaccines could have prevented 1.csv"))
-    preventable_deaths_2 = pd.read_csv(os.path.join(DATA_PATH, "Deaths vaccines could have prevented 2.csv"))
-    literacy = pd.read_csv(os.path.join(DATA_PATH, "Literacy.csv"))
-    gdp = pd.read_csv(os.path.join(DATA_PATH, "Gross Domestic Product.csv"))
+    vaccination_coverage = read_csv("Global vaccination coverage.csv")
+    life_expectancy = read_csv("Life expectancy.csv")
+    child_mortality = read_csv("Under five mortality rate.csv")
+    literacy = read_csv("Literacy.csv")
+    gdp = read_csv("Gross Domestic Product.csv")
 
-    # UNIFICACIÓN VERTICAL DE LOS DATASETS DE "DEATHS VACCINES COULD HAVE PREVENTED"
-    preventable_deaths = pd.concat([preventable_deaths_1, preventable_deaths_2], ignore_index=True)
+    # UNIFICACIÓN VERTICAL DE LOS DATASETS DE "DEATHS VACCINES COULD HAVE PREVENTED", COMPLETOS O POR BLOQUES
+    preventable_deaths_files = ["Deaths vaccines could have prevented 1.csv", "Deaths vaccines could have prevented 2.csv"]
+    if stream_chunksize:
+        preventable_deaths = stream_preventable_deaths([os.path.join(DATA_PATH, filename) for filename in preventable_deaths_files], stream_chunksize)
+    else:
+        preventable_deaths = pd.concat([read_csv(filename) for filename in preventable_deaths_files], ignore_index=True)
 
     return {
         "vaccination_coverage": vaccination_coverage,
@@ -32,3 +122,97 @@ def load_data():
         "gdp": gdp
     }
 
+
+def stream_preventable_deaths(paths, chunksize):
+    """
+    Lee los CSV de "Deaths vaccines could have prevented" por bloques de "chunksize" filas y sólo con
+    las columnas de su esquema. A cada bloque se le aplican los mismos filtros que en el EDA (se
+    eliminan las geografías repetidas y las filas de porcentaje y tasa) y sólo se acumulan las filas
+    que sobreviven, de modo que nunca hay en memoria más de un bloque sin filtrar.
+    """
+
+    import pandas as pd
+    from geography import get_normalizer
+
+    normalizer = get_normalizer("preventable_deaths")
+    survivors = []
+    for path in paths:
+        # EL MOTOR DE PYARROW NO ADMITE CHUNKSIZE, ASÍ QUE SE USA SIEMPRE EL DE C
+        with pd.read_csv(path, chunksize=chunksize, **PREVENTABLE_DEATHS_SCHEMA) as reader:
+            for chunk in reader:
+                chunk = normalizer.normalize(chunk, 'location_name')
+                survivors.append(chunk[~chunk['metric_name'].isin(PREVENTABLE_DEATHS_EXCLUDED_METRICS)])
+    return pd.concat(survivors, ignore_index=True)
+
+
+def csv_engine(multithreaded=False):
+    """
+    Devuelve el motor de lectura de CSV de pandas: "pyarrow" (multihilo) si se pide y está
+    instalado, y "c" en cualquier otro caso.
+    """
+
+    if multithreaded:
+        try:
+            import pyarrow
+            return "pyarrow"
+        except ImportError:
+            pass
+    return "c"
+
+
+def load_processed_data():
+    """
+    Carga los seis datasets ya limpios de data/processed. Sólo se usa cuando se ejecuta el análisis
+    estadístico sin haber pasado antes por el EDA en la misma ejecución.
+    """
+
+    import pandas as pd
+    import os
+
+    # RUTA BASE RELATIVA DESDE EL ARCHIVO ACTUAL (SRC/ETL.PY) HACIA DATA/PROCESSED
+    BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+    PROCESSED_PATH = os.path.join(BASE_DIR, "data", "processed")
+
+    return {
+        "vaccination_coverage": pd.read_csv(os.path.join(PROCESSED_PATH, 'vaccination_coverage_processed.csv'), dtype=PROCESSED_DTYPES),
+        "life_expectancy": pd.read_csv(os.path.join(PROCESSED_PATH, 'life_expectancy_processed.csv'), dtype=PROCESSED_DTYPES),
+        "child_mortality": pd.read_csv(os.path.join(PROCESSED_PATH, 'child_mortality_processed.csv'), dtype=PROCESSED_DTYPES),
+        "preventable_deaths": pd.read_csv(os.path.join(PROCESSED_PATH, 'preventable_deaths_processed.csv'), dtype=PROCESSED_DTYPES),
+        "literacy": pd.read_csv(os.path.join(PROCESSED_PATH, 'literacy_processed.csv'), dtype=PROCESSED_DTYPES),
+        "gdp": pd.read_csv(os.path.join(PROCESSED_PATH, 'gdp_processed.csv'), dtype=PROCESSED_DTYPES)
+    }
+
+
+class DatasetContext:
+    """
+    Contexto en memoria que se comparte entre ETL, EDA y stats durante una ejecución. Guarda en
+    "raw" los datasets crudos que devuelve load_data() y en "processed" los datasets limpios que
+    genera run_eda(), de modo que cada archivo se lee una única vez por ejecución. "verbosity" es el
+    nivel de detalle de lo que el EDA y la estadística imprimen sobre cada dataset (ver profiling.py).
+    En "index" quedan los datasets limpios ordenados por (País, Año) para recortarlos con select()
+    (ver query.py), en "aggregates" el cubo de agregados de los datasets limpios (ver
+    aggregate_cube.py), en "panel" el panel país-año que los une (ver panel.py) y en "tensors" ese
+    mismo panel como tensor país x año x indicador (ver tensor_store.py). En "geography" queda el
+    informe de la normalización de geografías de cada dataset limpiado (ver geography.py) y en
+    "results" los resultados numéricos del análisis estadístico (ver results.py).
+    """
+
+    def __init__(self, raw=None, processed=None, verbosity=1):
+        self.raw = raw if raw is not None else {}
+        self.processed = processed if processed is not None else {}
+        self.verbosity = verbosity
+        self.geography = {}
+        self.index = None
+        self.aggregates = None
+        self.panel = None
+        self.tensors = None
+        self.results = None
+
+
+def build_context(use_cache=True, multithreaded=False, stream_chunksize=None, verbosity=1):
+    """
+    Carga los datasets crudos una única vez y devuelve el DatasetContext que luego reciben
+    run_eda() y run_stats().
+    """
+
+    return DatasetContext(raw=load_data(use_cache=use_cache, multithreaded=multithreaded, stream_chunksize=stream_chunksize), verbosity=verbosity)
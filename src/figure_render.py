@@ -0,0 +1,324 @@
+import os
+import sys
+import json
+import hashlib
+import numpy as np
+from incremental import register_output, fingerprint
+from process_pool import process_pool
+import density
+
+# DEFINICIÓN DE DIRECTORIOS
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+FIGURES_PATH = os.path.join(BASE_DIR, "data", "figures")
+FIGURE_CACHE_PATH = os.path.join(BASE_DIR, "data", "cache", "figures")
+
+# SI ES TRUE, CADA PROCESO REUTILIZA UNA MISMA FIGURA (Y SUS EJES) PARA TODOS LOS GRÁFICOS DE UNA MISMA
+# DISPOSICIÓN, LIMPIÁNDOLA ENTRE UNO Y OTRO EN LUGAR DE CREAR Y CERRAR UNA FIGURA NUEVA CADA VEZ
+REUSE_FIGURES = True
+
+# FIGURAS ENVIADAS AL POOL COMPARTIDO (VER process_pool.py) QUE AÚN NO SE ESPERARON
+_pending = []
+
+# EN MODO SIN GRÁFICOS (HEADLESS), LAS FIGURAS ENVIADAS SE DESCARTAN SIN DIBUJARSE. CON LA CACHÉ DE
+# FIGURAS ACTIVADA, LAS QUE NO CAMBIARON DESDE LA EJECUCIÓN ANTERIOR NO SE VUELVEN A DIBUJAR
+_headless = False
+_use_cache = True
+
+# FIGURAS REUTILIZABLES DE ESTE PROCESO, POR DISPOSICIÓN: (FIGURA, EJES)
+_figures = {}
+
+
+def start_render_pool(headless=False, cache=True):
+    '''
+    Activa el renderizado de figuras. Si el pool compartido de process_pool.py está activo, cada
+    figura se dibuja en uno de sus procesos mientras continúa el análisis; si no, las figuras se
+    dibujan en serie, en el momento en que se envían. Ambos modos ejecutan exactamente las mismas
+    funciones de dibujo, de modo que los .png resultantes son idénticos byte a byte.
+    Con headless=True no se dibuja ninguna figura (ni se importa matplotlib): submit_figure() no hace
+    nada hasta el próximo close_render_pool().
+    Con cache=True, una figura cuyos datos y parámetros (y código de dibujo) no cambiaron desde que se
+    dibujó, y cuyos .png siguen intactos en disco, no se vuelve a dibujar (ver submit_figure).
+    '''
+
+    global _headless, _use_cache
+
+    close_render_pool()
+    _headless = headless
+    _use_cache = cache
+
+
+def close_render_pool():
+    '''
+    Espera a que terminen las figuras pendientes. El pool compartido lo cierra quien lo creó (ver
+    process_pool.py).
+    '''
+
+    global _headless, _use_cache
+
+    try:
+        wait_figures()
+    finally:
+        _headless, _use_cache = False, True
+
+
+def submit_figure(draw_function, filenames, *args, **kwargs):
+    '''
+    Envía una figura (un "trabajo") a renderizar. draw_function recibe como primer argumento la ruta
+    de salida (o la lista de rutas, si la figura genera varios .png) y a continuación *args y **kwargs,
+    que deben poder serializarse con pickle para enviarse a otro proceso.
+    Las salidas se registran enseguida como salidas de la etapa incremental en curso. En modo sin
+    gráficos (ver start_render_pool) la figura se descarta.
+    La caché de figuras identifica cada figura por la huella de la función de dibujo, este módulo,
+    density.py y los datos y parámetros que recibe. Si coincide con la del último dibujo de esos .png
+    y los archivos no se modificaron desde entonces (mismo tamaño y fecha), la figura no se vuelve a
+    dibujar.
+    '''
+
+    if _headless:
+        return
+
+    paths = [os.path.join(FIGURES_PATH, filename) for filename in ([filenames] if isinstance(filenames, str) else filenames)]
+    for path in paths:
+        register_output(path)
+
+    figure_fingerprint = fingerprint(draw_function, sys.modules[__name__], density, *args, *sorted(kwargs.items())) if _use_cache else None
+    if figure_fingerprint is not None and _is_rendered(paths, figure_fingerprint):
+        return
+
+    target = paths[0] if isinstance(filenames, str) else paths
+    pool = process_pool()
+    if pool is None:
+        draw_function(target, *args, **kwargs)
+        _save_render_record(paths, figure_fingerprint)
+    else:
+        _pending.append((pool.submit(draw_function, target, *args, **kwargs), paths, figure_fingerprint))
+
+
+def wait_figures():
+    '''
+    Espera a que terminen todas las figuras enviadas al pool. Si alguna falló, se borran sus .png
+    (para que la próxima ejecución incremental vuelva a generarlas) y se relanza el primer error.
+    '''
+
+    error = None
+    while _pending:
+        future, paths, figure_fingerprint = _pending.pop(0)
+        try:
+            future.result()
+            _save_render_record(paths, figure_fingerprint)
+        except Exception as exc:
+            for path in paths:
+                if os.path.exists(path):
+                    os.remove(path)
+            error = error or exc
+    if error is not None:
+        raise error
+
+
+def _render_record_path(paths):
+    return os.path.join(FIGURE_CACHE_PATH, hashlib.sha256(os.path.abspath(paths[0]).encode("utf-8")).hexdigest()[:32] + ".json")
+
+
+def _file_states(paths):
+    # TAMAÑO Y FECHA DE MODIFICACIÓN DE CADA .PNG (NONE SI FALTA ALGUNO)
+    if not all(os.path.exists(path) for path in paths):
+        return None
+    return [[os.path.getsize(path), os.stat(path).st_mtime_ns] for path in paths]
+
+
+def _is_rendered(paths, figure_fingerprint):
+    record_path = _render_record_path(paths)
+    if not os.path.exists(record_path):
+        return False
+    try:
+        with open(record_path, encoding="utf-8") as f:
+            record = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return record.get("fingerprint") == figure_fingerprint and record.get("files") == _file_states(paths)
+
+
+def _save_render_record(paths, figure_fingerprint):
+    if figure_fingerprint is None:
+        return
+    os.makedirs(FIGURE_CACHE_PATH, exist_ok=True)
+    record_path = _render_record_path(paths)
+    with open(record_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({"paths": [os.path.abspath(path) for path in paths], "fingerprint": figure_fingerprint, "files": _file_states(paths)}, f)
+    os.replace(record_path + ".tmp", record_path)
+
+
+# ---------------------- FUNCIONES DE DIBUJO ----------------------
+# MATPLOTLIB, SEABORN, SCIPY Y SCIKIT-LEARN SE IMPORTAN DENTRO DE CADA FUNCIÓN DE DIBUJO Y NO AL IMPORTAR
+# ESTE MÓDULO: UNA EJECUCIÓN QUE NO DIBUJA NINGUNA FIGURA (SÓLO EL ETL, O UNA ETAPA INCREMENTAL QUE NO
+# CAMBIÓ) NO PAGA SUS SEGUNDOS DE IMPORTACIÓN. PYTHON GUARDA LOS MÓDULOS YA IMPORTADOS, DE MODO QUE
+# SÓLO LA PRIMERA FIGURA DE CADA PROCESO LOS CARGA
+
+def _figure(figsize, ncols=1):
+    '''
+    Devuelve una figura de tamaño "figsize" con "ncols" ejes en una fila, ya limpios. Con
+    REUSE_FIGURES, la figura de cada disposición se crea una única vez por proceso y en los dibujos
+    siguientes sólo se limpian sus ejes. El llamador guarda la figura con _save().
+    '''
+
+    import matplotlib.pyplot as plt
+
+    key = (figsize, ncols)
+    if REUSE_FIGURES and key in _figures:
+        # LOS MÁRGENES VUELVEN A LOS POR DEFECTO, PARA QUE tight_layout() PARTA DE LA MISMA DISPOSICIÓN
+        # QUE EN UNA FIGURA NUEVA
+        figure, axes = _figures[key]
+        figure.subplots_adjust(**{name: plt.rcParams[f"figure.subplot.{name}"] for name in ("left", "right", "bottom", "top", "wspace", "hspace")})
+        for ax in axes:
+            ax.clear()
+        return figure, axes
+
+    figure, axes = plt.subplots(1, ncols, figsize=figsize, squeeze=False)
+    axes = list(axes[0])
+    if REUSE_FIGURES:
+        _figures[key] = figure, axes
+    return figure, axes
+
+
+def _save(figure, path):
+    import matplotlib.pyplot as plt
+
+    figure.tight_layout()
+    figure.savefig(path)
+    if not REUSE_FIGURES:
+        plt.close(figure)
+
+
+def draw_distribution(path, values, titles, xlabel, colors, bins=30):
+    '''
+    Dibuja el gráfico de tres paneles que se usa para cada variable en stats.py: histograma, boxplot
+    y KDE de "values". titles y colors son tuplas con el título y el color de cada panel.
+    Los tres paneles se dibujan a partir de los arrays que calcula density.py en una sola pasada
+    sobre los valores (conteos del histograma, estadísticas del boxplot y KDE por FFT); seaborn sólo
+    recibe esos arrays, de modo que el estilo de los paneles es el mismo que con los datos crudos.
+    '''
+
+    import seaborn as sns
+    from colorsys import rgb_to_hls
+    from matplotlib.colors import to_rgb, to_rgba
+    arrays = density.distribution_arrays(values, bins=bins)
+    sns.set(style="whitegrid")
+    figure, (hist_ax, box_ax, kde_ax) = _figure((24, 6), ncols=3)
+
+    # HISTOGRAMA: UN VALOR POR INTERVALO (SU BORDE IZQUIERDO), PONDERADO POR SU CONTEO. LOS BORDES SE PASAN
+    # COMO LISTA PORQUE SEABORN COMPARA "bins" CON "auto" CUANDO HAY PESOS
+    sns.histplot(x=arrays["edges"][:-1], weights=arrays["counts"], bins=list(arrays["edges"]), kde=False, color=colors[0], ax=hist_ax)
+    hist_ax.set_title(titles[0])
+    hist_ax.set_xlabel(xlabel)
+    hist_ax.set_ylabel('Frecuencia')
+
+    # BOXPLOT: Axes.bxp RECIBE DIRECTAMENTE LAS ESTADÍSTICAS YA CALCULADAS, CON EL ESTILO DE sns.boxplot()
+    # (RELLENO DESATURADO, LÍNEAS GRISES SEGÚN LA LUMINOSIDAD DEL RELLENO, UNA ÚNICA CAJA EN LA POSICIÓN 0)
+    fill = sns.desaturate(colors[1], .75)
+    line = (rgb_to_hls(*to_rgb(fill))[1] * .6,) * 3
+    box_ax.bxp([arrays["box"]], positions=[0], widths=[.8], capwidths=[.4], orientation="horizontal", patch_artist=True, manage_ticks=False,
+               boxprops={"facecolor": fill, "edgecolor": line}, medianprops={"color": line, "solid_capstyle": "butt"},
+               whiskerprops={"color": line, "solid_capstyle": "butt"}, capprops={"color": line}, flierprops={"markeredgecolor": line})
+    box_ax.yaxis.grid(False)
+    box_ax.set_ylim(.5, -.5)
+    box_ax.set_yticks([])
+    box_ax.set_title(titles[1])
+    box_ax.set_xlabel(xlabel)
+
+    # KDE: EL MISMO RELLENO QUE sns.kdeplot(fill=True)
+    if arrays["density"] is not None:
+        area = kde_ax.fill_between(arrays["support"], 0, arrays["density"], facecolor=to_rgba(colors[2], .25), edgecolor=to_rgba(colors[2], 1))
+        area.sticky_edges.y[:] = (0, np.inf)
+    kde_ax.set_title(titles[2])
+    kde_ax.set_xlabel(xlabel)
+    kde_ax.set_ylabel('Densidad')
+
+    _save(figure, path)
+
+
+def draw_correlation_matrix(path, df):
+    '''
+    Dibuja la matriz de correlación entre las columnas de df. Es la única figura con barra de color
+    (un eje más que agrega seaborn), de modo que no se reutiliza.
+    '''
+
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    sns.set(style="whitegrid")
+    correlation_matrix = df.corr()
+    plt.figure(figsize=(10, 6))
+    sns.heatmap(correlation_matrix, annot=True, cmap="coolwarm", fmt=".2f")
+    plt.title("Matriz de correlación entre indicadores globales (1980-2019)")
+    plt.tight_layout()
+    plt.savefig(path)
+    plt.close()
+
+
+def draw_regression(path, df, x_col, y_col, title, y_pred, r2):
+    '''
+    Dibuja los datos de la regresión lineal de y_col sobre x_col junto con la recta ajustada. y_pred
+    son los valores predichos y r2 el R² del ajuste, ya calculados en stats.py (ver regression.py).
+    '''
+
+    import seaborn as sns
+
+    sns.set(style="whitegrid")
+    X = df[[x_col]]
+    y = df[y_col]
+
+    figure, (ax,) = _figure((8, 5))
+    ax.scatter(X, y, label="Datos sin outliers", alpha=0.7)
+    ax.plot(X, y_pred, color="red", label=f"Regresión (R² = {r2:.2f})")
+    ax.set_xlabel(x_col)
+    ax.set_ylabel(y_col)
+    ax.set_title(title)
+    ax.legend()
+    _save(figure, path)
+
+
+def draw_residue(paths, df, x_col, y_col, title, y_pred, r2):
+    '''
+    Dibuja las cuatro figuras del estudio de residuos de una regresión lineal: la regresión, los
+    residuos frente a los valores predichos, su histograma y su Q-Q plot. paths son las rutas de
+    salida, en ese orden. y_pred y r2 son los valores predichos y el R² del ajuste, ya calculados en
+    stats.py (ver regression.py).
+    '''
+
+    import seaborn as sns
+    import scipy.stats as stats
+
+    sns.set(style="whitegrid")
+
+    X = df[[x_col]]
+    y = df[y_col]
+
+    figure, (ax,) = _figure((8, 5))
+    ax.scatter(X, y, label='Datos reales', alpha=0.7)
+    ax.plot(X, y_pred, color='red', label=f'Regresión (R² = {r2:.2f})')
+    ax.set_xlabel(x_col)
+    ax.set_ylabel(y_col)
+    ax.set_title(title)
+    ax.legend()
+    _save(figure, paths[0])
+
+    residuos = y - y_pred
+
+    figure, (ax,) = _figure((10, 5))
+    ax.scatter(y_pred, residuos, color="darkorange")
+    ax.axhline(0, color='gray', linestyle='--')
+    ax.set_xlabel("Valores Predichos")
+    ax.set_ylabel("Residuos")
+    ax.set_title("Gráfico de Residuos")
+    _save(figure, paths[1])
+
+    figure, (ax,) = _figure((8, 5))
+    sns.histplot(residuos, kde=True, color="mediumpurple", ax=ax)
+    ax.set_title("Distribución de los Residuos")
+    ax.set_xlabel("Residuos")
+    _save(figure, paths[2])
+
+    figure, (ax,) = _figure((6, 6))
+    stats.probplot(residuos, dist="norm", plot=ax)
+    ax.set_title("Q-Q Plot de los Residuos")
+    _save(figure, paths[3])
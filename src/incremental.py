@@ -0,0 +1,174 @@
+import os
+import io
+import sys
+import json
+import hashlib
+import inspect
+import contextlib
+import numpy as np
+import pandas as pd
+
+# DEFINICIÓN DE DIRECTORIOS
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+INCREMENTAL_PATH = os.path.join(BASE_DIR, "data", "cache", "incremental")
+
+# SALIDAS REGISTRADAS POR LA ETAPA QUE SE ESTÁ EJECUTANDO (NONE SI NO HAY NINGUNA EN CURSO)
+_current_outputs = None
+
+
+def fingerprint(*parts):
+    '''
+    Calcula la huella (hash SHA-256) de las entradas y parámetros de una etapa. Acepta DataFrames,
+    Series, arrays de NumPy, funciones (se usa su código fuente, para que cambiar el código también
+    invalide la etapa), listas, tuplas y diccionarios de cualquiera de ellos y cualquier valor
+    serializable como texto.
+    '''
+
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(_part_bytes(part))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def _part_bytes(part):
+    if isinstance(part, pd.DataFrame):
+        header = repr([(str(column), str(dtype)) for column, dtype in part.dtypes.items()])
+        values = pd.util.hash_pandas_object(part, index=False).to_numpy()
+        return header.encode("utf-8") + values.tobytes()
+    if isinstance(part, pd.Series):
+        header = repr((str(part.name), str(part.dtype)))
+        values = pd.util.hash_pandas_object(part, index=False).to_numpy()
+        return header.encode("utf-8") + values.tobytes()
+    if isinstance(part, np.ndarray):
+        return repr((part.dtype.str, part.shape)).encode("utf-8") + np.ascontiguousarray(part).tobytes()
+    if inspect.isfunction(part) or inspect.ismodule(part):
+        return inspect.getsource(part).encode("utf-8")
+    # LOS CONTENEDORES SE RECORREN ELEMENTO POR ELEMENTO: SU repr() RECORTA LAS SERIES Y DATAFRAMES LARGOS
+    # A SUS PRIMERAS Y ÚLTIMAS FILAS, DE MODO QUE UN CAMBIO EN EL MEDIO NO CAMBIARÍA LA HUELLA
+    if isinstance(part, (list, tuple)):
+        return type(part).__name__.encode("utf-8") + b"[" + b"\x00".join(_part_bytes(item) for item in part) + b"]"
+    if isinstance(part, dict):
+        return b"dict{" + b"\x00".join(_part_bytes(key) + b":" + _part_bytes(value) for key, value in part.items()) + b"}"
+    return repr(part).encode("utf-8")
+
+
+def register_output(path):
+    '''
+    Registra un archivo escrito por la etapa en curso, para poder comprobar en la próxima ejecución
+    que sigue existiendo. Fuera de run_if_changed no hace nada.
+    '''
+
+    if _current_outputs is not None:
+        _current_outputs.append(os.path.abspath(path))
+
+
+def run_if_changed(key, parts, function, outputs=(), enabled=True):
+    '''
+    Ejecuta function() sólo si la huella de "parts" cambió desde la última ejecución de la etapa "key"
+    o si falta alguno de sus archivos de salida. Las salidas son las indicadas en "outputs" más las
+    que la propia etapa registre con register_output().
+    Lo que la etapa imprime por consola se guarda junto a la huella, y cuando la etapa se omite se
+    vuelve a imprimir, de manera que la salida por consola es la misma que en una ejecución completa.
+    Devuelve una tupla (ejecutada, resultado); si la etapa se omitió, resultado es None.
+    '''
+
+    global _current_outputs
+
+    if not enabled:
+        return True, function()
+
+    record_path, log_path = _stage_paths(key)
+    stage_fingerprint = fingerprint(*parts)
+
+    if _is_current(record_path, stage_fingerprint):
+        if os.path.exists(log_path):
+            with open(log_path, encoding="utf-8") as f:
+                sys.stdout.write(f.read())
+        return False, None
+
+    # LA ETAPA CAMBIÓ: SE EJECUTA, DUPLICANDO LA SALIDA POR CONSOLA PARA GUARDARLA
+    if os.path.exists(record_path):
+        os.remove(record_path)
+
+    previous_outputs, _current_outputs = _current_outputs, [os.path.abspath(path) for path in outputs]
+    log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(_Tee(sys.stdout, log)):
+            result = function()
+        stage_outputs = sorted(set(_current_outputs))
+    finally:
+        _current_outputs = previous_outputs
+
+    os.makedirs(INCREMENTAL_PATH, exist_ok=True)
+    with open(log_path, "w", encoding="utf-8") as f:
+        f.write(log.getvalue())
+    _write_record(record_path, {"key": key, "fingerprint": stage_fingerprint, "outputs": stage_outputs})
+
+    return True, result
+
+
+def is_up_to_date(key, parts):
+    '''
+    Indica si la etapa "key" se omitiría en run_if_changed(): su huella no cambió y todas sus salidas
+    siguen existiendo. Permite decidir de antemano qué etapas hay que ejecutar, por ejemplo para
+    lanzarlas en paralelo.
+    '''
+
+    record_path, _ = _stage_paths(key)
+    return _is_current(record_path, fingerprint(*parts))
+
+
+def clear_fingerprints():
+    '''
+    Borra todas las huellas guardadas, lo que obliga a recalcular todas las etapas.
+    '''
+
+    if os.path.isdir(INCREMENTAL_PATH):
+        for filename in os.listdir(INCREMENTAL_PATH):
+            os.remove(os.path.join(INCREMENTAL_PATH, filename))
+
+
+def _stage_paths(key):
+    safe_key = "".join(c if c.isalnum() or c in "-_." else "_" for c in key)
+    return os.path.join(INCREMENTAL_PATH, f"{safe_key}.json"), os.path.join(INCREMENTAL_PATH, f"{safe_key}.log")
+
+
+def _is_current(record_path, stage_fingerprint):
+    record = _read_record(record_path)
+    return record is not None and record["fingerprint"] == stage_fingerprint and all(os.path.exists(path) for path in record["outputs"])
+
+
+def _read_record(record_path):
+    if not os.path.exists(record_path):
+        return None
+    try:
+        with open(record_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_record(record_path, record):
+    tmp_path = record_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(record, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, record_path)
+
+
+class _Tee(io.TextIOBase):
+    '''
+    Escribe a la vez en la consola y en el buffer donde se guarda la salida de la etapa.
+    '''
+
+    def __init__(self, *streams):
+        self.streams = streams
+
+    def write(self, text):
+        for stream in self.streams:
+            stream.write(text)
+        return len(text)
+
+    def flush(self):
+        for stream in self.streams:
+            stream.flush()
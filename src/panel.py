@@ -0,0 +1,192 @@
+import os
+import json
+import shutil
+import numpy as np
+import pandas as pd
+from incremental import run_if_changed
+from raw_cache import write_columns, read_columns
+
+# DEFINICIÓN DE DIRECTORIOS
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+PANEL_PATH = os.path.join(BASE_DIR, "data", "processed", "panel")
+
+# VERSIÓN DEL FORMATO DEL PANEL EN DISCO. SI CAMBIA, EL PANEL GUARDADO SE VUELVE A CONSTRUIR
+PANEL_FORMAT_VERSION = 2
+
+# DATASETS QUE SE UNEN EN EL PANEL, EN EL ORDEN EN QUE APARECEN SUS COLUMNAS
+PANEL_DATASETS = ["vaccination_coverage", "life_expectancy", "child_mortality", "preventable_deaths", "literacy", "gdp"]
+
+# LOS AÑOS SE GUARDAN EN LOS DÍGITOS BAJOS DE LA CLAVE ENTERA (PAÍS, AÑO)
+YEAR_KEY_SPAN = 10_000
+
+
+def build_panel(processed):
+    '''
+    Construye el panel país-año: una fila por cada (país, año) con datos en al menos uno de los seis
+    datasets limpios y una columna por indicador. Las muertes prevenibles se pivotan por causa
+    ("Muertes por <causa>") y se agrega su total ("Muertes prevenibles"). Las columnas de cada dataset
+    quedan en NaN en los (país, año) que ese dataset no tiene (unión externa).
+    Las filas sin país o sin año, y los (país, año) repetidos en un mismo dataset (salvo en las
+    muertes prevenibles, que se suman por causa), son un error (ValueError).
+    La unión se hace sobre claves enteras: cada país es su código en la lista ordenada de todos los
+    países y cada fila se identifica con código * YEAR_KEY_SPAN + año, de modo que alinear un dataset
+    con el panel es una búsqueda binaria de sus claves entre las claves ordenadas del panel.
+    El panel queda ordenado por país y año; "País" es categórica y "Año" int16. Los decimales de las
+    columnas float32 (ver optimize_dtypes() en dtype_optimizer.py) pasan a attrs["decimals"] del panel.
+    '''
+
+    frames = {name: processed[name] for name in PANEL_DATASETS if name in processed}
+    countries = np.unique(np.concatenate([_categories(df["País"]) for df in frames.values()]))
+
+    # CLAVES Y COLUMNAS DE CADA DATASET; LAS MUERTES PREVENIBLES, YA PIVOTADAS POR CAUSA
+    blocks = {}
+    for name, df in frames.items():
+        keys = _panel_keys(df, countries, name)
+        if name == "preventable_deaths":
+            blocks[name] = _pivot_causes(df, keys)
+        else:
+            # CADA (PAÍS, AÑO) DEBE APARECER UNA SOLA VEZ; SI NO, AL ALINEAR UNA FILA PISARÍA A LA OTRA
+            unique_keys, counts = np.unique(keys, return_counts=True)
+            if (counts > 1).any():
+                repeated = [(countries[key // YEAR_KEY_SPAN], int(key % YEAR_KEY_SPAN)) for key in unique_keys[counts > 1][:5]]
+                raise ValueError(f"{name}: {(counts > 1).sum()} (País, Año) repetidos, por ejemplo {repeated}")
+            blocks[name] = keys, {column: df[column].to_numpy() for column in df.columns.difference(["País", "Año"], sort=False)}
+    panel_keys = np.unique(np.concatenate([keys for keys, _ in blocks.values()]))
+
+    columns = {
+        "País": pd.Categorical.from_codes(panel_keys // YEAR_KEY_SPAN, categories=countries),
+        "Año": (panel_keys % YEAR_KEY_SPAN).astype(np.int16)
+    }
+    for keys, block in blocks.values():
+        positions = np.searchsorted(panel_keys, keys)
+        for column, values in block.items():
+            aligned = np.full(len(panel_keys), np.nan, dtype=np.result_type(values.dtype, np.float32))
+            aligned[positions] = values
+            columns[column] = aligned
+    panel = pd.DataFrame(columns)
+    panel.attrs["decimals"] = {column: decimals for df in frames.values() for column, decimals in df.attrs.get("decimals", {}).items() if column in panel}
+    return panel
+
+
+def save_panel(panel, directory=None):
+    '''
+    Guarda el panel en formato columnar en data/processed/panel: en Parquet si pyarrow está instalado
+    y, si no, con un .npy por columna (el mismo formato que la caché de raw_cache.py), que luego se
+    abre como memmap. El meta.json, con los decimales de las columnas float32, se escribe al final y
+    marca que el panel está completo.
+    Devuelve el panel.
+    '''
+
+    directory = directory or PANEL_PATH
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory)
+
+    meta = {"version": PANEL_FORMAT_VERSION, "format": panel_format(), "rows": len(panel), "decimals": panel.attrs.get("decimals", {})}
+    if meta["format"] == "parquet":
+        panel.to_parquet(os.path.join(directory, "panel.parquet"), index=False)
+    else:
+        meta["columns"] = write_columns(directory, panel)
+
+    with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=1)
+    return panel
+
+
+def load_panel(directory=None):
+    '''
+    Lee el panel que guardó save_panel(). Devuelve None si no hay un panel completo en "directory" o
+    si se guardó con otra versión del formato.
+    '''
+
+    directory = directory or PANEL_PATH
+    meta_path = os.path.join(directory, "meta.json")
+    if not os.path.exists(meta_path):
+        return None
+    with open(meta_path, encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("version") != PANEL_FORMAT_VERSION:
+        return None
+
+    if meta["format"] == "parquet":
+        panel = pd.read_parquet(os.path.join(directory, "panel.parquet"))
+    else:
+        panel = read_columns(directory, meta["columns"])
+    panel.attrs["decimals"] = meta["decimals"]
+    return panel
+
+
+def panel_format():
+    '''
+    Devuelve el formato en el que se guarda el panel: "parquet" si pyarrow está instalado y "npy" en
+    cualquier otro caso.
+    '''
+
+    try:
+        import pyarrow
+        return "parquet"
+    except ImportError:
+        return "npy"
+
+
+def run_panel(context, incremental=True, directory=None, verbose=True):
+    '''
+    Etapa del pipeline que se ejecuta después del EDA: construye el panel país-año de los datasets de
+    context.processed, lo guarda en data/processed/panel y lo deja en context.panel para cualquier
+    análisis que necesite cruzar indicadores por país y año. Con incremental=True, si los datasets
+    limpios no cambiaron desde la ejecución anterior, el panel no se vuelve a construir: se lee el
+    guardado en disco. Con verbose=True imprime su tamaño.
+    '''
+
+    directory = directory or PANEL_PATH
+    parts = [*(context.processed[name] for name in PANEL_DATASETS if name in context.processed),
+             build_panel, _pivot_causes, _panel_keys, save_panel, PANEL_FORMAT_VERSION, directory]
+    ran, panel = run_if_changed("panel", parts, lambda: save_panel(build_panel(context.processed), directory),
+                                outputs=[os.path.join(directory, "meta.json")], enabled=incremental)
+    if not ran:
+        panel = load_panel(directory)
+    context.panel = panel
+
+    if verbose:
+        indicators = panel.columns.difference(["País", "Año"])
+        filled = panel[indicators].notna().to_numpy().mean()
+        print(f"→ panel país-año: {len(panel)} filas ({panel['País'].nunique()} países, años {panel['Año'].min()}-{panel['Año'].max()}), "
+              f"{len(indicators)} indicadores, {100 * filled:.1f}% de celdas con dato, "
+              f"{panel.memory_usage(deep=True).sum() / 2**20:.1f} MB")
+    return panel
+
+
+def _pivot_causes(preventable_deaths, keys):
+    # UNA COLUMNA POR CAUSA DE MUERTE, TAMBIÉN SOBRE CLAVES ENTERAS: CADA FILA VA A LA CELDA (CLAVE, CAUSA)
+    # Y LAS FILAS REPETIDAS DE UNA MISMA CELDA SE SUMAN, COMO EN LOS TOTALES DE stats_preventable_deaths.
+    # LAS CELDAS SIN NINGUNA FILA QUEDAN EN NaN. DEVUELVE LAS CLAVES DE LAS FILAS PIVOTADAS Y SUS COLUMNAS
+    causes = preventable_deaths["Causa de muerte"].astype("category")
+    cause_codes, n_causes = causes.cat.codes.to_numpy().astype(np.int64), len(causes.cat.categories)
+    pivot_keys, rows = np.unique(keys, return_inverse=True)
+    cells = rows * n_causes + cause_codes
+
+    deaths = preventable_deaths["Muertes"].to_numpy(dtype=np.float64, na_value=np.nan)
+    totals = np.bincount(cells, weights=np.nan_to_num(deaths), minlength=len(pivot_keys) * n_causes).reshape(-1, n_causes)
+    present = np.bincount(cells, minlength=len(pivot_keys) * n_causes).reshape(-1, n_causes) > 0
+    totals = np.where(present, totals, np.nan).astype(preventable_deaths["Muertes"].dtype)
+
+    columns = {f"Muertes por {cause}": totals[:, i] for i, cause in enumerate(causes.cat.categories)}
+    columns["Muertes prevenibles"] = np.where(present.any(axis=1), np.nansum(totals, axis=1), np.nan).astype(totals.dtype)
+    return pivot_keys, columns
+
+
+def _categories(values):
+    # PAÍSES DISTINTOS DE UNA COLUMNA, COMO TEXTO. SI LA COLUMNA YA ES CATEGÓRICA, SON SUS CATEGORÍAS
+    values = values if isinstance(values.dtype, pd.CategoricalDtype) else values.astype("category")
+    return np.asarray(values.cat.categories.astype(str))
+
+
+def _panel_keys(df, countries, name):
+    # CLAVE ENTERA DE CADA FILA: CÓDIGO DEL PAÍS EN "countries" (ORDENADO) * YEAR_KEY_SPAN + AÑO. SÓLO SE
+    # BUSCAN EN "countries" LAS CATEGORÍAS DE LA COLUMNA; CADA FILA TOMA EL CÓDIGO DE SU CATEGORÍA. UN PAÍS
+    # NULO (CÓDIGO -1) TOMARÍA EL CÓDIGO DEL ÚLTIMO PAÍS, DE MODO QUE LAS FILAS SIN PAÍS O SIN AÑO SE RECHAZAN
+    values = df["País"] if isinstance(df["País"].dtype, pd.CategoricalDtype) else df["País"].astype("category")
+    missing = (values.cat.codes.to_numpy() < 0) | df["Año"].isna().to_numpy()
+    if missing.any():
+        raise ValueError(f"{name}: {missing.sum()} filas sin país o sin año")
+    codes = np.searchsorted(countries, _categories(values))[values.cat.codes.to_numpy()]
+    return codes.astype(np.int64) * YEAR_KEY_SPAN + df["Año"].to_numpy(dtype=np.int64)
@@ -0,0 +1,120 @@
+import math
+import itertools
+import numpy as np
+from regression import least_squares
+from process_pool import process_pool, pool_workers
+
+# MÁXIMO DE PERMUTACIONES, SEMILLA BASE Y PRECISIÓN CON LA QUE SE DA POR ESTABLECIDO EL p-VALOR: LA MITAD
+# DEL ANCHO DEL INTERVALO DE CONFIANZA (AL NIVEL CONFIDENCE) DEL p-VALOR ESTIMADO POR MONTE CARLO
+PERMUTATIONS = 10_000
+SEED = 2024
+PRECISION = 0.01
+CONFIDENCE = 0.95
+
+# LARGO DE LOS BLOQUES DE AÑOS CONSECUTIVOS DE LA PERMUTACIÓN POR BLOQUES
+BLOCK_SIZE = 5
+
+# LAS PERMUTACIONES SE GENERAN EN BLOQUES DE CHUNK_SIZE, CADA UNO CON SU PROPIA SEMILLA DERIVADA DE LA BASE,
+# Y LA REGLA DE PARADA SE EVALÚA AL TERMINAR CADA BLOQUE, EN ORDEN. LOS BLOQUES CALCULADOS DE MÁS EN
+# PARALELO SE DESCARTAN, DE MODO QUE EL RESULTADO ES EL MISMO EN SERIE Y CON CUALQUIER CANTIDAD DE PROCESOS
+CHUNK_SIZE = 1_000
+
+def permutation_test(x, y, block_size=None, permutations=PERMUTATIONS, precision=PRECISION, seed=SEED):
+    '''
+    Test de permutaciones bilateral de la pendiente de la regresión lineal de y sobre x (H0: la
+    pendiente es cero). Bajo H0 el orden de y respecto de x es intercambiable, de modo que el p-valor es
+    la proporción de reordenamientos de y cuya pendiente es, en valor absoluto, al menos la observada.
+    - Con block_size=None, cada permutación reordena las filas libremente.
+    - Con block_size=k, las filas (ordenadas en el tiempo) se parten en bloques de k filas consecutivas y
+      sólo se reordenan los bloques, de modo que cada permutación conserva la autocorrelación dentro de
+      cada bloque.
+    Si los reordenamientos posibles (n! filas o b! bloques) no superan "permutations", se recorren
+    todos y el p-valor es exacto (por ejemplo, 720 órdenes de 6 bloques de 5 años). Si no, se sortean:
+    las permutaciones de cada bloque de CHUNK_SIZE se generan como una única matriz de índices y sus
+    pendientes se calculan en una sola operación (ver least_squares en regression.py); los bloques se
+    reparten en el pool compartido de process_pool.py, si está activo, y el cálculo se detiene antes
+    de "permutations" en cuanto el p-valor queda establecido con la precisión pedida.
+    Devuelve un dict con la pendiente observada, el p-valor, su error de Monte Carlo (0 si es exacto),
+    las permutaciones usadas, si el p-valor es exacto y el largo de los bloques.
+    '''
+
+    from scipy.special import ndtri
+
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    observed = least_squares(x, y)[1]
+    block_size = block_size if block_size is not None and block_size > 1 else None
+    units = len(y) if block_size is None else -(-len(y) // block_size)
+
+    # PERMUTACIONES EXACTAS: TODOS LOS ÓRDENES DE LAS FILAS O DE LOS BLOQUES, INCLUIDO EL OBSERVADO
+    if math.factorial(units) <= permutations:
+        orders = np.array(list(itertools.permutations(range(units))), dtype=np.intp)
+        slopes = least_squares(x, y[_block_indices(orders, len(y), block_size or 1)])[1]
+        exceed = np.count_nonzero(np.abs(slopes) >= np.abs(observed) * (1 - 1e-12))
+        return {"pendiente": float(observed), "p-valor": exceed / len(orders), "error de Monte Carlo del p-valor": 0.0,
+                "permutaciones": len(orders), "exacto": True, "largo de los bloques": block_size or 1}
+
+    sizes = [min(CHUNK_SIZE, permutations - start) for start in range(0, permutations, CHUNK_SIZE)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    z = ndtri(1 - (1 - CONFIDENCE) / 2)
+
+    # LAS PERMUTACIONES QUE REPRODUCEN EL ORDEN OBSERVADO DAN LA MISMA PENDIENTE SALVO POR REDONDEO; SE CUENTAN
+    exceed, used = 0, 0
+    for slopes in _chunks(x, y, sizes, block_size, seeds):
+        exceed += np.count_nonzero(np.abs(slopes) >= np.abs(observed) * (1 - 1e-12))
+        used += len(slopes)
+        pvalue, stderr = _pvalue(exceed, used)
+        if z * stderr <= precision:
+            break
+
+    return {"pendiente": float(observed), "p-valor": pvalue, "error de Monte Carlo del p-valor": stderr,
+            "permutaciones": used, "exacto": False, "largo de los bloques": block_size or 1}
+
+
+def regression_permutation_tests(df, x_col, y_col, **kwargs):
+    '''
+    Tests de permutaciones de la pendiente de la regresión lineal de y_col sobre x_col, con las filas
+    en el orden de df (los años, en orden), en el formato de las secciones de context.results (ver
+    results.py): con permutaciones libres y con permutaciones de bloques de BLOCK_SIZE años.
+    '''
+
+    x, y = df[x_col].to_numpy(dtype=np.float64), df[y_col].to_numpy(dtype=np.float64)
+    return {"permutación": permutation_test(x, y, **kwargs),
+            "permutación por bloques": permutation_test(x, y, block_size=BLOCK_SIZE, **kwargs)}
+
+
+def _chunks(x, y, sizes, block_size, seeds):
+    # PENDIENTES DE CADA BLOQUE DE PERMUTACIONES, EN ORDEN. EN EL POOL SE CALCULAN DE A TANTOS BLOQUES COMO
+    # PROCESOS, Y SÓLO SE PIDEN LOS SIGUIENTES SI LA REGLA DE PARADA NO SE CUMPLIÓ CON LOS ANTERIORES
+    pool, workers = process_pool(), pool_workers()
+    for start in range(0, len(sizes), workers):
+        batch = range(start, min(start + workers, len(sizes)))
+        arguments = ([x] * len(batch), [y] * len(batch), [sizes[i] for i in batch], [block_size] * len(batch), [seeds[i] for i in batch])
+        yield from (pool.map(_permutation_chunk, *arguments) if pool is not None else map(_permutation_chunk, *arguments))
+
+
+def _pvalue(exceed, used):
+    # p-VALOR CON LA CORRECCIÓN (b + 1) / (m + 1), QUE CUENTA LA MUESTRA OBSERVADA, Y SU ERROR BINOMIAL
+    pvalue = (exceed + 1) / (used + 1)
+    return float(pvalue), float(np.sqrt(pvalue * (1 - pvalue) / used))
+
+
+def _block_indices(orders, n, block_size):
+    # MATRIZ DE ÍNDICES DE LAS FILAS (UNA FILA POR ORDEN) A PARTIR DEL ORDEN DE LOS BLOQUES DE CADA
+    # PERMUTACIÓN. EL ÚLTIMO BLOQUE PUEDE SER MÁS CORTO, DE MODO QUE SE RELLENA CON -1 Y LOS RELLENOS SE
+    # QUITAN AL FINAL. CON block_size=1 CADA FILA ES UN BLOQUE Y LOS ÍNDICES SON LOS PROPIOS ÓRDENES
+    if block_size == 1:
+        return orders
+    count = orders.shape[1]
+    blocks = np.arange(count * block_size).reshape(count, block_size)
+    blocks[blocks >= n] = -1
+    indices = blocks[orders].reshape(len(orders), -1)
+    return indices[indices >= 0].reshape(len(orders), n)
+
+
+def _permutation_chunk(x, y, size, block_size, seed):
+    # PENDIENTES DE UN BLOQUE DE PERMUTACIONES SORTEADAS: UN ORDEN DE LAS FILAS O DE LOS BLOQUES POR
+    # PERMUTACIÓN, y REORDENADA CON LA MATRIZ DE ÍNDICES, x DIFUNDIDA
+    block_size = block_size or 1
+    units = -(-len(y) // block_size)
+    orders = np.random.default_rng(seed).permuted(np.broadcast_to(np.arange(units), (size, units)), axis=1)
+    return least_squares(x, y[_block_indices(orders, len(y), block_size)])[1]
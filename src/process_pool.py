@@ -0,0 +1,57 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# POOL DE PROCESOS COMPARTIDO POR EL DIBUJO DE FIGURAS (figure_render.py), EL BOOTSTRAP (bootstrap.py) Y
+# LOS TESTS DE PERMUTACIONES (permutation.py), DE MODO QUE EL ANÁLISIS ESTADÍSTICO NUNCA USA MÁS DE
+# "workers" PROCESOS. NONE EN MODO SERIE
+_pool = None
+_workers = 1
+
+
+def start_process_pool(workers=None):
+    '''
+    Crea el pool compartido de "workers" procesos. Con workers=None o workers<=1 no se crea ningún
+    pool y cada módulo calcula sus trabajos en serie, con los mismos resultados.
+    '''
+
+    global _pool, _workers
+
+    close_process_pool()
+    if workers is not None and workers > 1:
+        _pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+        _workers = workers
+
+
+def close_process_pool():
+    '''
+    Espera a que terminen los trabajos enviados y cierra el pool compartido, si lo hay.
+    '''
+
+    global _pool, _workers
+
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+        _workers = 1
+
+
+def process_pool():
+    '''
+    Devuelve el pool compartido, o None en modo serie.
+    '''
+
+    return _pool
+
+
+def pool_workers():
+    '''
+    Cantidad de procesos del pool compartido (1 en modo serie).
+    '''
+
+    return _workers
+
+
+def _init_worker():
+    # LOS PROCESOS DEL POOL SÓLO GUARDAN .PNG, NO NECESITAN UN BACKEND INTERACTIVO. SE INDICA POR VARIABLE
+    # DE ENTORNO, SIN IMPORTAR MATPLOTLIB, PARA QUE LOS PROCESOS QUE NO DIBUJAN NO PAGUEN SU IMPORTACIÓN
+    os.environ["MPLBACKEND"] = "Agg"
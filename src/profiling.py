@@ -0,0 +1,119 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+
+# DEFINICIÓN DE DIRECTORIOS
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+PROFILES_PATH = os.path.join(BASE_DIR, "data", "profiles")
+
+# NIVELES DE DETALLE DE LA SALIDA POR CONSOLA:
+# 0 -> NADA; 1 -> UNA LÍNEA POR PERFIL; 2 -> ADEMÁS, HEAD(10000), INFO() Y UNIQUE() DE CADA COLUMNA
+QUIET, SUMMARY, DUMP = 0, 1, 2
+
+# CANTIDAD DE VALORES MÁS FRECUENTES QUE SE GUARDAN POR COLUMNA
+TOP_VALUES = 5
+
+
+def profile_frame(df, top=TOP_VALUES):
+    '''
+    Calcula el perfil de un DataFrame: para cada columna, su tipo, nulos, valores distintos, mínimo,
+    máximo y los "top" valores más frecuentes. Cada columna se recorre una única vez: pd.factorize()
+    da los códigos de cada fila y los valores únicos, y todo lo demás sale de ahí (los nulos son los
+    códigos -1, las frecuencias un bincount de los códigos y el mínimo y el máximo se buscan entre los
+    valores únicos, no entre las filas).
+    '''
+
+    columns = {}
+    for column in df.columns:
+        codes, uniques = pd.factorize(df[column], use_na_sentinel=True)
+        uniques = np.asarray(uniques)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+
+        # MÁS FRECUENTES: ORDEN DE FRECUENCIA DESCENDENTE Y, A IGUAL FRECUENCIA, ORDEN DE APARICIÓN
+        order = np.argsort(-counts, kind="stable")[:top]
+
+        columns[str(column)] = {
+            "tipo": str(df[column].dtype),
+            "nulos": int(len(codes) - counts.sum()),
+            "distintos": len(uniques),
+            "mínimo": _json_value(uniques.min()) if len(uniques) else None,
+            "máximo": _json_value(uniques.max()) if len(uniques) else None,
+            "más frecuentes": [[_json_value(uniques[i]), int(counts[i])] for i in order]
+        }
+    return {"filas": len(df), "columnas": columns}
+
+
+def print_frame(df):
+    '''
+    Volcado completo por consola que hacían antes las funciones del EDA: head(10000), info() y los
+    valores únicos de cada columna.
+    '''
+
+    print(df.head(10000))
+    print(df.info())
+
+    for column in df.columns:
+        print(f"Columna: {column}")
+        print(df[column].unique())
+        print("-" * 40) # Separa entre columna y columna.
+
+
+def report_paths(dataset, directory=None):
+    '''
+    Rutas del informe JSON y Markdown de un dataset.
+    '''
+
+    directory = directory or PROFILES_PATH
+    return os.path.join(directory, f"{dataset}.json"), os.path.join(directory, f"{dataset}.md")
+
+
+class ProfileReport:
+    '''
+    Informe de perfiles de un dataset a lo largo de su limpieza: cada llamada a add() guarda el perfil
+    del DataFrame en una etapa ("crudo", "limpio", ...) y write() escribe todas las etapas en un JSON
+    y un Markdown en data/profiles. Lo que se imprime por consola depende de "verbosity".
+    '''
+
+    def __init__(self, dataset, verbosity=SUMMARY):
+        self.dataset = dataset
+        self.verbosity = verbosity
+        self.profiles = {}
+
+    def add(self, stage, df):
+        profile = profile_frame(df)
+        self.profiles[stage] = profile
+
+        if self.verbosity >= DUMP:
+            print_frame(df)
+        elif self.verbosity >= SUMMARY:
+            nulls = sum(column["nulos"] for column in profile["columnas"].values())
+            print(f"→ {self.dataset} ({stage}): {profile['filas']} filas, {len(profile['columnas'])} columnas, {nulls} nulos")
+        return profile
+
+    def write(self, directory=None):
+        json_path, md_path = report_paths(self.dataset, directory)
+        os.makedirs(os.path.dirname(json_path), exist_ok=True)
+
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump({"dataset": self.dataset, "perfiles": self.profiles}, f, ensure_ascii=False, indent=1)
+        with open(md_path, "w", encoding="utf-8") as f:
+            f.write(self.markdown())
+        return json_path, md_path
+
+    def markdown(self):
+        lines = [f"# Perfil de {self.dataset}", ""]
+        for stage, profile in self.profiles.items():
+            lines += [f"## {stage.capitalize()} ({profile['filas']} filas)", "",
+                      "| Columna | Tipo | Nulos | Distintos | Mínimo | Máximo | Más frecuentes |",
+                      "|---|---|---|---|---|---|---|"]
+            for column, stats in profile["columnas"].items():
+                top = ", ".join(f"{value} ({count})" for value, count in stats["más frecuentes"])
+                lines.append(f"| {column} | {stats['tipo']} | {stats['nulos']} | {stats['distintos']} | {stats['mínimo']} | {stats['máximo']} | {top} |")
+            lines.append("")
+        return "\n".join(lines)
+
+
+def _json_value(value):
+    # LOS ESCALARES DE NUMPY SE CONVIERTEN A TIPOS DE PYTHON PARA PODER ESCRIBIRLOS EN EL JSON
+    return value.item() if isinstance(value, np.generic) else value
@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+
+# NIVELES DEL ÍNDICE POR EL QUE SE ORDENAN LOS DATASETS
+INDEX_LEVELS = ["País", "Año"]
+
+# LOS AÑOS OCUPAN LOS DÍGITOS BAJOS DE LA CLAVE ENTERA (PAÍS, AÑO) DE CADA FILA, COMO EN PANEL.PY
+YEAR_KEY_SPAN = 10_000
+
+
+class DatasetIndex:
+    '''
+    Capa de consulta sobre los datasets limpios (y el panel país-año, si se incluye): cada dataset se
+    ordena una única vez por un MultiIndex (País, Año), de modo que seleccionar un país, un conjunto de
+    países o un rango de años es una búsqueda binaria sobre las filas ordenadas y no una máscara
+    booleana que recorre todas las filas. select() es el único punto de entrada, tanto para la
+    estadística como para los notebooks:
+
+        index = DatasetIndex(context.processed)
+        index.select("life_expectancy", country="España", years=(2000, 2019))
+    '''
+
+    def __init__(self, datasets):
+        self.datasets = {}
+        for name, df in datasets.items():
+            self.add(name, df)
+
+    def __contains__(self, name):
+        return name in self.datasets
+
+    def add(self, name, df):
+        '''
+        Ordena e indexa "df" y lo agrega (o lo reemplaza) bajo el nombre "name".
+        '''
+
+        self.datasets[name] = SortedDataset(df)
+        return self
+
+    def select(self, name, country=None, years=None, columns=None):
+        '''
+        Filas del dataset "name" de un país (country="España") o de varios (country=["España",
+        "Francia"]) y de un año (years=2019), de un rango de años, ambos incluidos (years=(1980, 2019)
+        o years=range(1980, 2020)), o de una lista de años. Lo que no se indica no se filtra. Con
+        "columns" se devuelven sólo esas columnas (una Series si es un único nombre).
+        El resultado conserva el índice (País, Año).
+        '''
+
+        return self.datasets[name].select(country=country, years=years, columns=columns)
+
+
+class SortedDataset:
+    '''
+    Un dataset ordenado por (País, Año), con la clave entera país * YEAR_KEY_SPAN + año de cada fila
+    (ordenada también) y la posición de cada país. Un rango de años de un país es un tramo contiguo
+    de filas, cuyos extremos se buscan con np.searchsorted sobre las claves.
+    '''
+
+    def __init__(self, df):
+        self.frame = index_dataset(df)
+        countries = self.frame.index.get_level_values("País")
+        codes, self.countries = pd.factorize(countries, sort=True)
+        self.codes = {country: code for code, country in enumerate(self.countries)}
+        self.keys = codes.astype(np.int64) * YEAR_KEY_SPAN + self.frame.index.get_level_values("Año").to_numpy(dtype=np.int64)
+
+    def select(self, country=None, years=None, columns=None):
+        frame = self.frame if columns is None else self.frame[columns]
+        if country is None and years is None:
+            return frame
+
+        if country is None:
+            codes = np.arange(len(self.countries))
+        elif isinstance(country, str):
+            codes = np.array([self.codes[country]])
+        else:
+            # LOS PAÍSES QUE NO ESTÁN EN EL DATASET SE IGNORAN, EN LUGAR DE FALLAR
+            codes = np.array(sorted(self.codes[name] for name in set(country) if name in self.codes), dtype=np.int64)
+
+        # UN TRAMO [INICIO, FIN) DE FILAS POR CADA PAÍS Y CADA RANGO DE AÑOS CONTIGUO
+        ranges = _year_ranges(years)
+        bounds = codes[:, None, None] * YEAR_KEY_SPAN + np.array(ranges)[None, :, :]
+        starts = np.searchsorted(self.keys, bounds[..., 0].ravel())
+        stops = np.searchsorted(self.keys, bounds[..., 1].ravel())
+        if len(starts) == 1:
+            return frame.iloc[starts[0]:stops[0]]
+        lengths = stops - starts
+        positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        return frame.iloc[positions]
+
+
+def run_dataset_index(context, verbose=True):
+    '''
+    Etapa del pipeline que se ejecuta después de la optimización de tipos: indexa por (País, Año) todos
+    los datasets de context.processed y deja el DatasetIndex en context.index, para que la estadística
+    (y cualquier notebook que use el contexto) recorte por país y por años con select(). Con
+    verbose=True imprime cuántas filas quedaron indexadas en cada dataset.
+    '''
+
+    index = DatasetIndex(context.processed)
+    context.index = index
+    if verbose:
+        for name, dataset in index.datasets.items():
+            print(f"→ {name}: {len(dataset.frame)} filas, {len(dataset.countries)} países")
+    return index
+
+
+def index_dataset(df):
+    '''
+    Devuelve una copia de df indexada por (País, Año) y ordenada por país y año. Los países pasan a
+    texto para que el nivel del índice sea el mismo en todos los datasets.
+    '''
+
+    df = df.assign(País=df["País"].astype(str))
+    return df.set_index(INDEX_LEVELS).sort_index(kind="stable")
+
+
+def _year_ranges(years):
+    # RANGOS [DESDE, HASTA) DE AÑOS: UNO SOLO PARA UN AÑO, UNA TUPLA O UN RANGE, Y UNO POR AÑO PARA UNA LISTA
+    if years is None:
+        return [(0, YEAR_KEY_SPAN)]
+    if isinstance(years, (int, np.integer)):
+        return [(years, years + 1)]
+    if isinstance(years, tuple):
+        return [(years[0], years[1] + 1)]
+    if isinstance(years, range) and years.step == 1:
+        return [(years.start, years.stop)]
+    return [(year, year + 1) for year in sorted(set(years))]
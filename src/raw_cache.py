@@ -0,0 +1,184 @@
+import os
+import json
+import hashlib
+import shutil
+import numpy as np
+import pandas as pd
+
+# DEFINICIÓN DE DIRECTORIOS
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+CACHE_PATH = os.path.join(BASE_DIR, "data", "cache")
+
+# VERSIÓN DEL FORMATO DE LA CACHÉ. SI CAMBIA, TODAS LAS ENTRADAS ANTERIORES QUEDAN INVALIDADAS
+CACHE_FORMAT_VERSION = 1
+
+
+def file_signature(path, with_hash=True):
+    '''
+    Devuelve la firma de un archivo: tamaño, fecha de modificación (en nanosegundos) y, si se pide,
+    el hash SHA-256 de su contenido.
+    '''
+
+    stat = os.stat(path)
+    signature = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    if with_hash:
+        signature["sha256"] = file_hash(path)
+    return signature
+
+
+def file_hash(path):
+    '''
+    Calcula el hash SHA-256 del contenido de un archivo, leyéndolo por bloques.
+    '''
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_csv_cached(path, cache_dir=None, **read_csv_kwargs):
+    '''
+    Lee un CSV a través de la caché binaria columnar. Cada dataset se guarda en un directorio propio
+    dentro de data/cache, con un archivo .npy por columna y un meta.json con la firma del CSV de
+    origen (tamaño, fecha de modificación y hash del contenido) y los parámetros de lectura.
+    - Si el tamaño y la fecha coinciden con la firma guardada, se usa la caché sin hashear el CSV.
+    - Si no coinciden pero el hash del contenido es el mismo (por ejemplo, el archivo sólo se copió
+      o se tocó), se actualiza la firma y se usa la caché.
+    - En cualquier otro caso la entrada está obsoleta: se parsea el CSV y se regenera la caché.
+    Las columnas numéricas se abren como memmap, sin parsear texto. Las columnas de texto se guardan
+    como códigos enteros más la lista de categorías únicas.
+    '''
+
+    cache_dir = cache_dir or CACHE_PATH
+    entry_dir = os.path.join(cache_dir, _entry_name(path))
+    meta_path = os.path.join(entry_dir, "meta.json")
+    params = _params_key(read_csv_kwargs)
+
+    meta = _read_meta(meta_path)
+    if meta is not None and meta["version"] == CACHE_FORMAT_VERSION and meta["params"] == params:
+        signature = file_signature(path, with_hash=False)
+        if signature["size"] == meta["source"]["size"] and signature["mtime_ns"] == meta["source"]["mtime_ns"]:
+            return _load_entry(entry_dir, meta)
+        if signature["size"] == meta["source"]["size"] and file_hash(path) == meta["source"]["sha256"]:
+            meta["source"]["mtime_ns"] = signature["mtime_ns"]
+            _write_meta(meta_path, meta)
+            return _load_entry(entry_dir, meta)
+
+    # ENTRADA INEXISTENTE U OBSOLETA: SE PARSEA EL CSV Y SE REGENERA LA CACHÉ
+    df = pd.read_csv(path, **read_csv_kwargs)
+    _write_entry(entry_dir, df, file_signature(path), params)
+    return df
+
+
+def clear_cache(cache_dir=None):
+    '''
+    Elimina todas las entradas de la caché.
+    '''
+
+    shutil.rmtree(cache_dir or CACHE_PATH, ignore_errors=True)
+
+
+def _entry_name(path):
+    '''
+    Nombre del directorio de caché de un CSV: el nombre del archivo sin espacios más un hash corto de
+    la ruta absoluta, para que dos archivos con el mismo nombre en distintas carpetas no colisionen.
+    '''
+
+    base = os.path.splitext(os.path.basename(path))[0].replace(" ", "_")
+    path_hash = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:8]
+    return f"{base}-{path_hash}"
+
+
+def _params_key(read_csv_kwargs):
+    '''
+    Representación estable de los parámetros de lectura, para invalidar la caché si cambian.
+    '''
+
+    return json.dumps(read_csv_kwargs, sort_keys=True, default=str)
+
+
+def _read_meta(meta_path):
+    if not os.path.exists(meta_path):
+        return None
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(meta_path, meta):
+    tmp_path = meta_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, meta_path)
+
+
+def _write_entry(entry_dir, df, signature, params):
+    '''
+    Escribe un DataFrame en la caché. El meta.json se escribe al final y funciona como marca de que
+    la entrada está completa: si el proceso se interrumpe a mitad de camino, la entrada no se usa.
+    '''
+
+    os.makedirs(entry_dir, exist_ok=True)
+    meta_path = os.path.join(entry_dir, "meta.json")
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+
+    meta = {"version": CACHE_FORMAT_VERSION, "source": signature, "params": params, "columns": write_columns(entry_dir, df)}
+    _write_meta(meta_path, meta)
+
+
+def _load_entry(entry_dir, meta):
+    return read_columns(entry_dir, meta["columns"])
+
+
+def write_columns(directory, df):
+    '''
+    Guarda cada columna de df en "directory" en formato columnar: un .npy por columna numérica y, para
+    las de texto y las categóricas, un .npy con los códigos enteros y otro con las categorías. Devuelve
+    la descripción de las columnas que necesita read_columns() para reconstruir el DataFrame.
+    '''
+
+    columns = []
+    for i, column in enumerate(df.columns):
+        values = df[column]
+        if values.dtype.kind in "biuf":
+            np.save(os.path.join(directory, f"{i}.npy"), values.to_numpy())
+            columns.append({"name": column, "kind": "numeric"})
+        elif isinstance(values.dtype, pd.CategoricalDtype):
+            # COLUMNAS CATEGÓRICAS: SUS PROPIOS CÓDIGOS Y CATEGORÍAS, PARA CONSERVAR EL ORDEN DE LAS CATEGORÍAS
+            np.save(os.path.join(directory, f"{i}.codes.npy"), values.cat.codes.to_numpy().astype(np.int32))
+            np.save(os.path.join(directory, f"{i}.categories.npy"), np.asarray(values.cat.categories, dtype=str))
+            columns.append({"name": column, "kind": "category"})
+        else:
+            # COLUMNAS DE TEXTO: CÓDIGOS ENTEROS (-1 PARA NULOS) Y CATEGORÍAS ÚNICAS
+            codes, categories = pd.factorize(values, use_na_sentinel=True)
+            np.save(os.path.join(directory, f"{i}.codes.npy"), codes.astype(np.int32))
+            np.save(os.path.join(directory, f"{i}.categories.npy"), np.asarray(categories, dtype=str))
+            columns.append({"name": column, "kind": "text"})
+    return columns
+
+
+def read_columns(directory, columns):
+    '''
+    Reconstruye el DataFrame que escribió write_columns(), abriendo los .npy como memmap.
+    '''
+
+    data = {}
+    for i, column in enumerate(columns):
+        if column["kind"] == "numeric":
+            data[column["name"]] = np.load(os.path.join(directory, f"{i}.npy"), mmap_mode="r")
+        elif column["kind"] == "category":
+            codes = np.load(os.path.join(directory, f"{i}.codes.npy"))
+            categories = np.load(os.path.join(directory, f"{i}.categories.npy")).astype(object)
+            data[column["name"]] = pd.Categorical.from_codes(codes, categories=categories)
+        else:
+            codes = np.load(os.path.join(directory, f"{i}.codes.npy"), mmap_mode="r")
+            categories = np.load(os.path.join(directory, f"{i}.categories.npy")).astype(object)
+            values = categories.take(codes) if len(categories) else np.empty(len(codes), dtype=object)
+            values[np.asarray(codes) == -1] = np.nan
+            data[column["name"]] = values
+    return pd.DataFrame(data)
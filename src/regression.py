@@ -0,0 +1,352 @@
+import warnings
+import numpy as np
+import pandas as pd
+
+# NIVEL DE CONFIANZA POR DEFECTO DE LOS INTERVALOS DE LOS COEFICIENTES
+CONFIDENCE = 0.95
+
+# TOLERANCIA RELATIVA CON LA QUE grouped_regressions CONSIDERA QUE x NO VARÍA EN UN GRUPO
+CONSTANT_TOLERANCE = 1e-20
+
+# CRITERIO DE CONVERGENCIA (CAMBIO MÁXIMO RELATIVO A LA ESCALA DE CADA COLUMNA) Y MÁXIMO DE ITERACIONES
+# DE LA TRANSFORMACIÓN WITHIN CON VARIOS EFECTOS FIJOS (VER _within)
+WITHIN_TOLERANCE = 1e-10
+WITHIN_MAX_ITERATIONS = 1_000
+
+# NOMBRE DE LA ORDENADA AL ORIGEN EN LAS TABLAS DE COEFICIENTES (COMO EN statsmodels)
+CONSTANT = "const"
+
+
+class RegressionResult:
+    '''
+    Regresión lineal simple por mínimos cuadrados de una o varias columnas y_cols sobre una misma
+    columna x_col, ajustadas todas a la vez en forma cerrada (ver least_squares). Es el único ajuste
+    que usan la regresión, el estudio de residuos y los tests de hipótesis de stats.py:
+
+    - params, stderr, tvalues y pvalues: tablas con una fila por coeficiente ("const" y x_col) y una
+      columna por cada y.
+    - rsquared y residual_std: Series con un valor por cada y.
+    - fitted y residuals: DataFrames con los valores predichos y los residuos de cada y, con el
+      índice de los datos.
+    - conf_int(): extremos inferior y superior del intervalo de confianza de cada coeficiente.
+
+    Los errores estándar, los estadísticos t y los p-valores (bilaterales) son los de MCO con
+    n - 2 grados de libertad, los mismos que sm.OLS(y, sm.add_constant(x)).
+    '''
+
+    def __init__(self, df, x_col, y_cols):
+        self.x_col = x_col
+        self.y_cols = list(y_cols)
+        self.nobs = len(df)
+        self.df_resid = self.nobs - 2
+
+        # UNA FILA POR CADA y: LAS OPERACIONES VAN A LO LARGO DEL ÚLTIMO EJE, CON x DIFUNDIDA
+        x = df[x_col].to_numpy(dtype=np.float64)
+        y = df[self.y_cols].to_numpy(dtype=np.float64).T
+        intercept, slope, rsquared = least_squares(x, y)
+        fitted = intercept[:, None] + slope[:, None] * x
+        residuals = y - fitted
+
+        x_centered = x - x.mean()
+        sxx = x_centered @ x_centered
+        variance = (residuals * residuals).sum(axis=1) / self.df_resid
+        stderr = np.stack([np.sqrt(variance * (1 / self.nobs + x.mean() ** 2 / sxx)), np.sqrt(variance / sxx)])
+
+        coefficients = [CONSTANT, x_col]
+        self.params = pd.DataFrame(np.stack([intercept, slope]), index=coefficients, columns=self.y_cols)
+        self.stderr = pd.DataFrame(stderr, index=coefficients, columns=self.y_cols)
+        self.tvalues = self.params / self.stderr
+        self.pvalues = pd.DataFrame(2 * _t_sf(np.abs(self.tvalues.to_numpy()), self.df_resid), index=coefficients, columns=self.y_cols)
+        self.rsquared = pd.Series(rsquared, index=self.y_cols)
+        self.residual_std = pd.Series(np.sqrt(variance), index=self.y_cols)
+        self.fitted = pd.DataFrame(fitted.T, index=df.index, columns=self.y_cols)
+        self.residuals = pd.DataFrame(residuals.T, index=df.index, columns=self.y_cols)
+
+    def conf_int(self, confidence=CONFIDENCE):
+        '''
+        Devuelve dos tablas (inferior, superior), con la forma de params, con los extremos del
+        intervalo de confianza de cada coeficiente.
+        '''
+
+        margin = self.stderr * _t_ppf(1 - (1 - confidence) / 2, self.df_resid)
+        return self.params - margin, self.params + margin
+
+    def values(self, y_col):
+        '''
+        Resultados de la regresión de y_col en el formato de las secciones de context.results (ver
+        results.py).
+        '''
+
+        low, high = self.conf_int()
+        return {"variable explicativa": self.x_col, "variable explicada": y_col,
+                "pendiente": self.params.loc[self.x_col, y_col], "ordenada al origen": self.params.loc[CONSTANT, y_col],
+                "error estándar de la pendiente": self.stderr.loc[self.x_col, y_col], "p-valor de la pendiente": self.pvalues.loc[self.x_col, y_col],
+                f"intervalo de confianza {CONFIDENCE:.0%} de la pendiente": [low.loc[self.x_col, y_col], high.loc[self.x_col, y_col]],
+                "R²": self.rsquared[y_col], "desviación estándar de los residuos": self.residual_std[y_col], "observaciones": self.nobs}
+
+    def summary(self, y_col, confidence=CONFIDENCE):
+        '''
+        Tabla de texto con los coeficientes de la regresión de y_col, sus errores estándar,
+        estadísticos t, p-valores e intervalos de confianza, más el R² y las observaciones.
+        '''
+
+        low, high = self.conf_int(confidence)
+        alpha = (1 - confidence) / 2
+        width = max(len(CONSTANT), len(self.x_col))
+        rsquared = self.rsquared[y_col]
+        lines = [f"Regresión lineal por MCO: {y_col} ~ {self.x_col}",
+                 f"Observaciones: {self.nobs}   R²: {rsquared:.3f}   R² ajustado: {1 - (1 - rsquared) * (self.nobs - 1) / self.df_resid:.3f}",
+                 f"{'':<{width}}  {'coef':>12} {'error est.':>12} {'t':>9} {'P>|t|':>8} {f'[{alpha:.3f}':>12} {f'{1 - alpha:.3f}]':>12}"]
+        for coefficient in self.params.index:
+            lines.append(f"{coefficient:<{width}}  {self.params.loc[coefficient, y_col]:>12.4f} {self.stderr.loc[coefficient, y_col]:>12.4f} "
+                         f"{self.tvalues.loc[coefficient, y_col]:>9.3f} {self.pvalues.loc[coefficient, y_col]:>8.3f} "
+                         f"{low.loc[coefficient, y_col]:>12.4f} {high.loc[coefficient, y_col]:>12.4f}")
+        return "\n".join(lines)
+
+
+class PanelRegressionResult:
+    '''
+    Regresión lineal de panel de y_col sobre x_cols con efectos fijos (por ejemplo, de país y de año)
+    y errores estándar agrupados por conglomerado (por defecto, el primer efecto fijo). En lugar de una
+    columna indicadora por país y por año, los efectos fijos se absorben con la transformación within:
+    a cada columna se le resta su media en cada grupo, con np.bincount sobre los códigos de los grupos
+    (ver _within). Con un solo efecto fijo basta una pasada; con varios, las pasadas se alternan hasta
+    que los datos dejan de cambiar (proyecciones alternadas), lo que da los mismos coeficientes que la
+    regresión con todas las indicadoras.
+    Se usan las filas con dato en y_col y en todas las x_cols. Los grupos con una sola fila (que sus
+    efectos fijos ajustan exactamente) se descartan antes de ajustar, repetidamente si hace falta.
+    - params, stderr, tvalues y pvalues: Series con un valor por cada x.
+    - rsquared_within: R² de los datos transformados, sin la parte que explican los efectos fijos.
+    - nobs, groups (cantidad de grupos de cada efecto fijo), clusters y df_resid.
+    La matriz de covarianza es la agrupada (sándwich), con la corrección G / (G - 1) · (N - 1) / (N - K)
+    de la regresión con todas las indicadoras (la de statsmodels con cov_type="cluster"): K cuenta las
+    x y todos los efectos fijos absorbidos (cantidad de países + cantidad de años - 1), también los
+    anidados en los conglomerados. Stata (xtreg, fe y reghdfe) no cuenta estos últimos, de modo que sus
+    errores estándar son algo menores. Los p-valores (bilaterales) y los intervalos usan una t de
+    Student con G - 1 grados de libertad.
+    '''
+
+    def __init__(self, df, y_col, x_cols, fixed_effects, cluster_col):
+        self.y_col = y_col
+        self.x_cols = list(x_cols)
+        self.fixed_effects = list(fixed_effects)
+        self.cluster_col = cluster_col
+
+        rows = df[[y_col] + self.x_cols + list(dict.fromkeys(self.fixed_effects + [cluster_col]))].dropna()
+        codes = [pd.factorize(rows[column])[0] for column in self.fixed_effects]
+        keep = _drop_singletons(codes)
+        rows = rows[keep]
+        codes = [pd.factorize(code[keep])[0] for code in codes]
+        clusters = pd.factorize(rows[cluster_col])[0]
+
+        # y Y LAS x, SIN LOS EFECTOS FIJOS
+        data = _within(rows[[y_col] + self.x_cols].to_numpy(dtype=np.float64), codes)
+        y, x = data[:, 0], data[:, 1:]
+        xtx_inverse = np.linalg.inv(x.T @ x)
+        params = xtx_inverse @ (x.T @ y)
+        residuals = y - x @ params
+
+        self.nobs = len(rows)
+        self.groups = {column: int(code.max()) + 1 for column, code in zip(self.fixed_effects, codes)}
+        self.clusters = int(clusters.max()) + 1
+        # COLUMNAS INDICADORAS QUE REEMPLAZA LA TRANSFORMACIÓN WITHIN: UNA POR GRUPO, MENOS UNA POR CADA
+        # EFECTO FIJO ADICIONAL (QUE SERÍA COLINEAL CON EL PRIMERO)
+        absorbed = sum(self.groups.values()) - (len(self.fixed_effects) - 1)
+        self.df_resid = self.clusters - 1
+
+        # SÁNDWICH AGRUPADO: LAS CONTRIBUCIONES x · residuo SE SUMAN POR CONGLOMERADO
+        scores = np.stack([np.bincount(clusters, weights=x[:, j] * residuals, minlength=self.clusters) for j in range(x.shape[1])], axis=1)
+        correction = self.clusters / (self.clusters - 1) * (self.nobs - 1) / (self.nobs - len(self.x_cols) - absorbed)
+        covariance = correction * xtx_inverse @ (scores.T @ scores) @ xtx_inverse
+
+        self.params = pd.Series(params, index=self.x_cols)
+        self.stderr = pd.Series(np.sqrt(np.diag(covariance)), index=self.x_cols)
+        self.tvalues = self.params / self.stderr
+        self.pvalues = pd.Series(2 * _t_sf(np.abs(self.tvalues.to_numpy()), self.df_resid), index=self.x_cols)
+        self.rsquared_within = 1 - residuals @ residuals / (y @ y)
+
+    def conf_int(self, confidence=CONFIDENCE):
+        '''
+        Devuelve dos Series (inferior, superior) con los extremos del intervalo de confianza de cada
+        coeficiente.
+        '''
+
+        margin = self.stderr * _t_ppf(1 - (1 - confidence) / 2, self.df_resid)
+        return self.params - margin, self.params + margin
+
+    def values(self):
+        '''
+        Resultados de la regresión en el formato de las secciones de context.results (ver results.py).
+        '''
+
+        low, high = self.conf_int()
+        return {"variable explicada": self.y_col, "efectos fijos": self.fixed_effects, "conglomerados": self.cluster_col,
+                "coeficientes": {x_col: {"coeficiente": self.params[x_col], "error estándar agrupado": self.stderr[x_col],
+                                         "p-valor": self.pvalues[x_col],
+                                         f"intervalo de confianza {CONFIDENCE:.0%}": [low[x_col], high[x_col]]} for x_col in self.x_cols},
+                "R² within": self.rsquared_within, "observaciones": self.nobs, "grupos": self.groups, "cantidad de conglomerados": self.clusters}
+
+    def summary(self, confidence=CONFIDENCE):
+        '''
+        Tabla de texto con los coeficientes, sus errores estándar agrupados, estadísticos t, p-valores
+        e intervalos de confianza, más el R² within, las observaciones y los grupos.
+        '''
+
+        low, high = self.conf_int(confidence)
+        alpha = (1 - confidence) / 2
+        width = max(len(x_col) for x_col in self.x_cols)
+        groups = ", ".join(f"{column}: {count}" for column, count in self.groups.items())
+        lines = [f"Regresión de panel con efectos fijos ({', '.join(self.fixed_effects)}): {self.y_col} ~ {' + '.join(self.x_cols)}",
+                 f"Observaciones: {self.nobs}   Grupos: {groups}   R² within: {self.rsquared_within:.3f}",
+                 f"Errores estándar agrupados por {self.cluster_col} ({self.clusters} conglomerados)",
+                 f"{'':<{width}}  {'coef':>12} {'error est.':>12} {'t':>9} {'P>|t|':>8} {f'[{alpha:.3f}':>12} {f'{1 - alpha:.3f}]':>12}"]
+        for x_col in self.x_cols:
+            lines.append(f"{x_col:<{width}}  {self.params[x_col]:>12.4f} {self.stderr[x_col]:>12.4f} {self.tvalues[x_col]:>9.3f} "
+                         f"{self.pvalues[x_col]:>8.3f} {low[x_col]:>12.4f} {high[x_col]:>12.4f}")
+        return "\n".join(lines)
+
+
+def fit_regression(df, x_col, y_cols):
+    '''
+    Ajusta la regresión lineal de y_cols (una columna o una lista de columnas) sobre x_col, con las
+    filas de df, que no deben tener nulos en esas columnas. Devuelve un RegressionResult.
+    '''
+
+    return RegressionResult(df, x_col, [y_cols] if isinstance(y_cols, str) else y_cols)
+
+
+def grouped_regressions(df, group_col, x_cols, y_cols, min_observations=3):
+    '''
+    Ajusta a la vez una regresión lineal simple por cada grupo de filas de df (por ejemplo, cada
+    país) y cada par (x, y) de x_cols × y_cols, con las filas del grupo en las que x e y tienen dato:
+    cada grupo puede cubrir años distintos y tener nulos distintos en cada columna.
+    En lugar de un ajuste por grupo, todas las regresiones salen de estadísticos suficientes
+    agrupados (conteo, medias y sumas de cuadrados y productos cruzados centrados de cada celda
+    par x grupo), que se acumulan con np.bincount en dos pasadas sobre las filas.
+    Devuelve una tabla con una fila por grupo y par con al menos "min_observations" filas: el grupo,
+    las dos variables, las observaciones, la pendiente, la ordenada al origen, el R², el error
+    estándar y el p-valor (bilateral) de la pendiente. Las regresiones en las que x no varía tienen
+    pendiente NaN.
+    '''
+
+    x_cols = [x_cols] if isinstance(x_cols, str) else list(x_cols)
+    y_cols = [y_cols] if isinstance(y_cols, str) else list(y_cols)
+    codes, groups = pd.factorize(df[group_col], sort=True)
+    pairs = [(x_col, y_col) for x_col in x_cols for y_col in y_cols if x_col != y_col]
+
+    # UNA COLUMNA POR PAR; CADA DATO VA A LA CELDA par * GRUPOS + GRUPO
+    x = df[[x_col for x_col, _ in pairs]].to_numpy(dtype=np.float64, na_value=np.nan)
+    y = df[[y_col for _, y_col in pairs]].to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = ~np.isnan(x) & ~np.isnan(y) & (codes >= 0)[:, None]
+    cells = (np.arange(len(pairs)) * len(groups) + codes[:, None])[valid]
+    x, y = x[valid], y[valid]
+    size = len(pairs) * len(groups)
+
+    # PRIMERA PASADA: CONTEO Y MEDIAS DE CADA CELDA. SEGUNDA: SUMAS CENTRADAS EN ESAS MEDIAS
+    count = np.bincount(cells, minlength=size)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_x = np.bincount(cells, weights=x, minlength=size) / count
+        mean_y = np.bincount(cells, weights=y, minlength=size) / count
+        dx, dy = x - mean_x[cells], y - mean_y[cells]
+        sxx = np.bincount(cells, weights=dx * dx, minlength=size)
+        sxy = np.bincount(cells, weights=dx * dy, minlength=size)
+        syy = np.bincount(cells, weights=dy * dy, minlength=size)
+
+        # x ES CONSTANTE EN LA CELDA SI SU SUMA DE CUADRADOS ES DEL ORDEN DEL ERROR DE REDONDEO DE SU MEDIA
+        varies = sxx > CONSTANT_TOLERANCE * count * mean_x * mean_x
+        slope = np.where(varies, sxy / sxx, np.nan)
+        df_resid = count - 2
+        residual_variance = np.maximum(syy - slope * sxy, 0) / df_resid
+        stderr = np.sqrt(residual_variance / sxx)
+        pvalue = 2 * _t_sf(np.abs(slope / stderr), df_resid)
+        rsquared = sxy * sxy / (sxx * syy)
+
+    table = pd.DataFrame({
+        group_col: np.tile(groups, len(pairs)),
+        "variable explicativa": np.repeat([x_col for x_col, _ in pairs], len(groups)),
+        "variable explicada": np.repeat([y_col for _, y_col in pairs], len(groups)),
+        "observaciones": count,
+        "pendiente": slope,
+        "ordenada al origen": mean_y - slope * mean_x,
+        "R²": rsquared,
+        "error estándar de la pendiente": stderr,
+        "p-valor de la pendiente": pvalue
+    })
+    return table[count >= min_observations].reset_index(drop=True)
+
+
+def fit_panel_regression(df, y_col, x_cols, fixed_effects=("País", "Año"), cluster_col=None):
+    '''
+    Ajusta la regresión de panel de y_col sobre x_cols (una columna o una lista de columnas) con los
+    efectos fijos de las columnas "fixed_effects" y errores estándar agrupados por "cluster_col" (por
+    defecto, el primer efecto fijo), con las filas de df, que puede tener nulos (por ejemplo, el panel
+    país-año de panel.py). Devuelve un PanelRegressionResult.
+    '''
+
+    fixed_effects = [fixed_effects] if isinstance(fixed_effects, str) else list(fixed_effects)
+    return PanelRegressionResult(df, y_col, [x_cols] if isinstance(x_cols, str) else x_cols, fixed_effects, cluster_col or fixed_effects[0])
+
+
+def least_squares(x, y):
+    '''
+    Ordenada al origen, pendiente y R² de la regresión lineal de y sobre x en forma cerrada, a lo
+    largo del último eje. x e y se difunden entre sí, de modo que la misma función ajusta varias y
+    contra una misma x (y de forma (k, n) y x de forma (n,)) o un lote de remuestras (x e y de forma
+    (B, n), ver bootstrap.py).
+    '''
+
+    x_centered = x - x.mean(axis=-1, keepdims=True)
+    y_centered = y - y.mean(axis=-1, keepdims=True)
+    sxx = (x_centered * x_centered).sum(axis=-1)
+    sxy = (x_centered * y_centered).sum(axis=-1)
+    syy = (y_centered * y_centered).sum(axis=-1)
+    slope = sxy / sxx
+    intercept = y.mean(axis=-1) - slope * x.mean(axis=-1)
+    return intercept, slope, sxy * sxy / (sxx * syy)
+
+
+def _t_sf(t, df):
+    # FUNCIÓN DE SUPERVIVENCIA DE LA t DE STUDENT. SCIPY SE IMPORTA AL AJUSTAR, NO AL IMPORTAR ESTE MÓDULO
+    from scipy.special import stdtr
+    return stdtr(df, -t)
+
+
+def _t_ppf(q, df):
+    from scipy.special import stdtrit
+    return stdtrit(df, q)
+
+
+def _drop_singletons(codes):
+    # FILAS QUE QUEDAN AL DESCARTAR LOS GRUPOS CON UNA SOLA FILA DE CADA EFECTO FIJO. DESCARTAR UNA FILA
+    # PUEDE DEJAR SOLO A OTRO GRUPO DE OTRO EFECTO FIJO, DE MODO QUE SE REPITE HASTA QUE NO CAMBIE NADA
+    keep = np.ones(len(codes[0]) if codes else 0, dtype=bool)
+    while True:
+        singleton = np.zeros_like(keep)
+        for code in codes:
+            singleton |= keep & (np.bincount(code, weights=keep)[code] == 1)
+        if not singleton.any():
+            return keep
+        keep &= ~singleton
+
+
+def _within(data, codes):
+    # RESTA A CADA COLUMNA DE data SU MEDIA EN CADA GRUPO DE CADA EFECTO FIJO (SUMAS Y CONTEOS POR GRUPO CON
+    # np.bincount). CON VARIOS EFECTOS FIJOS SE ALTERNA HASTA QUE EL CAMBIO MÁXIMO ES DESPRECIABLE
+    data = data - data.mean(axis=0)
+    counts = [np.bincount(code) for code in codes]
+    scale = np.maximum(np.abs(data).max(axis=0), np.finfo(np.float64).tiny)
+    for _ in range(WITHIN_MAX_ITERATIONS if len(codes) > 1 else 1):
+        change = np.zeros(data.shape[1])
+        for code, count in zip(codes, counts):
+            for j in range(data.shape[1]):
+                means = np.bincount(code, weights=data[:, j], minlength=len(count)) / count
+                data[:, j] -= means[code]
+                change[j] = max(change[j], np.abs(means).max())
+        if (change <= WITHIN_TOLERANCE * scale).all():
+            return data
+    # CON UN SOLO EFECTO FIJO UNA PASADA ES EXACTA; CON VARIOS, LOS COEFICIENTES PUEDEN NO SER LOS DE LA
+    # REGRESIÓN CON INDICADORAS SI LAS PASADAS NO CONVERGIERON
+    if len(codes) > 1:
+        warnings.warn(f"La transformación within no convergió en {WITHIN_MAX_ITERATIONS} iteraciones "
+                      f"(cambio máximo relativo {(change / scale).max():.1e})", RuntimeWarning, stacklevel=4)
+    return data
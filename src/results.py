@@ -0,0 +1,97 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+from incremental import register_output
+
+# DEFINICIÓN DE DIRECTORIOS
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+RESULTS_PATH = os.path.join(BASE_DIR, "data", "results")
+
+
+class StatsResults:
+    '''
+    Resultados numéricos del análisis estadístico en formato legible por máquina: estadísticas
+    descriptivas, matriz de correlación, coeficientes y R² de las regresiones y coeficiente, p-valor
+    e intervalo de confianza de cada test de hipótesis. Cada parte del análisis guarda sus
+    resultados con add() en su propia sección, que se escribe enseguida en
+    data/results/secciones/<sección>.json y se registra como salida de la etapa incremental en curso.
+    Así, cuando una etapa se omite en una ejecución incremental, load() recupera sus resultados del
+    disco. write() reúne todas las secciones en data/results/stats.json.
+    '''
+
+    def __init__(self, directory=None):
+        self.directory = directory or RESULTS_PATH
+        self.sections = {}
+
+    def add(self, section, values):
+        '''
+        Guarda "values" (un dict cuyos valores pueden ser escalares, Series, DataFrames o arrays) en
+        la sección "section", en memoria y en disco. Los NaN se guardan como null.
+        '''
+
+        values = _json_value(values)
+        self.sections[section] = values
+        path = self._section_path(section)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(values, f, ensure_ascii=False, indent=1, allow_nan=False)
+        register_output(path)
+        return values
+
+    def load(self, section):
+        '''
+        Lee del disco una sección guardada en una ejecución anterior (None si no existe).
+        '''
+
+        path = self._section_path(section)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            self.sections[section] = json.load(f)
+        return self.sections[section]
+
+    def write(self):
+        '''
+        Escribe todas las secciones, en el orden en que se agregaron, en data/results/stats.json.
+        Devuelve la ruta del archivo.
+        '''
+
+        path = os.path.join(self.directory, "stats.json")
+        os.makedirs(self.directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.sections, f, ensure_ascii=False, indent=1, allow_nan=False)
+        return path
+
+    def _section_path(self, section):
+        safe_section = "".join(c if c.isalnum() or c in "-_." else "_" for c in section)
+        return os.path.join(self.directory, "secciones", f"{safe_section}.json")
+
+
+def description_values(table):
+    '''
+    Convierte la tabla de describe_slices() (ver describe.py) en un dict {recorte: {variable:
+    {estadística: valor}}}.
+    '''
+
+    values = {}
+    for (name, variable), row in table.iterrows():
+        values.setdefault(str(name), {})[str(variable)] = row.to_dict()
+    return values
+
+
+def _json_value(value):
+    # CONVIERTE RECURSIVAMENTE A TIPOS DE PYTHON SERIALIZABLES EN JSON; LOS NaN PASAN A None
+    if isinstance(value, dict):
+        return {str(key): _json_value(item) for key, item in value.items()}
+    if isinstance(value, pd.DataFrame):
+        return {str(column): _json_value(value[column].to_dict()) for column in value.columns}
+    if isinstance(value, pd.Series):
+        return _json_value(value.to_dict())
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_json_value(item) for item in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
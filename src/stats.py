@@ -2,14 +2,32 @@
 import pandas as pd
 import numpy as np
 import os
-import matplotlib.pyplot as plt
-import seaborn as sns
-import scipy.stats as stats
-import statsmodels.api as sm
-import statsmodels.api as sm
-from scipy import stats
-from scipy.stats import zscore
-from sklearn.linear_model import LinearRegression
+from etl import DatasetContext, load_processed_data
+from incremental import run_if_changed, register_output
+import figure_render
+import density
+import profiling
+from profiling import ProfileReport
+import describe
+import dtype_optimizer
+from describe import describe_slices, print_description
+import results
+import bootstrap
+import regression
+import correlation
+import permutation
+from correlation import panel_correlations
+from regression import fit_regression, fit_panel_regression, grouped_regressions
+from bootstrap import regression_intervals, correlation_intervals
+from permutation import regression_permutation_tests, BLOCK_SIZE
+from process_pool import start_process_pool, close_process_pool
+from results import StatsResults, description_values
+import aggregate_cube
+from aggregate_cube import run_aggregate_cube
+import query
+from query import run_dataset_index
+from panel import run_panel
+from figure_render import start_render_pool, close_render_pool, submit_figure, draw_distribution, draw_correlation_matrix, draw_regression, draw_residue
 
 # DEFINICIÓN DE DIRECTORIOS
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
@@ -17,7 +35,7 @@ PROCESSED_PATH = os.path.join(BASE_DIR, "data", "processed")
 FIGURES_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "figures")
 
 
-def run_stats() :
+def run_stats(context=None, incremental=True, workers=None, headless=False) :
     '''
     Realiza un análisis estadístico descriptivo e inferencial de los datasets. Calcula parámetros de
     tendencia central (media, mediana, moda) y de dispersión (rango, varianza, desviación estándar, 
@@ -35,35 +53,92 @@ def run_stats() :
     Al igual que en eda.py, son seis funciones de análisis estadístico, uno para cada 
     dataset, pues la estructura de cada uno es similar pero no exactamente igual. Las seis funciones
     de análisis estadístico son muy similares entre sí. 
+    Recibe el DatasetContext que ya pasó por run_eda(), de modo que no se vuelven a leer los CSV de
+    data/processed. Los promedios y totales por país o por año se consultan en el cubo de agregados
+    del contexto (ver aggregate_cube.py) y los recortes de un país o de un año se piden con select() a
+    su índice (País, Año) (ver query.py); ambos se construyen aquí si todavía no existen, al igual que
+    el panel país-año.
+    Con incremental=True se omiten las funciones, gráficos y regresiones cuyas entradas no cambiaron
+    desde la ejecución anterior (ver incremental.py).
+    Con workers>1 se crea un único pool de "workers" procesos (ver process_pool.py): cada gráfico se
+    convierte en un trabajo que se dibuja en él mientras continúa el análisis (ver figure_render.py), y
+    los intervalos bootstrap y los tests de permutaciones de stats_inferential reparten allí sus
+    remuestras (ver bootstrap.py y permutation.py). Los .png son idénticos a los del modo en serie
+    (workers=None). Aunque una función se vuelva a ejecutar, los gráficos cuyos datos y
+    parámetros no cambiaron no se vuelven a dibujar (ver la caché de figuras de figure_render.py).
+    Todos los resultados numéricos (estadísticas descriptivas, matriz de correlación, regresiones y
+    tests de hipótesis) quedan en context.results y en data/results/stats.json (ver results.py). Con
+    headless=True sólo se calculan esos resultados: no se dibuja ningún gráfico ni se importan
+    matplotlib ni seaborn. Las ejecuciones incrementales con y sin gráficos se registran por separado,
+    para que una no invalide a la otra. Devuelve context.results.
     '''
 
-    # CARGA DE LOS DATASETS YA LIMPIOS
-    vaccination_coverage = pd.read_csv(os.path.join(PROCESSED_PATH, 'vaccination_coverage_processed.csv'))
-    life_expectancy = pd.read_csv(os.path.join(PROCESSED_PATH, 'life_expectancy_processed.csv'))
-    child_mortality = pd.read_csv(os.path.join(PROCESSED_PATH, 'child_mortality_processed.csv'))
-    preventable_deaths = pd.read_csv(os.path.join(PROCESSED_PATH, 'preventable_deaths_processed.csv'))
-    literacy = pd.read_csv(os.path.join(PROCESSED_PATH, 'literacy_processed.csv'))
-    gdp = pd.read_csv(os.path.join(PROCESSED_PATH, 'gdp_processed.csv'))
+    # SI NO SE RECIBE UN CONTEXTO (EJECUCIÓN SÓLO DE ESTADÍSTICA), SE CARGAN UNA VEZ LOS DATASETS YA LIMPIOS
+    if context is None or not context.processed:
+        context = context if context is not None else DatasetContext()
+        context.processed.update(load_processed_data())
+    if context.index is None:
+        run_dataset_index(context, verbose=False)
+    if context.aggregates is None:
+        run_aggregate_cube(context, verbose=False)
+    if context.panel is None:
+        run_panel(context, incremental=incremental, verbose=False)
+    context.results = StatsResults()
+    mode = "_headless" if headless else ""
     
-    # LLAMADA A LAS FUNCIONES DE ESTADÍSTICA
-    stats_vaccination_coverage(vaccination_coverage)
-    stats_life_expectancy(life_expectancy)
-    stats_child_mortality(child_mortality)
-    stats_preventable_deaths(preventable_deaths)
-    stats_literacy(literacy)
-    stats_gdp(gdp)
-    stats_inferential(vaccination_coverage, life_expectancy, preventable_deaths, literacy, child_mortality, gdp)
+    # LLAMADA A LAS FUNCIONES DE ESTADÍSTICA. CON INCREMENTAL=TRUE, CADA FUNCIÓN SÓLO SE VUELVE A
+    # EJECUTAR SI CAMBIÓ SU DATASET O SU CÓDIGO; SI NO, SE REUTILIZAN SUS GRÁFICOS Y SU SALIDA
+    stages = {
+        "vaccination_coverage": stats_vaccination_coverage,
+        "life_expectancy": stats_life_expectancy,
+        "child_mortality": stats_child_mortality,
+        "preventable_deaths": stats_preventable_deaths,
+        "literacy": stats_literacy,
+        "gdp": stats_gdp
+    }
+    start_process_pool(workers)
+    start_render_pool(headless=headless)
+    try:
+        for name, stats_function in stages.items():
+            parts = [context.processed[name], stats_function, figure_render, density, describe, dtype_optimizer, aggregate_cube, query, results] + ([impute_vaccination_coverage, profiling, context.verbosity] if name == "vaccination_coverage" else [])
+            ran, _ = run_if_changed(f"stats_{name}{mode}", parts, lambda: stats_function(context), enabled=incremental)
+            if not ran:
+                context.results.load(name)
+
+            # EL DATASET DE VACUNACIÓN SIN NULOS LO GENERA stats_vaccination_coverage Y LO USA stats_inferential
+            if name == "vaccination_coverage" and not ran:
+                context.processed["vaccination_coverage_sin_nulos"] = impute_vaccination_coverage(context.processed["vaccination_coverage"])
+
+        # LOS PROMEDIOS ANUALES DE VACUNACIÓN DE stats_inferential SE CALCULAN SOBRE EL DATASET SIN NULOS
+        context.aggregates.add("vaccination_coverage_sin_nulos", context.processed["vaccination_coverage_sin_nulos"])
+        stats_inferential(context, incremental=incremental, headless=headless)
+    finally:
+        # SE ESPERA A QUE TERMINEN DE DIBUJARSE TODOS LOS GRÁFICOS ENVIADOS
+        close_render_pool()
+        close_process_pool()
+
+    context.results.write()
+    return context.results
+
+
+# EN LAS SEIS FUNCIONES DE ESTADÍSTICA, LAS ONCE ESTADÍSTICAS DEL DATASET COMPLETO, DE 2019 A NIVEL GLOBAL Y
+# DE ESPAÑA A LO LARGO DE LOS AÑOS SE CALCULAN EN UNA SOLA PASADA Y QUEDAN EN UNA ÚNICA TABLA (VER DESCRIBE.PY).
+# LOS RECORTES DE 2019 Y DE ESPAÑA SON TRAMOS DEL DATASET ORDENADO POR (PAÍS, AÑO) QUE DEVUELVE select() (VER
+# QUERY.PY), SIN MÁSCARAS BOOLEANAS; LOS TOTALES DE MUERTES PREVENIBLES POR PAÍS EN 2019 Y POR AÑO EN ESPAÑA
+# SALEN DEL CUBO DE AGREGADOS (VER AGGREGATE_CUBE.PY), SIN FILTRAR NI AGRUPAR LAS FILAS
 
 
 # ---------------------- ESTADÍSTICA DE VACCINES_COVERAGE ----------------------
 
-def stats_vaccination_coverage(vaccination_coverage) :
+def stats_vaccination_coverage(context) :
     """
     Realiza un análisis estadístico descriptivo e inferencial, tanto al dataset como tal, así como 
     al dataset agrupado según corresponda. Calcula parámetros de tendencia central (media, mediana, moda) y de dispersión (rango, varianza, desviación estándar, 
     percentiles). Exporta como .png los gráficos a data/figures. 
     """
 
+    vaccination_coverage = context.processed["vaccination_coverage"]
+
     # ANÁLISIS ESTADÍSTICO DESCRIPTIVO 
     ''' 
     NO TIENE MUCHO SENTIDO HACERLO SIN AGRUPAR, COMO SE EXPLICA ARRIBA. SÓLO SE HACE PARA
@@ -72,29 +147,17 @@ def stats_vaccination_coverage(vaccination_coverage) :
     '''
 
     vaccines_columns = vaccination_coverage.columns.difference(['País', 'Año'])
-    vaccination_coverage_mean = vaccination_coverage[vaccines_columns].mean()
-    vaccination_coverage_median = vaccination_coverage[vaccines_columns].median()
-    vaccination_coverage_mode = vaccination_coverage[vaccines_columns].mode().iloc[0]
-    vaccination_coverage_std = vaccination_coverage[vaccines_columns].std()
-    vaccination_coverage_var = vaccination_coverage[vaccines_columns].var()
-    vaccination_coverage_percentile_25 = vaccination_coverage[vaccines_columns].quantile(0.25)
-    vaccination_coverage_percentile_50 = vaccination_coverage[vaccines_columns].quantile(0.50)
-    vaccination_coverage_percentile_75 = vaccination_coverage[vaccines_columns].quantile(0.75)
-    vaccination_coverage_min = vaccination_coverage[vaccines_columns].min()
-    vaccination_coverage_max = vaccination_coverage[vaccines_columns].max()
-    vaccination_coverage_range = vaccination_coverage_max - vaccination_coverage_min
-
-    print(f"La media para cada vacuna es:\n{vaccination_coverage_mean}\n")
-    print(f"La mediana para cada vacuna es:\n{vaccination_coverage_median}\n")
-    print(f"La moda para cada vacuna es:\n{vaccination_coverage_mode}\n")
-    print(f"La desviación estándar para cada vacuna es:\n{vaccination_coverage_std}\n")
-    print(f"La varianza para cada vacuna es:\n{vaccination_coverage_var}\n")
-    print(f"El percentil 25 para cada vacuna es:\n{vaccination_coverage_percentile_25}\n")
-    print(f"El percentil 50 para cada vacuna es:\n{vaccination_coverage_percentile_50}\n")
-    print(f"El percentil 75 para cada vacuna es:\n{vaccination_coverage_percentile_75}\n")
-    print(f"El valor mínimo para cada vacuna es:\n{vaccination_coverage_min}\n")
-    print(f"El valor máximo para cada vacuna es:\n{vaccination_coverage_max}\n")
-    print(f"El rango para cada vacuna es:\n{vaccination_coverage_range}\n")
+    ipv1 = "Porcentaje de niños de un año que han recibido su primera dosis de vacuna contra la poliomielitis inactivada (IPV1)"
+    values_2019 = context.index.select("vaccination_coverage", years=2019, columns=ipv1).dropna()
+    spain_values = context.index.select("vaccination_coverage", country='España', columns=ipv1).dropna()
+
+    description = describe_slices({
+        "todos los países y años": vaccination_coverage[vaccines_columns],
+        "global 2019": values_2019,
+        "España, todos los años": spain_values
+    })
+    print_description(description)
+    context.results.add("vaccination_coverage", {"descriptivas": description_values(description)})
 
     # GRÁFICO DE HISTOGRAMA, BOXPLOT Y KDE DE CADA VACUNA
     ''' 
@@ -103,8 +166,6 @@ def stats_vaccination_coverage(vaccination_coverage) :
     DEL ANÁLISIS SIN AGRUPAR.
     '''
 
-    sns.set(style="whitegrid")
-
     # RENOMBRO PARA QUE LOS TÍTULOS EN LAS GRÁFICAS NO SE SUPERPONGAN
     short_names = {
         'Porcentaje de niños de un año que han recibido tres dosis de vacuna contra la Hepatitis B (HEPB3)': 'Hepatitis B (HEPB3)',
@@ -120,154 +181,65 @@ def stats_vaccination_coverage(vaccination_coverage) :
     }
 
     for column in vaccines_columns:
-        plt.figure(figsize=(24, 6))
-
-        # HISTOGRAMA
-        plt.subplot(1, 3, 1)
-        sns.histplot(vaccination_coverage[column], kde=False, color="skyblue", bins=30)
-        plt.title(f"Histograma de {short_names[column]}")
-        plt.xlabel('Porcentaje')
-        plt.ylabel('Frecuencia')
-
-        # BOXPLOT
-        plt.subplot(1, 3, 2)
-        sns.boxplot(x=vaccination_coverage[column], color="lightgreen")
-        plt.title(f"Boxplot de {short_names[column]}")
-        plt.xlabel('Porcentaje')
-
-        # KDE
-        plt.subplot(1, 3, 3)
-        sns.kdeplot(vaccination_coverage[column].dropna(), shade=True, color="coral")
-        plt.title(f"KDE de {short_names[column]}")
-        plt.xlabel('Porcentaje')
-        plt.ylabel('Densidad')
-
-        plt.tight_layout()
-        plt.savefig(os.path.join(FIGURES_PATH, f"vacunas_{short_names[column].replace(' ', '_')}.png"))
-        plt.close()
-
-    # ANÁLISIS ESTADÍSTICO DESCRIPTIVO PARA LA VACUNA IPV1 PARA EL AÑO 2019 EN TODO EL MUNDO
-    ipv1 = "Porcentaje de niños de un año que han recibido su primera dosis de vacuna contra la poliomielitis inactivada (IPV1)"
-    global_vaccination_2019 = vaccination_coverage[vaccination_coverage['Año'] == 2019]
-    values_2019 = global_vaccination_2019[ipv1]
-
-    print(f"Estadísticas descriptivas globales para '{ipv1}' en 2019:")
-    print(f"Media: {values_2019.mean():.2f}")
-    print(f"Mediana: {values_2019.median():.2f}")
-    print(f"Moda: {values_2019.mode().iloc[0]:.2f}")
-    print(f"Desviación estándar: {values_2019.std():.2f}")
-    print(f"Varianza: {values_2019.var():.2f}")
-    print(f"Mínimo: {values_2019.min():.2f}")
-    print(f"Máximo: {values_2019.max():.2f}")
-    print(f"Rango: {values_2019.max() - values_2019.min():.2f}")
-    print(f"Percentil 25: {values_2019.quantile(0.25):.2f}")
-    print(f"Percentil 50: {values_2019.quantile(0.50):.2f}")
-    print(f"Percentil 75: {values_2019.quantile(0.75):.2f}")
-
-    # ANÁLISIS ESTADÍSTICO DESCRIPTIVO PARA LA VACUNA IPV1 PARA ESPAÑA A LO LARGO DE LOS AÑOS
-    polio_spain = vaccination_coverage[vaccination_coverage['País'] == 'España']
-    spain_values = polio_spain[ipv1]
-
-    print(f"\nEstadísticas descriptivas de '{ipv1}' en España a lo largo de los años:")
-    print(f"Media: {spain_values.mean():.2f}")
-    print(f"Mediana: {spain_values.median():.2f}")
-    print(f"Moda: {spain_values.mode().iloc[0]:.2f}")
-    print(f"Desviación estándar: {spain_values.std():.2f}")
-    print(f"Varianza: {spain_values.var():.2f}")
-    print(f"Mínimo: {spain_values.min():.2f}")
-    print(f"Máximo: {spain_values.max():.2f}")
-    print(f"Rango: {spain_values.max() - spain_values.min():.2f}")
-    print(f"Percentil 25: {spain_values.quantile(0.25):.2f}")
-    print(f"Percentil 50: {spain_values.quantile(0.50):.2f}")
-    print(f"Percentil 75: {spain_values.quantile(0.75):.2f}")
+        submit_figure(draw_distribution, f"vacunas_{short_names[column].replace(' ', '_')}.png", vaccination_coverage[column],
+                      (f"Histograma de {short_names[column]}", f"Boxplot de {short_names[column]}", f"KDE de {short_names[column]}"),
+                      'Porcentaje', ("skyblue", "lightgreen", "coral"))
 
     # GRAFICO HISTOGRAMA, BOXPLOT Y KDE DE LA VACUNA IPV1 PARA EL AÑO 2019 A NIVEL GLOBAL Y EN ESPAÑA A LO LARGO DE LOS AÑOS
-    sns.set(style="whitegrid")
 
     # GLOBAL 2019
-    plt.figure(figsize=(24, 6))
-
-    # HISTOGRAMA 2019
-    plt.subplot(1, 3, 1)
-    sns.histplot(values_2019, kde=False, color="skyblue", bins=15)
-    plt.title("Histograma IPV1 - Global 2019")
-    plt.xlabel("Porcentaje de vacunación")
-    plt.ylabel("Frecuencia")
-
-    # BOXPLOT 2019
-    plt.subplot(1, 3, 2)
-    sns.boxplot(x=values_2019, color="lightgreen")
-    plt.title("Boxplot IPV1 - Global 2019")
-    plt.xlabel("Porcentaje de vacunación")
-
-    # KDE 2019
-    plt.subplot(1, 3, 3)
-    sns.kdeplot(values_2019.dropna(), shade=True, color="coral")
-    plt.title("KDE IPV1 - Global 2019")
-    plt.xlabel("Porcentaje de vacunación")
-    plt.ylabel("Densidad")
-
-    plt.tight_layout()
-    plt.savefig(os.path.join(FIGURES_PATH, "IPV1_2019.png"))
-    plt.close()
+    submit_figure(draw_distribution, "IPV1_2019.png", values_2019,
+                  ("Histograma IPV1 - Global 2019", "Boxplot IPV1 - Global 2019", "KDE IPV1 - Global 2019"),
+                  "Porcentaje de vacunación", ("skyblue", "lightgreen", "coral"), bins=15)
 
     # ESPAÑA A LO LARGO DE LOS AÑOS
-    plt.figure(figsize=(24, 6))
-
-    # HISTOGRAMA ESPAÑA A LO LARGO DE LOS AÑOS
-    plt.subplot(1, 3, 1)
-    sns.histplot(spain_values, kde=False, color="orange", bins=len(spain_values))
-    plt.title("Histograma IPV1 - España (todos los años)")
-    plt.xlabel("Porcentaje de vacunación")
-    plt.ylabel("Frecuencia")
-
-    # BOXPLOT ESPAÑA A LO LARGO DE LOS AÑOS
-    plt.subplot(1, 3, 2)
-    sns.boxplot(x=spain_values, color="salmon")
-    plt.title("Boxplot IPV1 - España (todos los años)")
-    plt.xlabel("Porcentaje de vacunación")
-
-    # KDE ESPAÑA A LO LARGO DE LOS AÑOS
-    plt.subplot(1, 3, 3)
-    sns.kdeplot(spain_values.dropna(), shade=True, color="sienna")
-    plt.title("KDE IPV1 - España (todos los años)")
-    plt.xlabel("Porcentaje de vacunación")
-    plt.ylabel("Densidad")
-
-    plt.tight_layout()
-    plt.savefig(os.path.join(FIGURES_PATH, "IPV1_espana_historico.png"))
-    plt.close()
+    submit_figure(draw_distribution, "IPV1_espana_historico.png", spain_values,
+                  ("Histograma IPV1 - España (todos los años)", "Boxplot IPV1 - España (todos los años)", "KDE IPV1 - España (todos los años)"),
+                  "Porcentaje de vacunación", ("orange", "salmon", "sienna"), bins=len(spain_values))
     
     # IMPUTACIÓN DE LOS VALORES NAN CON LA MEDIANA DE CADA COLUMNA, AGRUPADO POR PAÍS
     '''SE IMPUTA DE ESTA MANERA PORQUE LA DISTRIBUCIÓN DE LOS VALORES FALTANTES ES TOTALMENTE ALEATORIA.
     YA HECHO EL ANÁLISIS ESTADÍSTICO, SE EXPORTA PARA VISUALIZAR EN POWER BI SIN NULOS''' 
-    vaccines = [col for col in vaccination_coverage.columns if col not in ['País', 'Año']]
-    vaccination_coverage[vaccines] = vaccination_coverage[vaccines].transform(lambda x: x.fillna(x.median()))
+    vaccination_coverage = impute_vaccination_coverage(vaccination_coverage)
 
-    # NUEVA EXPLORACIÓN DEL DATAFRAME VACCINATION_COVERAGE PARA CHEQUEAR QUE LOS VALORES NAN HAYAN SIDO CORRECTAMENTE REEMPLAZADOS
-    print(vaccination_coverage.head(10000))
-    print(vaccination_coverage.info())
+    # NUEVO PERFIL DEL DATAFRAME VACCINATION_COVERAGE PARA CHEQUEAR QUE LOS VALORES NAN HAYAN SIDO CORRECTAMENTE
+    # REEMPLAZADOS (INFORME EN DATA/PROFILES; CON VERBOSITY=2, ADEMÁS, VOLCADO COMPLETO POR CONSOLA)
+    report = ProfileReport("vaccination_coverage_sin_nulos", context.verbosity)
+    report.add("imputado", vaccination_coverage)
+    for path in report.write():
+        register_output(path)
+
+    vaccination_coverage.to_csv(os.path.join(PROCESSED_PATH, 'vaccination_coverage_processed_sin_nulos.csv'), index=False)
+    register_output(os.path.join(PROCESSED_PATH, 'vaccination_coverage_processed_sin_nulos.csv'))
+    context.processed["vaccination_coverage_sin_nulos"] = vaccination_coverage
 
-    for column in vaccination_coverage.columns:
-        print(f"Columna: {column}")
-        print(vaccination_coverage[column].unique())
-        print("-" * 40) # Separa entre columna y columna.
+    return vaccination_coverage
 
-    vaccination_coverage.isna().sum()
 
-    vaccination_coverage.to_csv(os.path.join(PROCESSED_PATH, 'vaccination_coverage_processed_sin_nulos.csv'), index=False)
+def impute_vaccination_coverage(vaccination_coverage) :
+    '''
+    Imputa los valores NaN de cada vacuna con la mediana de su columna. La usa stats_vaccination_coverage
+    y también run_stats cuando esa función se omite en una ejecución incremental: así el dataset sin
+    nulos se reconstruye en memoria de la misma forma en ambos casos y los promedios que usa
+    stats_inferential dan exactamente los mismos valores.
+    '''
 
+    vaccines = [col for col in vaccination_coverage.columns if col not in ['País', 'Año']]
+    vaccination_coverage = vaccination_coverage.copy()
+    vaccination_coverage[vaccines] = vaccination_coverage[vaccines].transform(lambda x: x.fillna(x.median()))
     return vaccination_coverage
 
 
 # ---------------------- ESTADÍSTICA DE LIFE_EXPECTANCY ----------------------
 
-def stats_life_expectancy(life_expectancy):
+def stats_life_expectancy(context) :
     '''
     Realiza un análisis estadístico descriptivo e inferencial, tanto al dataset como tal, así como 
     al dataset agrupado según corresponda. Calcula parámetros de tendencia central (media, mediana, moda) y de dispersión (rango, varianza, desviación estándar, 
     percentiles). Exporta como .png los gráficos a data/figures. 
     '''
+
+    life_expectancy = context.processed["life_expectancy"]
     
     # ANÁLISIS ESTADÍSTICO DESCRIPTIVO 
     ''' 
@@ -276,28 +248,17 @@ def stats_life_expectancy(life_expectancy):
     DEL ANÁLISIS SIN AGRUPAR.
     '''
 
-    life_expectancy_mean = life_expectancy['Esperanza de vida al nacer'].mean() 
-    life_expectancy_median = life_expectancy['Esperanza de vida al nacer'].median() 
-    life_expectancy_mode = life_expectancy['Esperanza de vida al nacer'].mode().iloc[0] 
-    life_expectancy_std = life_expectancy['Esperanza de vida al nacer'].std() 
-    life_expectancy_var = life_expectancy['Esperanza de vida al nacer'].var() 
-    life_expectancy_percentile_25 = life_expectancy['Esperanza de vida al nacer'].quantile(0.25) 
-    life_expectancy_percentile_50 = life_expectancy['Esperanza de vida al nacer'].quantile(0.50) 
-    life_expectancy_percentile_75 = life_expectancy['Esperanza de vida al nacer'].quantile(0.75) 
-    life_expectancy_min = life_expectancy['Esperanza de vida al nacer'].min() 
-    life_expectancy_max = life_expectancy['Esperanza de vida al nacer'].max()
-    life_expectancy_range = life_expectancy_max - life_expectancy_min
-    print(f"La media de la esperanza de vida es:\n{life_expectancy_mean}\n") 
-    print(f"La mediana de la esperanza de vida es:\n{life_expectancy_median}\n") 
-    print(f"La moda de la esperanza de vida es:\n{life_expectancy_mode}\n") 
-    print(f"La desviación estándar de la esperanza de vida es:\n{life_expectancy_std}\n") 
-    print(f"La varianza de la esperanza de vida es:\n{life_expectancy_var}\n")
-    print(f"El percentil 25 para la esperanza de vida es:\n{life_expectancy_percentile_25}\n") 
-    print(f"El percentil 50 para la esperanza de vida es:\n{life_expectancy_percentile_50}\n") 
-    print(f"El percentil 75 para la esperanza de vida es:\n{life_expectancy_percentile_75}\n") 
-    print(f"El valor mínimo para la esperanza de vida es:\n{life_expectancy_min}\n") 
-    print(f"El valor máximo para la esperanza de vida es:\n{life_expectancy_max}\n") 
-    print(f"El rango para la esperanza de vida es:\n{life_expectancy_range}\n") 
+    vida_col = "Esperanza de vida al nacer"
+    values_vida_2019 = context.index.select("life_expectancy", years=2019, columns=vida_col).dropna()
+    spain_vida_values = context.index.select("life_expectancy", country='España', columns=vida_col).dropna()
+
+    description = describe_slices({
+        "todos los países y años": life_expectancy[vida_col],
+        "global 2019": values_vida_2019,
+        "España, todos los años": spain_vida_values
+    })
+    print_description(description)
+    context.results.add("life_expectancy", {"descriptivas": description_values(description)})
 
     # GRAFICO HISTOGRAMA, BOXPLOT Y KDE DE LA ESPERANZA DE VIDA
     ''' 
@@ -306,135 +267,34 @@ def stats_life_expectancy(life_expectancy):
     DEL ANÁLISIS SIN AGRUPAR.
     '''
 
-    sns.set(style="whitegrid")
-    plt.figure(figsize=(24, 6))
-
-    # HISTOGRAMA
-    plt.subplot(1, 3, 1)
-    sns.histplot(life_expectancy['Esperanza de vida al nacer'], kde=False, color="skyblue", bins=30)
-    plt.title("Histograma de Esperanza de vida al nacer")
-    plt.xlabel('Años')
-    plt.ylabel('Frecuencia')
-
-    # BOXPLOT
-    plt.subplot(1, 3, 2)
-    sns.boxplot(x=life_expectancy['Esperanza de vida al nacer'], color="lightgreen")
-    plt.title("Boxplot de Esperanza de vida al nacer")
-    plt.xlabel('Años')
-
-    # KDE
-    plt.subplot(1, 3, 3)
-    sns.kdeplot(life_expectancy['Esperanza de vida al nacer'].dropna(), shade=True, color="coral")
-    plt.title("KDE de Esperanza de vida al nacer")
-    plt.xlabel('Años')
-    plt.ylabel('Densidad')
-
-    plt.tight_layout()
-    plt.savefig(os.path.join(FIGURES_PATH, "esperanza_vida_global.png"))
-    plt.close()
-
-    # ANÁLISIS ESTADÍSTICO DESCRIPTIVO PARA ESPERANZA DE VIDA AL NACER EN 2019 A NIVEL GLOBAL
-    vida_col = "Esperanza de vida al nacer"
-    global_life_2019 = life_expectancy[life_expectancy['Año'] == 2019]
-    values_vida_2019 = global_life_2019[vida_col]
-
-    print(f"Estadísticas descriptivas globales para '{vida_col}' en 2019:")
-    print(f"Media: {values_vida_2019.mean():.2f}")
-    print(f"Mediana: {values_vida_2019.median():.2f}")
-    print(f"Moda: {values_vida_2019.mode().iloc[0]:.2f}")
-    print(f"Desviación estándar: {values_vida_2019.std():.2f}")
-    print(f"Varianza: {values_vida_2019.var():.2f}")
-    print(f"Mínimo: {values_vida_2019.min():.2f}")
-    print(f"Máximo: {values_vida_2019.max():.2f}")
-    print(f"Rango: {values_vida_2019.max() - values_vida_2019.min():.2f}")
-    print(f"Percentil 25: {values_vida_2019.quantile(0.25):.2f}")
-    print(f"Percentil 50: {values_vida_2019.quantile(0.50):.2f}")
-    print(f"Percentil 75: {values_vida_2019.quantile(0.75):.2f}")
-
-    # ANÁLISIS ESTADÍSTICO PARA ESPERANZA DE VIDA AL NACER EN ESPAÑA A LO LARGO DEL TIEMPO
-    vida_spain = life_expectancy[life_expectancy['País'] == 'España']
-    spain_vida_values = vida_spain[vida_col]
-
-    print(f"\nEstadísticas descriptivas de '{vida_col}' en España a lo largo de los años:")
-    print(f"Media: {spain_vida_values.mean():.2f}")
-    print(f"Mediana: {spain_vida_values.median():.2f}")
-    print(f"Moda: {spain_vida_values.mode().iloc[0]:.2f}")
-    print(f"Desviación estándar: {spain_vida_values.std():.2f}")
-    print(f"Varianza: {spain_vida_values.var():.2f}")
-    print(f"Mínimo: {spain_vida_values.min():.2f}")
-    print(f"Máximo: {spain_vida_values.max():.2f}")
-    print(f"Rango: {spain_vida_values.max() - spain_vida_values.min():.2f}")
-    print(f"Percentil 25: {spain_vida_values.quantile(0.25):.2f}")
-    print(f"Percentil 50: {spain_vida_values.quantile(0.50):.2f}")
-    print(f"Percentil 75: {spain_vida_values.quantile(0.75):.2f}")
+    submit_figure(draw_distribution, "esperanza_vida_global.png", life_expectancy['Esperanza de vida al nacer'],
+                  ("Histograma de Esperanza de vida al nacer", "Boxplot de Esperanza de vida al nacer", "KDE de Esperanza de vida al nacer"),
+                  'Años', ("skyblue", "lightgreen", "coral"))
 
     # GRÁFICO DE HISTOGRAMA, BOXPLOT Y KDE DE LA DE ESPERANZA DE VIDA AL NACER PARA EL AÑO 2019 A NIVEL GLOBAL Y EN ESPAÑA A LO LARGO DE LOS AÑOS
-    sns.set(style="whitegrid")
 
     # GLOBAL 2019
-    plt.figure(figsize=(24, 6))
-
-    # HISTOGRAMA 2019
-    plt.subplot(1, 3, 1)
-    sns.histplot(values_vida_2019, kde=False, color="cornflowerblue", bins=15)
-    plt.title("Histograma Esperanza de vida - Global 2019")
-    plt.xlabel("Años")
-    plt.ylabel("Frecuencia")
-
-    # BOXPLOT 2019
-    plt.subplot(1, 3, 2)
-    sns.boxplot(x=values_vida_2019, color="mediumseagreen")
-    plt.title("Boxplot Esperanza de vida - Global 2019")
-    plt.xlabel("Años")
-
-    # KDE 2019
-    plt.subplot(1, 3, 3)
-    sns.kdeplot(values_vida_2019.dropna(), shade=True, color="coral")
-    plt.title("KDE Esperanza de vida - Global 2019")
-    plt.xlabel("Años")
-    plt.ylabel("Densidad")
-
-    plt.tight_layout()
-    plt.savefig(os.path.join(FIGURES_PATH, "esperanza_vida_2019.png"))
-    plt.close()
+    submit_figure(draw_distribution, "esperanza_vida_2019.png", values_vida_2019,
+                  ("Histograma Esperanza de vida - Global 2019", "Boxplot Esperanza de vida - Global 2019", "KDE Esperanza de vida - Global 2019"),
+                  "Años", ("cornflowerblue", "mediumseagreen", "coral"), bins=15)
 
     # ESPAÑA A LO LARGO DE LOS AÑOS 
-    plt.figure(figsize=(24, 6))
-
-    # HISTOGRAMA ESPAÑA A LO LARGO DE LOS AÑOS 
-    plt.subplot(1, 3, 1)
-    sns.histplot(spain_vida_values, kde=False, color="goldenrod", bins=len(spain_vida_values))
-    plt.title("Histograma Esperanza de vida - España (todos los años)")
-    plt.xlabel("Años")
-    plt.ylabel("Frecuencia")
-
-    # BOXPLOT ESPAÑA A LO LARGO DE LOS AÑOS 
-    plt.subplot(1, 3, 2)
-    sns.boxplot(x=spain_vida_values, color="tomato")
-    plt.title("Boxplot Esperanza de vida - España (todos los años)")
-    plt.xlabel("Años")
-
-    # KDE ESPAÑA A LO LARGO DE LOS AÑOS 
-    plt.subplot(1, 3, 3)
-    sns.kdeplot(spain_vida_values.dropna(), shade=True, color="orangered")
-    plt.title("KDE Esperanza de vida - España (todos los años)")
-    plt.xlabel("Años")
-    plt.ylabel("Densidad")
-
-    plt.tight_layout()
-    plt.savefig(os.path.join(FIGURES_PATH, "esperanza_vida_espana_historico.png"))
-    plt.close()
+    submit_figure(draw_distribution, "esperanza_vida_espana_historico.png", spain_vida_values,
+                  ("Histograma Esperanza de vida - España (todos los años)", "Boxplot Esperanza de vida - España (todos los años)", "KDE Esperanza de vida - España (todos los años)"),
+                  "Años", ("goldenrod", "tomato", "orangered"), bins=len(spain_vida_values))
 
 
 # ---------------------- ESTADÍSTICA DE PREVENTABLE_DEATHS ----------------------
 
-def stats_preventable_deaths(preventable_deaths):
+def stats_preventable_deaths(context) :
     '''
     Realiza un análisis estadístico descriptivo e inferencial, tanto al dataset como tal, así como 
     al dataset agrupado según corresponda. Calcula parámetros de tendencia central (media, mediana, moda) y de dispersión (rango, varianza, desviación estándar, 
     percentiles). Exporta como .png los gráficos a data/figures. 
     '''
 
+    preventable_deaths = context.processed["preventable_deaths"]
+
     # ANÁLISIS ESTADÍSTICO DESCRIPTIVO 
     ''' 
     NO TIENE MUCHO SENTIDO HACERLO SIN AGRUPAR, COMO SE EXPLICA ARRIBA. SÓLO SE HACE PARA
@@ -442,28 +302,17 @@ def stats_preventable_deaths(preventable_deaths):
     DEL ANÁLISIS SIN AGRUPAR.
     '''
 
-    preventable_deaths_mean = preventable_deaths['Muertes'].mean() 
-    preventable_deaths_median = preventable_deaths['Muertes'].median() 
-    preventable_deaths_mode = preventable_deaths['Muertes'].mode()
-    preventable_deaths_std = preventable_deaths['Muertes'].std() 
-    preventable_deaths_var = preventable_deaths['Muertes'].var() 
-    preventable_deaths_percentile_25 = preventable_deaths['Muertes'].quantile(0.25) 
-    preventable_deaths_percentile_50 = preventable_deaths['Muertes'].quantile(0.50) 
-    preventable_deaths_percentile_75 = preventable_deaths['Muertes'].quantile(0.75) 
-    preventable_deaths_min = preventable_deaths['Muertes'].min() 
-    preventable_deaths_max = preventable_deaths['Muertes'].max()
-    preventable_deaths_range = preventable_deaths_max - preventable_deaths_min
-    print(f"La media por año y país es:\n{preventable_deaths_mean}\n") 
-    print(f"La mediana por año y país es:\n{preventable_deaths_median}\n") 
-    print(f"La moda por año y país es:\n{preventable_deaths_mode}\n") 
-    print(f"La desviación estándar por año y país es:\n{preventable_deaths_std}\n") 
-    print(f"La varianza por año y país es:\n{preventable_deaths_var}\n")
-    print(f"El percentil 25 por año y país es:\n{preventable_deaths_percentile_25}\n") 
-    print(f"El percentil 50 por año y país es:\n{preventable_deaths_percentile_50}\n") 
-    print(f"El percentil 75 por año y país es:\n{preventable_deaths_percentile_75}\n") 
-    print(f"El valor mínimo por año y país es:\n{preventable_deaths_min}\n") 
-    print(f"El valor máximo por año y país es:\n{preventable_deaths_max}\n") 
-    print(f"El rango por año y país es:\n{preventable_deaths_range}\n") 
+    deaths_col = "Muertes"
+    sum_deaths_2019 = context.aggregates.series("preventable_deaths", deaths_col, "Suma", by="País", year=2019)
+    spain_deaths_sum = context.aggregates.series("preventable_deaths", deaths_col, "Suma", by="Año", country="España")
+
+    description = describe_slices({
+        "todos los países y años": preventable_deaths[deaths_col],
+        "global 2019": sum_deaths_2019,
+        "España, todos los años": spain_deaths_sum
+    })
+    print_description(description)
+    context.results.add("preventable_deaths", {"descriptivas": description_values(description)})
     
     # GRAFICO HISTOGRAMA, BOXPLOT y KDE
     ''' 
@@ -473,130 +322,28 @@ def stats_preventable_deaths(preventable_deaths):
     '''
 
     for cause in preventable_deaths['Causa de muerte'].unique():
-        plt.figure(figsize=(24, 6))
         filtered_data = preventable_deaths[preventable_deaths['Causa de muerte'] == cause]
-
-        # HISTOGRAMA
-        plt.subplot(1, 3, 1)
-        sns.histplot(filtered_data['Muertes'], kde=False, color="skyblue", bins=30)
-        plt.title(f"Histograma de muertes por {cause}")
-        plt.xlabel('Muertes')
-        plt.ylabel('Frecuencia')
-
-        # BOXPLOT
-        plt.subplot(1, 3, 2)
-        sns.boxplot(x=filtered_data['Muertes'], color="lightgreen")
-        plt.title(f"Boxplot de muertes por {cause}")
-        plt.xlabel('Muertes')
-
-        # KDE
-        plt.subplot(1, 3, 3)
-        sns.kdeplot(filtered_data['Muertes'], fill=True, color="steelblue")
-        plt.title(f"KDE de muertes por {cause}")
-        plt.xlabel('Muertes')
-        plt.ylabel('Densidad')
-
-        plt.tight_layout()
         filename = f"muertes_prevenibles_{cause.lower().replace(' ', '_').replace('/', '_')}.png"
-        plt.savefig(os.path.join(FIGURES_PATH, filename))
-        plt.close()
-    
-    # ANÁLISIS ESTADÍSTICO DESCRIPTIVO PARA MUERTES EN 2019 A NIVEL GLOBAL
-    deaths_col = "Muertes"
-    global_deaths_2019 = preventable_deaths[preventable_deaths['Año'] == 2019]
-    sum_deaths_2019 = global_deaths_2019.groupby("País")[deaths_col].sum()
-
-    print(f"Estadísticas descriptivas globales para '{deaths_col}' en 2019:")
-    print(f"Media: {sum_deaths_2019.mean():.2f}")
-    print(f"Mediana: {sum_deaths_2019.median():.2f}")
-    print(f"Moda: {sum_deaths_2019.mode().iloc[0]:.2f}")
-    print(f"Desviación estándar: {sum_deaths_2019.std():.2f}")
-    print(f"Varianza: {sum_deaths_2019.var():.2f}")
-    print(f"Mínimo: {sum_deaths_2019.min():.2f}")
-    print(f"Máximo: {sum_deaths_2019.max():.2f}")
-    print(f"Rango: {sum_deaths_2019.max() - sum_deaths_2019.min():.2f}")
-    print(f"Percentil 25: {sum_deaths_2019.quantile(0.25):.2f}")
-    print(f"Percentil 50: {sum_deaths_2019.quantile(0.50):.2f}")
-    print(f"Percentil 75: {sum_deaths_2019.quantile(0.75):.2f}")
-
-    # ANÁLISIS ESTADÍSTICO PARA MUERTES EN ESPAÑA A LO LARGO DEL TIEMPO
-    spain_deaths = preventable_deaths[preventable_deaths['País'] == 'España']
-    spain_deaths_sum = spain_deaths.groupby("Año")[deaths_col].sum()
-
-    print(f"\nEstadísticas descriptivas de '{deaths_col}' en España a lo largo de los años:")
-    print(f"Media: {spain_deaths_sum.mean():.2f}")
-    print(f"Mediana: {spain_deaths_sum.median():.2f}")
-    print(f"Moda: {spain_deaths_sum.mode().iloc[0]:.2f}")
-    print(f"Desviación estándar: {spain_deaths_sum.std():.2f}")
-    print(f"Varianza: {spain_deaths_sum.var():.2f}")
-    print(f"Mínimo: {spain_deaths_sum.min():.2f}")
-    print(f"Máximo: {spain_deaths_sum.max():.2f}")
-    print(f"Rango: {spain_deaths_sum.max() - spain_deaths_sum.min():.2f}")
-    print(f"Percentil 25: {spain_deaths_sum.quantile(0.25):.2f}")
-    print(f"Percentil 50: {spain_deaths_sum.quantile(0.50):.2f}")
-    print(f"Percentil 75: {spain_deaths_sum.quantile(0.75):.2f}")
+        submit_figure(draw_distribution, filename, filtered_data['Muertes'],
+                      (f"Histograma de muertes por {cause}", f"Boxplot de muertes por {cause}", f"KDE de muertes por {cause}"),
+                      'Muertes', ("skyblue", "lightgreen", "steelblue"))
 
     # GRAFICO HISTOGRAMA, BOXPLOT Y KDE DE MUERTES QUE SE PODRÍAN HABER PREVENIDO POR VACUNACIÓN PARA EL AÑO 2019 A NIVEL GLOBAL Y EN ESPAÑA A LO LARGO DE LOS AÑOS
-    sns.set(style="whitegrid")
 
     # GLOBAL 2019
-    plt.figure(figsize=(24, 6))
-
-    # HISTOGRAMA 2019
-    plt.subplot(1, 3, 1)
-    sns.histplot(sum_deaths_2019, kde=False, color="slateblue", bins=15)
-    plt.title("Histograma de Muertes Prevenibles - Global 2019")
-    plt.xlabel("Muertes")
-    plt.ylabel("Frecuencia")
-
-    # BOXPLOT 2019
-    plt.subplot(1, 3, 2)
-    sns.boxplot(x=sum_deaths_2019, color="lightblue")
-    plt.title("Boxplot de Muertes Prevenibles - Global 2019")
-    plt.xlabel("Muertes")
-
-    # KDE 2019
-    plt.subplot(1, 3, 3)
-    sns.kdeplot(sum_deaths_2019, fill=True, color="mediumslateblue")
-    plt.title("KDE de Muertes Prevenibles - Global 2019")
-    plt.xlabel("Muertes")
-    plt.ylabel("Densidad")
-
-    plt.tight_layout()
-    plt.savefig(os.path.join(FIGURES_PATH, "muertes_prevenibles_2019.png"))
-    plt.close()
+    submit_figure(draw_distribution, "muertes_prevenibles_2019.png", sum_deaths_2019,
+                  ("Histograma de Muertes Prevenibles - Global 2019", "Boxplot de Muertes Prevenibles - Global 2019", "KDE de Muertes Prevenibles - Global 2019"),
+                  "Muertes", ("slateblue", "lightblue", "mediumslateblue"), bins=15)
 
     # ESPAÑA A LO LARGO DE LOS AÑOS 
-    plt.figure(figsize=(24, 6))
-
-    # HISTOGRAMA ESPAÑA A LO LARGO DE LOS AÑOS
-    plt.subplot(1, 3, 1)
-    sns.histplot(spain_deaths_sum, kde=False, color="orangered", bins=len(spain_deaths_sum))
-    plt.title("Histograma de Muertes Prevenibles - España (todos los años)")
-    plt.xlabel("Muertes")
-    plt.ylabel("Frecuencia")
-
-    # BOXPLOT ESPAÑA A LO LARGO DE LOS AÑOS
-    plt.subplot(1, 3, 2)
-    sns.boxplot(x=spain_deaths_sum, color="salmon")
-    plt.title("Boxplot de Muertes Prevenibles - España (todos los años)")
-    plt.xlabel("Muertes")
-
-    # KDE ESPAÑA A LO LARGO DE LOS AÑOS
-    plt.subplot(1, 3, 3)
-    sns.kdeplot(spain_deaths_sum, fill=True, color="tomato")
-    plt.title("KDE de Muertes Prevenibles - España (todos los años)")
-    plt.xlabel("Muertes")
-    plt.ylabel("Densidad")
-
-    plt.tight_layout()
-    plt.savefig(os.path.join(FIGURES_PATH, "muertes_prevenibles_espana_historico.png"))
-    plt.close()
+    submit_figure(draw_distribution, "muertes_prevenibles_espana_historico.png", spain_deaths_sum,
+                  ("Histograma de Muertes Prevenibles - España (todos los años)", "Boxplot de Muertes Prevenibles - España (todos los años)", "KDE de Muertes Prevenibles - España (todos los años)"),
+                  "Muertes", ("orangered", "salmon", "tomato"), bins=len(spain_deaths_sum))
 
 
 # ---------------------- ESTADÍSTICA DE GDP ----------------------
 
-def stats_gdp(gdp):
+def stats_gdp(context) :
     '''
     Realiza un análisis estadístico descriptivo e inferencial, tanto al dataset como tal, así como 
     al dataset agrupado según corresponda. Calcula parámetros de tendencia central (media, mediana, moda) y de dispersión (rango, varianza, desviación estándar, 
@@ -604,6 +351,8 @@ def stats_gdp(gdp):
 
     '''
 
+    gdp = context.processed["gdp"]
+
     # ANÁLISIS ESTADÍSTICO DESCRIPTIVO 
     ''' 
     NO TIENE MUCHO SENTIDO HACERLO SIN AGRUPAR, COMO SE EXPLICA ARRIBA. SÓLO SE HACE PARA
@@ -611,28 +360,17 @@ def stats_gdp(gdp):
     DEL ANÁLISIS SIN AGRUPAR.
     '''
 
-    gdp_mean = gdp['PIB per cápita a precios constantes'].mean() 
-    gdp_median = gdp['PIB per cápita a precios constantes'].median() 
-    gdp_mode = gdp['PIB per cápita a precios constantes'].mode().iloc[0] 
-    gdp_std = gdp['PIB per cápita a precios constantes'].std() 
-    gdp_var = gdp['PIB per cápita a precios constantes'].var() 
-    gdp_percentile_25 = gdp['PIB per cápita a precios constantes'].quantile(0.25) 
-    gdp_percentile_50 = gdp['PIB per cápita a precios constantes'].quantile(0.50) 
-    gdp_percentile_75 = gdp['PIB per cápita a precios constantes'].quantile(0.75) 
-    gdp_min = gdp['PIB per cápita a precios constantes'].min() 
-    gdp_max = gdp['PIB per cápita a precios constantes'].max()
-    gdp_range = gdp_max - gdp_min
-    print(f"La media por año y país es:\n{gdp_mean}\n") 
-    print(f"La mediana por año y país es:\n{gdp_median}\n") 
-    print(f"La moda por año y país es:\n{gdp_mode}\n") 
-    print(f"La desviación estándar por año y país es:\n{gdp_std}\n") 
-    print(f"La varianza por año y país es:\n{gdp_var}\n")
-    print(f"El percentil 25 por año y país es:\n{gdp_percentile_25}\n") 
-    print(f"El percentil 50 por año y país es:\n{gdp_percentile_50}\n") 
-    print(f"El percentil 75 por año y país es:\n{gdp_percentile_75}\n") 
-    print(f"El valor mínimo por año y país es:\n{gdp_min}\n") 
-    print(f"El valor máximo por año y país es:\n{gdp_max}\n") 
-    print(f"El rango por año y país es:\n{gdp_range}\n") 
+    gdp_col = "PIB per cápita a precios constantes"
+    values_gdp_2019 = context.index.select("gdp", years=2019, columns=gdp_col).dropna()
+    spain_gdp_values = context.index.select("gdp", country='España', columns=gdp_col).dropna()
+
+    description = describe_slices({
+        "todos los países y años": gdp[gdp_col],
+        "global 2019": values_gdp_2019,
+        "España, todos los años": spain_gdp_values
+    })
+    print_description(description)
+    context.results.add("gdp", {"descriptivas": description_values(description)})
 
     # GRÁFICO DE HISTOGRAMA, BOXPLOT Y KDE DEL PIB
     ''' 
@@ -641,136 +379,35 @@ def stats_gdp(gdp):
     DEL ANÁLISIS SIN AGRUPAR.
     '''
 
-    sns.set(style="whitegrid")
     column = 'PIB per cápita a precios constantes'
-    plt.figure(figsize=(24, 6))
-
-    # HISTOGRAMA
-    plt.subplot(1, 3, 1)
-    sns.histplot(gdp[column], kde=False, color="skyblue", bins=30)
-    plt.title(f"Histograma de {column}")
-    plt.xlabel('PIB per cápita')
-    plt.ylabel('Frecuencia')
-
-    # BOXPLOT
-    plt.subplot(1, 3, 2)
-    sns.boxplot(x=gdp[column], color="lightgreen")
-    plt.title(f"Boxplot de {column}")
-    plt.xlabel('PIB per cápita')
-
-    # KDE
-    plt.subplot(1, 3, 3)
-    sns.kdeplot(gdp[column], fill=True, color="steelblue")
-    plt.title(f"KDE de {column}")
-    plt.xlabel('PIB per cápita')
-    plt.ylabel('Densidad')
-
-    plt.tight_layout()
-    plt.savefig(os.path.join(FIGURES_PATH, "PIB_global.png"))
-    plt.close()
-
-    # ANÁLISIS ESTADÍSTICO DESCRIPTIVO PARA 2019 A NIVEL GLOBAL
-    gdp_col = "PIB per cápita a precios constantes"
-    global_gdp_2019 = gdp[gdp['Año'] == 2019]
-    values_gdp_2019 = global_gdp_2019[gdp_col]
-
-    print(f"Estadísticas descriptivas globales para '{gdp_col}' en 2019:")
-    print(f"Media: {values_gdp_2019.mean():.2f}")
-    print(f"Mediana: {values_gdp_2019.median():.2f}")
-    print(f"Moda: {values_gdp_2019.mode().iloc[0]:.2f}")
-    print(f"Desviación estándar: {values_gdp_2019.std():.2f}")
-    print(f"Varianza: {values_gdp_2019.var():.2f}")
-    print(f"Mínimo: {values_gdp_2019.min():.2f}")
-    print(f"Máximo: {values_gdp_2019.max():.2f}")
-    print(f"Rango: {values_gdp_2019.max() - values_gdp_2019.min():.2f}")
-    print(f"Percentil 25: {values_gdp_2019.quantile(0.25):.2f}")
-    print(f"Percentil 50: {values_gdp_2019.quantile(0.50):.2f}")
-    print(f"Percentil 75: {values_gdp_2019.quantile(0.75):.2f}")
-
-    # ANÁLISIS ESTADÍSTICO PARA ESPAÑA A LO LARGO DEL TIEMPO
-    spain_gdp = gdp[gdp['País'] == 'España']
-    spain_gdp_values = spain_gdp[gdp_col]
-
-    print(f"\nEstadísticas descriptivas de '{gdp_col}' en España a lo largo de los años:")
-    print(f"Media: {spain_gdp_values.mean():.2f}")
-    print(f"Mediana: {spain_gdp_values.median():.2f}")
-    print(f"Moda: {spain_gdp_values.mode().iloc[0]:.2f}")
-    print(f"Desviación estándar: {spain_gdp_values.std():.2f}")
-    print(f"Varianza: {spain_gdp_values.var():.2f}")
-    print(f"Mínimo: {spain_gdp_values.min():.2f}")
-    print(f"Máximo: {spain_gdp_values.max():.2f}")
-    print(f"Rango: {spain_gdp_values.max() - spain_gdp_values.min():.2f}")
-    print(f"Percentil 25: {spain_gdp_values.quantile(0.25):.2f}")
-    print(f"Percentil 50: {spain_gdp_values.quantile(0.50):.2f}")
-    print(f"Percentil 75: {spain_gdp_values.quantile(0.75):.2f}")
+    submit_figure(draw_distribution, "PIB_global.png", gdp[column],
+                  (f"Histograma de {column}", f"Boxplot de {column}", f"KDE de {column}"),
+                  'PIB per cápita', ("skyblue", "lightgreen", "steelblue"))
 
     # GRÁFICO DE HISTOGRAMA Y BOXPLOT DEL PIB EN 2019 A NIVEL GLOBAL Y EN ESPAÑA A LO LARGO DE LOS AÑOS
-    sns.set(style="whitegrid")
 
     # GLOBAL 2019
-    plt.figure(figsize=(24, 6))
-
-    # HISTOGRAMA 2019
-    plt.subplot(1, 3, 1)
-    sns.histplot(values_gdp_2019, kde=False, color="darkcyan", bins=15)
-    plt.title("Histograma del PIB per cápita - Global 2019")
-    plt.xlabel("PIB per cápita (precios constantes)")
-    plt.ylabel("Frecuencia")
-
-    # BOXPLOT 2019
-    plt.subplot(1, 3, 2)
-    sns.boxplot(x=values_gdp_2019, color="aquamarine")
-    plt.title("Boxplot del PIB per cápita - Global 2019")
-    plt.xlabel("PIB per cápita (precios constantes)")
-
-    # KDE 2019
-    plt.subplot(1, 3, 3)
-    sns.kdeplot(values_gdp_2019, fill=True, color="teal")
-    plt.title("KDE del PIB per cápita - Global 2019")
-    plt.xlabel("PIB per cápita (precios constantes)")
-    plt.ylabel("Densidad")
-
-    plt.tight_layout()
-    plt.savefig(os.path.join(FIGURES_PATH, "PIB_2019.png"))
-    plt.close()
+    submit_figure(draw_distribution, "PIB_2019.png", values_gdp_2019,
+                  ("Histograma del PIB per cápita - Global 2019", "Boxplot del PIB per cápita - Global 2019", "KDE del PIB per cápita - Global 2019"),
+                  "PIB per cápita (precios constantes)", ("darkcyan", "aquamarine", "teal"), bins=15)
 
     # ESPAÑA A LO LARGO DE LOS AÑOS
-    plt.figure(figsize=(24, 6))
-
-    # HISTOGRAMA ESPAÑA A LO LARGO DE LOS AÑOS
-    plt.subplot(1, 3, 1)
-    sns.histplot(spain_gdp_values, kde=False, color="darkorange", bins=len(spain_gdp_values))
-    plt.title("Histograma del PIB per cápita - España (todos los años)")
-    plt.xlabel("PIB per cápita (precios constantes)")
-    plt.ylabel("Frecuencia")
-
-    # BOXPLOT ESPAÑA A LO LARGO DE LOS AÑOS
-    plt.subplot(1, 3, 2)
-    sns.boxplot(x=spain_gdp_values, color="sandybrown")
-    plt.title("Boxplot del PIB per cápita - España (todos los años)")
-    plt.xlabel("PIB per cápita (precios constantes)")
-
-    # KDE ESPAÑA A LO LARGO DE LOS AÑOS
-    plt.subplot(1, 3, 3)
-    sns.kdeplot(spain_gdp_values, fill=True, color="chocolate")
-    plt.title("KDE del PIB per cápita - España (todos los años)")
-    plt.xlabel("PIB per cápita (precios constantes)")
-    plt.ylabel("Densidad")
-
-    plt.tight_layout()
-    plt.savefig(os.path.join(FIGURES_PATH, "PIB_espana_historico.png"))
-    plt.close()
+    submit_figure(draw_distribution, "PIB_espana_historico.png", spain_gdp_values,
+                  ("Histograma del PIB per cápita - España (todos los años)", "Boxplot del PIB per cápita - España (todos los años)", "KDE del PIB per cápita - España (todos los años)"),
+                  "PIB per cápita (precios constantes)", ("darkorange", "sandybrown", "chocolate"), bins=len(spain_gdp_values))
 
 
 # ---------------------- ESTADÍSTICA DE LITERACY ----------------------
 
-def stats_literacy(literacy):
+def stats_literacy(context) :
     '''
     Realiza un análisis estadístico descriptivo e inferencial, tanto al dataset como tal, así como 
     al dataset agrupado según corresponda. Calcula parámetros de tendencia central (media, mediana, moda) y de dispersión (rango, varianza, desviación estándar, 
     percentiles). Exporta como .png los gráficos a data/figures. 
     '''
 
+    literacy = context.processed["literacy"]
+
     # ANÁLISIS ESTADÍSTICO DESCRIPTIVO
     ''' 
     NO TIENE MUCHO SENTIDO HACERLO SIN AGRUPAR, COMO SE EXPLICA ARRIBA. SÓLO SE HACE PARA
@@ -779,29 +416,17 @@ def stats_literacy(literacy):
     '''
 
     tasa_alfabetizacion = literacy.columns.difference(['País', 'Año']) 
-    literacy_mean = literacy['Tasa de alfabetización'].mean() 
-    literacy_median = literacy['Tasa de alfabetización'].median() 
-    literacy_mode = literacy['Tasa de alfabetización'].mode().iloc[0] 
-    literacy_std = literacy['Tasa de alfabetización'].std() 
-    literacy_var = literacy['Tasa de alfabetización'].var() 
-    literacy_percentile_25 = literacy['Tasa de alfabetización'].quantile(0.25) 
-    literacy_percentile_50 = literacy['Tasa de alfabetización'].quantile(0.50) 
-    literacy_percentile_75 = literacy['Tasa de alfabetización'].quantile(0.75) 
-    literacy_min = literacy['Tasa de alfabetización'].min() 
-    literacy_max = literacy['Tasa de alfabetización'].max()
-    literacy_range = literacy_max - literacy_min
-
-    print(f"La media por año y país es:\n{literacy_mean}\n") 
-    print(f"La mediana por año y país es:\n{literacy_median}\n") 
-    print(f"La moda por año y país es:\n{literacy_mode}\n") 
-    print(f"La desviación estándar por año y país es:\n{literacy_std}\n") 
-    print(f"La varianza por año y país es:\n{literacy_var}\n")
-    print(f"El percentil 25 por año y país es:\n{literacy_percentile_25}\n") 
-    print(f"El percentil 50 por año y país es:\n{literacy_percentile_50}\n") 
-    print(f"El percentil 75 por año y país es:\n{literacy_percentile_75}\n") 
-    print(f"El valor mínimo por año y país es:\n{literacy_min}\n") 
-    print(f"El valor máximo por año y país es:\n{literacy_max}\n") 
-    print(f"El rango por año y país es:\n{literacy_range}\n")
+    literacy_col = "Tasa de alfabetización"
+    values_literacy_2019 = context.index.select("literacy", years=2019, columns=literacy_col).dropna()
+    spain_literacy_values = context.index.select("literacy", country='España', columns=literacy_col).dropna()
+
+    description = describe_slices({
+        "todos los países y años": literacy[literacy_col],
+        "global 2019": values_literacy_2019,
+        "España, todos los años": spain_literacy_values
+    })
+    print_description(description)
+    context.results.add("literacy", {"descriptivas": description_values(description)})
 
     # GRÁFICO DE HISTOGRAMA, BOXPLOT Y KDE 
     ''' 
@@ -810,135 +435,34 @@ def stats_literacy(literacy):
     DEL ANÁLISIS SIN AGRUPAR.
     '''
 
-    sns.set(style="whitegrid")
-    plt.figure(figsize=(24, 6))
-
-    # HISTOGRAMA
-    plt.subplot(1, 3, 1)
-    sns.histplot(literacy['Tasa de alfabetización'], kde=False, color="skyblue", bins=30)
-    plt.title("Histograma de Tasa de alfabetización")
-    plt.xlabel('Porcentaje')
-    plt.ylabel('Frecuencia')
-
-    # BOXPLOT
-    plt.subplot(1, 3, 2)
-    sns.boxplot(x=literacy['Tasa de alfabetización'], color="lightgreen")
-    plt.title("Boxplot de Tasa de alfabetización")
-    plt.xlabel('Porcentaje')
-
-    # KDE
-    plt.subplot(1, 3, 3)
-    sns.kdeplot(literacy['Tasa de alfabetización'], fill=True, color="steelblue")
-    plt.title("KDE de Tasa de alfabetización")
-    plt.xlabel("Porcentaje")
-    plt.ylabel("Densidad")
-
-    plt.tight_layout()
-    plt.savefig(os.path.join(FIGURES_PATH, "literacy_global.png"))
-    plt.close()
-
-    # ANÁLISIS ESTADÍSTICO DESCRIPTIVO PARA TASA DE ALFABETIZACIÓN EN 2019 A NIVEL GLOBAL
-    literacy_col = "Tasa de alfabetización"
-    global_literacy_2019 = literacy[literacy['Año'] == 2019]
-    values_literacy_2019 = global_literacy_2019[literacy_col]
-
-    print(f"Estadísticas descriptivas globales para '{literacy_col}' en 2019:")
-    print(f"Media: {values_literacy_2019.mean():.2f}")
-    print(f"Mediana: {values_literacy_2019.median():.2f}")
-    print(f"Moda: {values_literacy_2019.mode().iloc[0]:.2f}")
-    print(f"Desviación estándar: {values_literacy_2019.std():.2f}")
-    print(f"Varianza: {values_literacy_2019.var():.2f}")
-    print(f"Mínimo: {values_literacy_2019.min():.2f}")
-    print(f"Máximo: {values_literacy_2019.max():.2f}")
-    print(f"Rango: {values_literacy_2019.max() - values_literacy_2019.min():.2f}")
-    print(f"Percentil 25: {values_literacy_2019.quantile(0.25):.2f}")
-    print(f"Percentil 50: {values_literacy_2019.quantile(0.50):.2f}")
-    print(f"Percentil 75: {values_literacy_2019.quantile(0.75):.2f}")
-
-    # ANÁLISIS ESTADÍSTICO PARA ESPAÑA A LO LARGO DEL TIEMPO
-    literacy_spain = literacy[literacy['País'] == 'España']
-    spain_literacy_values = literacy_spain[literacy_col]
-
-    print(f"\nEstadísticas descriptivas de '{literacy_col}' en España a lo largo de los años:")
-    print(f"Media: {spain_literacy_values.mean():.2f}")
-    print(f"Mediana: {spain_literacy_values.median():.2f}")
-    print(f"Moda: {spain_literacy_values.mode().iloc[0]:.2f}")
-    print(f"Desviación estándar: {spain_literacy_values.std():.2f}")
-    print(f"Varianza: {spain_literacy_values.var():.2f}")
-    print(f"Mínimo: {spain_literacy_values.min():.2f}")
-    print(f"Máximo: {spain_literacy_values.max():.2f}")
-    print(f"Rango: {spain_literacy_values.max() - spain_literacy_values.min():.2f}")
-    print(f"Percentil 25: {spain_literacy_values.quantile(0.25):.2f}")
-    print(f"Percentil 50: {spain_literacy_values.quantile(0.50):.2f}")
-    print(f"Percentil 75: {spain_literacy_values.quantile(0.75):.2f}")
+    submit_figure(draw_distribution, "literacy_global.png", literacy['Tasa de alfabetización'],
+                  ("Histograma de Tasa de alfabetización", "Boxplot de Tasa de alfabetización", "KDE de Tasa de alfabetización"),
+                  'Porcentaje', ("skyblue", "lightgreen", "steelblue"))
 
     # GRÁFICO DE HISTOGRAMA, BOXPLOT Y KDE DE TASA DE ALFABETIZACIÓN PARA EL AÑO 2019 A NIVEL GLOBAL Y PARA ESPAÑA A LO LARGO DEL TIEMPO
-    sns.set(style="whitegrid")
 
     # GLOBAL 2019
-    plt.figure(figsize=(24, 6))
-
-    # HISTOGRAMA 2019
-    plt.subplot(1, 3, 1)
-    sns.histplot(values_literacy_2019, kde=False, color="teal", bins=15)
-    plt.title("Histograma Tasa de alfabetización - Global 2019")
-    plt.xlabel("Porcentaje")
-    plt.ylabel("Frecuencia")
-
-    # BOXPLOT 2019
-    plt.subplot(1, 3, 2)
-    sns.boxplot(x=values_literacy_2019, color="lightgreen")
-    plt.title("Boxplot Tasa de alfabetización - Global 2019")
-    plt.xlabel("Porcentaje")
-
-    # KDE 2019
-    plt.subplot(1, 3, 3)
-    sns.kdeplot(values_literacy_2019, fill=True, color="mediumseagreen")
-    plt.title("KDE Tasa de alfabetización - Global 2019")
-    plt.xlabel("Porcentaje")
-    plt.ylabel("Densidad")
-
-    plt.tight_layout()
-    plt.savefig(os.path.join(FIGURES_PATH, "literacy_2019.png"))
-    plt.close()
+    submit_figure(draw_distribution, "literacy_2019.png", values_literacy_2019,
+                  ("Histograma Tasa de alfabetización - Global 2019", "Boxplot Tasa de alfabetización - Global 2019", "KDE Tasa de alfabetización - Global 2019"),
+                  "Porcentaje", ("teal", "lightgreen", "mediumseagreen"), bins=15)
 
     # ESPAÑA A LO LARGO DE LOS AÑOS
-    plt.figure(figsize=(24, 6))
-
-    # HISTOGRAMA ESPAÑA A LO LARGO DE LOS AÑOS
-    plt.subplot(1, 3, 1)
-    sns.histplot(spain_literacy_values, kde=False, color="darkorange", bins=len(spain_literacy_values))
-    plt.title("Histograma Tasa de alfabetización - España (todos los años)")
-    plt.xlabel("Porcentaje")
-    plt.ylabel("Frecuencia")
-
-    # BOXPLOT ESPAÑA A LO LARGO DE LOS AÑOS
-    plt.subplot(1, 3, 2)
-    sns.boxplot(x=spain_literacy_values, color="tomato")
-    plt.title("Boxplot Tasa de alfabetización - España (todos los años)")
-    plt.xlabel("Porcentaje")
-
-    # KDE ESPAÑA A LO LARGO DE LOS AÑOS
-    plt.subplot(1, 3, 3)
-    sns.kdeplot(spain_literacy_values, fill=True, color="orangered")
-    plt.title("KDE Tasa de alfabetización - España (todos los años)")
-    plt.xlabel("Porcentaje")
-    plt.ylabel("Densidad")
-
-    plt.tight_layout()
-    plt.savefig(os.path.join(FIGURES_PATH, "literacy_espana_historico.png"))
-    plt.close()
+    submit_figure(draw_distribution, "literacy_espana_historico.png", spain_literacy_values,
+                  ("Histograma Tasa de alfabetización - España (todos los años)", "Boxplot Tasa de alfabetización - España (todos los años)", "KDE Tasa de alfabetización - España (todos los años)"),
+                  "Porcentaje", ("darkorange", "tomato", "orangered"), bins=len(spain_literacy_values))
 
 
 # ---------------------- ESTADÍSTICA DE CHILD_MORTALITY ----------------------
 
-def stats_child_mortality(child_mortality):
+def stats_child_mortality(context) :
     '''
     Realiza un análisis estadístico descriptivo e inferencial, tanto al dataset como tal, así como 
     al dataset agrupado según corresponda. Calcula parámetros de tendencia central (media, mediana, moda) y de dispersión (rango, varianza, desviación estándar, 
     percentiles). Exporta como .png los gráficos a data/figures. 
     '''
 
+    child_mortality = context.processed["child_mortality"]
+
     # HAGO ANÁLISIS ESTADÍSTICO DESCRIPTIVO 
     ''' 
     NO TIENE MUCHO SENTIDO HACERLO SIN AGRUPAR, COMO SE EXPLICA ARRIBA. SÓLO SE HACE PARA
@@ -946,29 +470,17 @@ def stats_child_mortality(child_mortality):
     DEL ANÁLISIS SIN AGRUPAR.
     '''
 
-    child_mortality_mean = child_mortality['Mortalidad infantil'].mean() 
-    child_mortality_median = child_mortality['Mortalidad infantil'].median() 
-    child_mortality_mode = child_mortality['Mortalidad infantil'].mode().iloc[0] 
-    child_mortality_std = child_mortality['Mortalidad infantil'].std() 
-    child_mortality_var = child_mortality['Mortalidad infantil'].var() 
-    child_mortality_percentile_25 = child_mortality['Mortalidad infantil'].quantile(0.25) 
-    child_mortality_percentile_50 = child_mortality['Mortalidad infantil'].quantile(0.50) 
-    child_mortality_percentile_75 = child_mortality['Mortalidad infantil'].quantile(0.75) 
-    child_mortality_min = child_mortality['Mortalidad infantil'].min() 
-    child_mortality_max = child_mortality['Mortalidad infantil'].max()
-    child_mortality_range = child_mortality_max - child_mortality_min
-
-    print(f"La media por año y país es:\n{child_mortality_mean}\n") 
-    print(f"La mediana por año y país es:\n{child_mortality_median}\n") 
-    print(f"La moda por año y país es:\n{child_mortality_mode}\n") 
-    print(f"La desviación estándar por año y país es:\n{child_mortality_std}\n") 
-    print(f"La varianza por año y país es:\n{child_mortality_var}\n")
-    print(f"El percentil 25 por año y país es:\n{child_mortality_percentile_25}\n") 
-    print(f"El percentil 50 por año y país es:\n{child_mortality_percentile_50}\n") 
-    print(f"El percentil 75 por año y país es:\n{child_mortality_percentile_75}\n") 
-    print(f"El valor mínimo por año y país es:\n{child_mortality_min}\n") 
-    print(f"El valor máximo por año y país es:\n{child_mortality_max}\n") 
-    print(f"El rango por año y país es:\n{child_mortality_range}\n")
+    mortality_col = "Mortalidad infantil"
+    values_mortality_2019 = context.index.select("child_mortality", years=2019, columns=mortality_col).dropna()
+    spain_mortality_values = context.index.select("child_mortality", country='España', columns=mortality_col).dropna()
+
+    description = describe_slices({
+        "todos los países y años": child_mortality[mortality_col],
+        "global 2019": values_mortality_2019,
+        "España, todos los años": spain_mortality_values
+    })
+    print_description(description)
+    context.results.add("child_mortality", {"descriptivas": description_values(description)})
 
     # GRÁFICO DE HISTOGRAMA, BOXPLOT Y KDE 
     ''' 
@@ -977,134 +489,46 @@ def stats_child_mortality(child_mortality):
     DEL ANÁLISIS SIN AGRUPAR.
     '''
 
-    sns.set(style="whitegrid")
-    plt.figure(figsize=(24, 6))
-
-    # HISTOGRAMA
-    plt.subplot(1, 3, 1)
-    sns.histplot(child_mortality['Mortalidad infantil'], kde=False, color="skyblue", bins=30)
-    plt.title("Histograma de Mortalidad infantil")
-    plt.xlabel('Porcentaje')
-    plt.ylabel('Frecuencia')
-
-    # BOXPLOT
-    plt.subplot(1, 3, 2)
-    sns.boxplot(x=child_mortality['Mortalidad infantil'], color="lightgreen")
-    plt.title("Boxplot de Mortalidad infantil")
-    plt.xlabel('Porcentaje')
-
-    # KDE
-    plt.subplot(1, 3, 3)
-    sns.kdeplot(child_mortality['Mortalidad infantil'], fill=True, color="steelblue")
-    plt.title("KDE de Mortalidad infantil")
-    plt.xlabel("Porcentaje")
-    plt.ylabel("Densidad")
-
-    plt.tight_layout()
-    plt.savefig(os.path.join(FIGURES_PATH, "child_mortality_global.png"))
-    plt.close()
-
-    # ANÁLISIS ESTADÍSTICO DESCRIPTIVO PARA MORTALIDAD INFANTIL EN 2019 A NIVEL GLOBAL
-    mortality_col = "Mortalidad infantil"
-    global_mortality_2019 = child_mortality[child_mortality['Año'] == 2019]
-    values_mortality_2019 = global_mortality_2019[mortality_col]
-
-    print(f"Estadísticas descriptivas globales para '{mortality_col}' en 2019:")
-    print(f"Media: {values_mortality_2019.mean():.2f}")
-    print(f"Mediana: {values_mortality_2019.median():.2f}")
-    print(f"Moda: {values_mortality_2019.mode().iloc[0]:.2f}")
-    print(f"Desviación estándar: {values_mortality_2019.std():.2f}")
-    print(f"Varianza: {values_mortality_2019.var():.2f}")
-    print(f"Mínimo: {values_mortality_2019.min():.2f}")
-    print(f"Máximo: {values_mortality_2019.max():.2f}")
-    print(f"Rango: {values_mortality_2019.max() - values_mortality_2019.min():.2f}")
-    print(f"Percentil 25: {values_mortality_2019.quantile(0.25):.2f}")
-    print(f"Percentil 50: {values_mortality_2019.quantile(0.50):.2f}")
-    print(f"Percentil 75: {values_mortality_2019.quantile(0.75):.2f}")
-
-    # ANÁLISIS ESTADÍSTICO PARA MORTALIDAD INFANTIL EN ESPAÑA A LO LARGO DEL TIEMPO
-    mortality_spain = child_mortality[child_mortality['País'] == 'España']
-    spain_mortality_values = mortality_spain[mortality_col]
-
-    print(f"\nEstadísticas descriptivas de '{mortality_col}' en España a lo largo de los años:")
-    print(f"Media: {spain_mortality_values.mean():.2f}")
-    print(f"Mediana: {spain_mortality_values.median():.2f}")
-    print(f"Moda: {spain_mortality_values.mode().iloc[0]:.2f}")
-    print(f"Desviación estándar: {spain_mortality_values.std():.2f}")
-    print(f"Varianza: {spain_mortality_values.var():.2f}")
-    print(f"Mínimo: {spain_mortality_values.min():.2f}")
-    print(f"Máximo: {spain_mortality_values.max():.2f}")
-    print(f"Rango: {spain_mortality_values.max() - spain_mortality_values.min():.2f}")
-    print(f"Percentil 25: {spain_mortality_values.quantile(0.25):.2f}")
-    print(f"Percentil 50: {spain_mortality_values.quantile(0.50):.2f}")
-    print(f"Percentil 75: {spain_mortality_values.quantile(0.75):.2f}")
+    submit_figure(draw_distribution, "child_mortality_global.png", child_mortality['Mortalidad infantil'],
+                  ("Histograma de Mortalidad infantil", "Boxplot de Mortalidad infantil", "KDE de Mortalidad infantil"),
+                  'Porcentaje', ("skyblue", "lightgreen", "steelblue"))
 
     # GRÁFICO DE HISTOGRAMA, BOXPLOT Y KDE PARA MORTALIDAD INFANTIL A NIVEL GLOBAL EN 2019 Y PARA ESPAÑA A LO LARGO DEL TIEMPO
-    sns.set(style="whitegrid")
 
     # GLOBAL 2019
-    plt.figure(figsize=(24, 6))
-
-    # HISTOGRAMA 2019
-    plt.subplot(1, 3, 1)
-    sns.histplot(values_mortality_2019, kde=False, color="mediumpurple", bins=15)
-    plt.title("Histograma Mortalidad Infantil - Global 2019")
-    plt.xlabel("Mortalidad por cada 1.000 nacidos vivos")
-    plt.ylabel("Frecuencia")
-
-    # BOXPLOT 2019
-    plt.subplot(1, 3, 2)
-    sns.boxplot(x=values_mortality_2019, color="plum")
-    plt.title("Boxplot Mortalidad Infantil - Global 2019")
-    plt.xlabel("Mortalidad por cada 1.000 nacidos vivos")
-
-    # KDE 2019
-    plt.subplot(1, 3, 3)
-    sns.kdeplot(values_mortality_2019, fill=True, color="purple")
-    plt.title("KDE Mortalidad Infantil - Global 2019")
-    plt.xlabel("Mortalidad por cada 1.000 nacidos vivos")
-    plt.ylabel("Densidad")
-
-    plt.tight_layout()
-    plt.savefig(os.path.join(FIGURES_PATH, "child_mortality_2019.png"))
-    plt.close()
+    submit_figure(draw_distribution, "child_mortality_2019.png", values_mortality_2019,
+                  ("Histograma Mortalidad Infantil - Global 2019", "Boxplot Mortalidad Infantil - Global 2019", "KDE Mortalidad Infantil - Global 2019"),
+                  "Mortalidad por cada 1.000 nacidos vivos", ("mediumpurple", "plum", "purple"), bins=15)
 
     # ESPAÑA A LO LARGO DE LOS AÑOS
-    plt.figure(figsize=(24, 6))
-
-    # HISTOGRAMA ESPAÑA A LO LARGO DE LOS AÑOS
-    plt.subplot(1, 3, 1)
-    sns.histplot(spain_mortality_values, kde=False, color="firebrick", bins=len(spain_mortality_values))
-    plt.title("Histograma Mortalidad Infantil - España (todos los años)")
-    plt.xlabel("Mortalidad por cada 1.000 nacidos vivos")
-    plt.ylabel("Frecuencia")
-
-    # BOXPLOT ESPAÑA A LO LARGO DE LOS AÑOS
-    plt.subplot(1, 3, 2)
-    sns.boxplot(x=spain_mortality_values, color="lightcoral")
-    plt.title("Boxplot Mortalidad Infantil - España (todos los años)")
-    plt.xlabel("Mortalidad por cada 1.000 nacidos vivos")
-
-    # KDE ESPAÑA A LO LARGO DE LOS AÑOS
-    plt.subplot(1, 3, 3)
-    sns.kdeplot(spain_mortality_values, fill=True, color="indianred")
-    plt.title("KDE Mortalidad Infantil - España (todos los años)")
-    plt.xlabel("Mortalidad por cada 1.000 nacidos vivos")
-    plt.ylabel("Densidad")
-
-    plt.tight_layout()
-    plt.savefig(os.path.join(FIGURES_PATH, "child_mortality_espana_historico.png"))
-    plt.close()
+    submit_figure(draw_distribution, "child_mortality_espana_historico.png", spain_mortality_values,
+                  ("Histograma Mortalidad Infantil - España (todos los años)", "Boxplot Mortalidad Infantil - España (todos los años)", "KDE Mortalidad Infantil - España (todos los años)"),
+                  "Mortalidad por cada 1.000 nacidos vivos", ("firebrick", "lightcoral", "indianred"), bins=len(spain_mortality_values))
 
 
 # ---------------------- ANÁLISIS ESTADÍSTICO INFERENCIAL ----------------------
 
-def stats_inferential(vaccination_coverage, life_expectancy, preventable_deaths, literacy, child_mortality, gdp) :
+def stats_inferential(context, incremental=True, headless=False) :
     '''
     Grafica la matriz de correlación entre las variables más representativas de los datasets. Realiza 
     un análisis de regresión lineal entre distintas variables representativas de los datasets. 
-    Estudia los residuos. Exporta todas las gráficas como .png a data/figures.
+    Estudia los residuos. Exporta todas las gráficas como .png a data/figures. Además, calcula las
+    correlaciones de Pearson y de Spearman entre todos los indicadores del panel país-año, par a par
+    sobre los (país, año) con dato en ambos, y una regresión por país de la esperanza de vida y la
+    mortalidad infantil sobre la vacunación. Los tests de hipótesis se repiten con el panel, con
+    efectos fijos de país y de año y errores estándar agrupados por país.
+    Con incremental=True, la matriz de correlación, cada regresión, cada estudio de residuos y cada
+    test de hipótesis sólo se recalculan si cambiaron las columnas de df_corr que utilizan.
+    Los resultados numéricos de cada parte se guardan en context.results, en una sección con el
+    nombre de la parte, junto con los intervalos de confianza bootstrap (percentil y BCa) de cada
+    coeficiente de la matriz de correlación y de cada regresión (ver bootstrap.py) y, en los tests de
+    hipótesis, los p-valores por permutaciones libres y por bloques (ver permutation.py). Todas las
+    regresiones se ajustan en forma cerrada con regression.py. Con headless=True los gráficos se
+    omiten (ver run_stats).
     '''
+
+    # SE USA LA COBERTURA DE VACUNACIÓN CON LOS NULOS IMPUTADOS POR stats_vaccination_coverage, SI YA SE EJECUTÓ
+    vaccination_dataset = "vaccination_coverage_sin_nulos" if "vaccination_coverage_sin_nulos" in context.aggregates else "vaccination_coverage"
     # MATRIZ DE CORRELACIÓN ENTRE INDICADORES GLOBALES CON HEATMAP (PERÍODO 1980-2019)
     years = list(range(1980, 2020))
 
@@ -1121,12 +545,17 @@ def stats_inferential(vaccination_coverage, life_expectancy, preventable_deaths,
         "Porcentaje de niños de un año que han recibido tres dosis de vacuna combinada contra la difteria, el tétanos y la tosferina (DTP3)"
     ]
 
-    vacunas_avg = vaccination_coverage[vaccination_coverage['Año'].isin(years)].groupby("Año")[vacunas_cols].mean().mean(axis=1)
-    vida_avg = life_expectancy[life_expectancy["Año"].isin(years)].groupby("Año")["Esperanza de vida al nacer"].mean()
-    muertes_avg = preventable_deaths[preventable_deaths["Año"].isin(years)].groupby("Año")["Muertes"].mean()
-    alfabet_avg = literacy[literacy["Año"].isin(years)].groupby("Año")["Tasa de alfabetización"].mean()
-    mortalidad_avg = child_mortality[child_mortality["Año"].isin(years)].groupby("Año")["Mortalidad infantil"].mean()
-    gdp_avg = gdp[gdp["Año"].isin(years)].groupby("Año")["PIB per cápita a precios constantes"].mean()
+    # LOS PROMEDIOS ANUALES SALEN DEL CUBO DE AGREGADOS (SUMA / CONTEO POR AÑO), SIN VOLVER A RECORRER LAS FILAS
+    cube = context.aggregates
+    def yearly_mean(dataset, column):
+        return cube.series(dataset, column, "Media", by="Año").reindex(years)
+
+    vacunas_avg = pd.concat([yearly_mean(vaccination_dataset, col) for col in vacunas_cols], axis=1).mean(axis=1)
+    vida_avg = yearly_mean("life_expectancy", "Esperanza de vida al nacer")
+    muertes_avg = yearly_mean("preventable_deaths", "Muertes")
+    alfabet_avg = yearly_mean("literacy", "Tasa de alfabetización")
+    mortalidad_avg = yearly_mean("child_mortality", "Mortalidad infantil")
+    gdp_avg = yearly_mean("gdp", "PIB per cápita a precios constantes")
 
     df_corr = pd.DataFrame({
         "Vacunación promedio (%)": vacunas_avg,
@@ -1137,113 +566,111 @@ def stats_inferential(vaccination_coverage, life_expectancy, preventable_deaths,
         "PIB per cápita": gdp_avg
     }).dropna()
 
-    correlation_matrix = df_corr.corr()
-    plt.figure(figsize=(10, 6))
-    sns.heatmap(correlation_matrix, annot=True, cmap="coolwarm", fmt=".2f")
-    plt.title("Matriz de correlación entre indicadores globales (1980-2019)")
-    plt.tight_layout()
-    plt.savefig(os.path.join(FIGURES_PATH, "correlation_matrix.png"))
+    # CADA PARTE SE IDENTIFICA POR LOS DATOS QUE USA, SUS PARÁMETROS Y EL CÓDIGO DE ESTA FUNCIÓN. CADA
+    # FUNCIÓN RECIBE, ADEMÁS, EL NOMBRE DE LA SECCIÓN DE context.results DONDE GUARDA SUS RESULTADOS;
+    # SI LA PARTE SE OMITE, SUS RESULTADOS SE LEEN DE LA EJECUCIÓN ANTERIOR
+    mode = "_headless" if headless else ""
+    def run_part(key, columns, function, *params):
+        parts = [df_corr[columns], params, function, stats_inferential, figure_render, results, bootstrap, regression, permutation]
+        ran, result = run_if_changed(f"stats_inferential_{key}{mode}", parts, lambda: function(df_corr, *params, section=key), enabled=incremental)
+        if not ran:
+            context.results.load(key)
+        return ran, result
+
+    def plot_correlation_matrix(df, section):
+        '''
+        Grafica la matriz de correlación entre las columnas de df y la exporta como .png a data/figures.
+        '''
+
+        context.results.add(section, {"matriz de correlación": df.corr(), "bootstrap": correlation_intervals(df)})
+        submit_figure(draw_correlation_matrix, "correlation_matrix.png", df)
+
+    run_part("correlation_matrix", list(df_corr.columns), plot_correlation_matrix)
+
+    # CORRELACIONES DE PEARSON Y DE SPEARMAN ENTRE TODOS LOS INDICADORES DEL PANEL PAÍS-AÑO, SIN PROMEDIAR
+    # POR AÑO: CADA PAR USA TODOS LOS (PAÍS, AÑO) EN LOS QUE AMBOS INDICADORES TIENEN DATO (VER correlation.py)
+    parts = [context.panel, panel_correlations, correlation, stats_inferential, results]
+    ran, _ = run_if_changed(f"stats_inferential_correlacion_panel{mode}", parts,
+                            lambda: context.results.add("correlacion_panel", panel_correlations(context.panel)), enabled=incremental)
+    if not ran:
+        context.results.load("correlacion_panel")
+
+    # REGRESIONES POR PAÍS DE LA ESPERANZA DE VIDA Y LA MORTALIDAD INFANTIL SOBRE LA VACUNACIÓN PROMEDIO Y
+    # CADA VACUNA, CON LOS AÑOS QUE CADA PAÍS TIENE EN EL PANEL. TODAS SE AJUSTAN A LA VEZ (VER regression.py)
+    def country_regressions(panel):
+        panel = panel.assign(**{"Vacunación promedio (%)": panel[vacunas_cols].mean(axis=1)})
+        table = grouped_regressions(panel, "País", ["Vacunación promedio (%)"] + vacunas_cols, ["Esperanza de vida al nacer", "Mortalidad infantil"])
+        context.results.add("regresiones_por_pais", {"regresiones": table.to_dict("records")})
+
+    # LA HUELLA SÓLO CUBRE LAS COLUMNAS DEL PANEL QUE USAN LOS AJUSTES, COMO run_part CON LAS DE df_corr
+    parts = [context.panel[["País", "Año", *vacunas_cols, "Esperanza de vida al nacer", "Mortalidad infantil"]], vacunas_cols,
+             grouped_regressions, regression, stats_inferential, results]
+    ran, _ = run_if_changed(f"stats_inferential_regresiones_por_pais{mode}", parts, lambda: country_regressions(context.panel), enabled=incremental)
+    if not ran:
+        context.results.load("regresiones_por_pais")
+
+    # EL ESTUDIO DE RESIDUOS Y LOS TESTS DE HIPÓTESIS USAN UN ÚNICO AJUSTE POR VARIABLE EXPLICATIVA, DE
+    # TODAS LAS DEMÁS COLUMNAS DE df_corr A LA VEZ (VER regression.py), Y UN ÚNICO BOOTSTRAP POR PAR DE
+    # VARIABLES. CADA UNO SE CALCULA SÓLO SI ALGUNA PARTE LO USA
+    shared_fits = {}
+    def shared_fit(x_col):
+        if x_col not in shared_fits:
+            shared_fits[x_col] = fit_regression(df_corr, x_col, [column for column in df_corr.columns if column != x_col])
+        return shared_fits[x_col]
+
+    shared_bootstraps = {}
+    def shared_intervals(x_col, y_col):
+        if (x_col, y_col) not in shared_bootstraps:
+            shared_bootstraps[x_col, y_col] = regression_intervals(df_corr, x_col, y_col)
+        return shared_bootstraps[x_col, y_col]
 
     # REGRESIÓN LINEAL
-    def plot_regression(df, x_col, y_col, title, filename):
+    def plot_regression(df, x_col, y_col, title, filename, section):
         '''
         Realiza un análisis de regresión lineal entre dos variables y exporta el gráfico como .png a
-        data/figures.
+        data/figures. Los outliers se eliminan aquí y el gráfico se envía a renderizar (ver figure_render.py).
         '''
 
+        from scipy.stats import zscore
+
         # REMOVER OUTLIERS USANDO Z-SCORE
         df_clean = df[[x_col, y_col]].copy()
         z_scores = np.abs(zscore(df_clean))
         df_no_outliers = df_clean[(z_scores < 2.5).all(axis=1)]
         print(f"[INFO] '{title}': Se eliminaron {len(df_clean) - len(df_no_outliers)} outliers")
+        fit = fit_regression(df_no_outliers, x_col, y_col)
+        context.results.add(section, dict(fit.values(y_col), outliers=len(df_clean) - len(df_no_outliers),
+                                          bootstrap=regression_intervals(df_no_outliers, x_col, y_col)))
 
-        X = df_no_outliers[[x_col]]
-        y = df_no_outliers[y_col]
-        model = LinearRegression()
-        model.fit(X, y)
-        y_pred = model.predict(X)
-        r2 = model.score(X, y)
-
-        plt.figure(figsize=(8, 5))
-        plt.scatter(X, y, label="Datos sin outliers", alpha=0.7)
-        plt.plot(X, y_pred, color="red", label=f"Regresión (R² = {r2:.2f})")
-        plt.xlabel(x_col)
-        plt.ylabel(y_col)
-        plt.title(title)
-        plt.legend()
-        plt.tight_layout()
-        plt.savefig(os.path.join(FIGURES_PATH, filename))
-        plt.close()
+        submit_figure(draw_regression, filename, df_no_outliers, x_col, y_col, title, fit.fitted[y_col].to_numpy(), fit.rsquared[y_col])
 
 
     # ANÁLISIS DE REGRESIÓN LINEAL ENTRE VARIABLES
-    plot_regression(df_corr, "Vacunación promedio (%)", "Esperanza de vida", "Esperanza de vida vs Tasa de vacunación", "regresion_vida_vacunacion.png")
-    plot_regression(df_corr, "Vacunación promedio (%)", "Mortalidad infantil", "Mortalidad infantil vs Tasa de vacunación", "regresion_mortalidad_vacunacion.png")
-    plot_regression(df_corr, "Vacunación promedio (%)", "Muertes prevenibles", "Muertes prevenibles vs Tasa de vacunación", "regresion_muertes_vacunacion.png")
-    plot_regression(df_corr, "Vacunación promedio (%)", "Alfabetización (%)", "Tasa de alfabetización vs Tasa de vacunación", "regresion_alfabetizacion_vacunacion.png")
-    plot_regression(df_corr, "Vacunación promedio (%)", "PIB per cápita", "PIB per cápita vs Tasa de vacunación", "regresion_pib_vacunacion.png")
+    run_part("regresion_vida_vacunacion", ["Vacunación promedio (%)", "Esperanza de vida"], plot_regression, "Vacunación promedio (%)", "Esperanza de vida", "Esperanza de vida vs Tasa de vacunación", "regresion_vida_vacunacion.png")
+    run_part("regresion_mortalidad_vacunacion", ["Vacunación promedio (%)", "Mortalidad infantil"], plot_regression, "Vacunación promedio (%)", "Mortalidad infantil", "Mortalidad infantil vs Tasa de vacunación", "regresion_mortalidad_vacunacion.png")
+    run_part("regresion_muertes_vacunacion", ["Vacunación promedio (%)", "Muertes prevenibles"], plot_regression, "Vacunación promedio (%)", "Muertes prevenibles", "Muertes prevenibles vs Tasa de vacunación", "regresion_muertes_vacunacion.png")
+    run_part("regresion_alfabetizacion_vacunacion", ["Vacunación promedio (%)", "Alfabetización (%)"], plot_regression, "Vacunación promedio (%)", "Alfabetización (%)", "Tasa de alfabetización vs Tasa de vacunación", "regresion_alfabetizacion_vacunacion.png")
+    run_part("regresion_pib_vacunacion", ["Vacunación promedio (%)", "PIB per cápita"], plot_regression, "Vacunación promedio (%)", "PIB per cápita", "PIB per cápita vs Tasa de vacunación", "regresion_pib_vacunacion.png")
 
     # ESTUDIO DE RESIDUOS
-    def plot_residue(df, x_col, y_col, title, filename_base):
+    def plot_residue(df, x_col, y_col, title, filename_base, section):
         '''
         Estudia los resiudos de un modelo de regresión lineal entre dos variables y exporta los gráficos
         como .png a data/figures.
         '''
 
-        # CREACIÓN DEL MODELO
-        X = df[[x_col]]
-        y = df[y_col]
-
-        modelo = LinearRegression()
-        modelo.fit(X, y)
-        y_pred = modelo.predict(X)
-        r2 = modelo.score(X, y)
-
-        plt.figure(figsize=(8, 5))
-        plt.scatter(X, y, label='Datos reales', alpha=0.7)
-        plt.plot(X, y_pred, color='red', label=f'Regresión (R² = {r2:.2f})')
-        plt.xlabel(x_col)
-        plt.ylabel(y_col)
-        plt.title(title)
-        plt.legend()
-        plt.tight_layout()
-        plt.savefig(os.path.join(FIGURES_PATH, f"{filename_base}.png"))
-        plt.close()
-
-        residuos = y - y_pred
-
-        plt.figure(figsize=(10, 5))
-        plt.scatter(y_pred, residuos, color="darkorange")
-        plt.axhline(0, color='gray', linestyle='--')
-        plt.xlabel("Valores Predichos")
-        plt.ylabel("Residuos")
-        plt.title("Gráfico de Residuos")
-        plt.tight_layout()
-        plt.savefig(os.path.join(FIGURES_PATH, f"residuos_{filename_base}.png"))
-        plt.close()
-
-        plt.figure(figsize=(8, 5))
-        sns.histplot(residuos, kde=True, color="mediumpurple")
-        plt.title("Distribución de los Residuos")
-        plt.xlabel("Residuos")
-        plt.tight_layout()
-        plt.savefig(os.path.join(FIGURES_PATH, f"hist_residuos_{filename_base}.png"))
-        plt.close()
-
-        plt.figure(figsize=(6, 6))
-        stats.probplot(residuos, dist="norm", plot=plt)
-        plt.title("Q-Q Plot de los Residuos")
-        plt.tight_layout()
-        plt.savefig(os.path.join(FIGURES_PATH, f"qqplot_{filename_base}.png"))
-        plt.close()
+        fit = shared_fit(x_col)
+        context.results.add(section, dict(fit.values(y_col), bootstrap=shared_intervals(x_col, y_col)))
+        filenames = [f"{filename_base}.png", f"residuos_{filename_base}.png", f"hist_residuos_{filename_base}.png", f"qqplot_{filename_base}.png"]
+        submit_figure(draw_residue, filenames, df[[x_col, y_col]], x_col, y_col, title, fit.fitted[y_col].to_numpy(), fit.rsquared[y_col])
 
 
     # ESTUDIO DE RESIDUOS PARA DISTINTAS VARIABLES
-    plot_residue(df_corr, "Vacunación promedio (%)", "Esperanza de vida", "Esperanza de vida vs Tasa de vacunación", "vida_vacunacion")
-    plot_residue(df_corr, "Vacunación promedio (%)", "Mortalidad infantil", "Mortalidad infantil vs Tasa de vacunación", "mortalidad_vacunacion")
-    plot_residue(df_corr, "Vacunación promedio (%)", "Muertes prevenibles", "Muertes prevenibles vs Tasa de vacunación", "muertes_vacunacion")
-    plot_residue(df_corr, "Vacunación promedio (%)", "Alfabetización (%)", "Tasa de alfabetización vs Tasa de vacunación", "alfabetizacion_vacunacion")
-    plot_residue(df_corr, "Vacunación promedio (%)", "PIB per cápita", "PIB per cápita vs Tasa de vacunación", "pib_vacunacion")
+    run_part("residuos_vida_vacunacion", ["Vacunación promedio (%)", "Esperanza de vida"], plot_residue, "Vacunación promedio (%)", "Esperanza de vida", "Esperanza de vida vs Tasa de vacunación", "vida_vacunacion")
+    run_part("residuos_mortalidad_vacunacion", ["Vacunación promedio (%)", "Mortalidad infantil"], plot_residue, "Vacunación promedio (%)", "Mortalidad infantil", "Mortalidad infantil vs Tasa de vacunación", "mortalidad_vacunacion")
+    run_part("residuos_muertes_vacunacion", ["Vacunación promedio (%)", "Muertes prevenibles"], plot_residue, "Vacunación promedio (%)", "Muertes prevenibles", "Muertes prevenibles vs Tasa de vacunación", "muertes_vacunacion")
+    run_part("residuos_alfabetizacion_vacunacion", ["Vacunación promedio (%)", "Alfabetización (%)"], plot_residue, "Vacunación promedio (%)", "Alfabetización (%)", "Tasa de alfabetización vs Tasa de vacunación", "alfabetizacion_vacunacion")
+    run_part("residuos_pib_vacunacion", ["Vacunación promedio (%)", "PIB per cápita"], plot_residue, "Vacunación promedio (%)", "PIB per cápita", "PIB per cápita vs Tasa de vacunación", "pib_vacunacion")
 
   
     # TEST DE HIPÓTESIS
@@ -1265,30 +692,42 @@ def stats_inferential(vaccination_coverage, life_expectancy, preventable_deaths,
     distinto de cero.
     '''
 
-    def test_hipotesis(df, x_col, y_col, descripcion):
+    def test_hipotesis(df, x_col, y_col, descripcion, section):
         '''
         Realiza un test de hipótesis para evaluar la relación entre dos variables.
         '''
 
         print(f"\nTEST DE HIPÓTESIS: {descripcion}")
 
-        X = df[[x_col]]
-        y = df[y_col]
-        
-        X = sm.add_constant(X)
-        
-        modelo = sm.OLS(y, X).fit()
-
-        print(modelo.summary())
-
-        coef = modelo.params[x_col]
-        p_valor = modelo.pvalues[x_col]
-        ic_95 = modelo.conf_int().loc[x_col]
+        modelo = shared_fit(x_col)
+
+        print(modelo.summary(y_col))
+
+        coef = modelo.params.loc[x_col, y_col]
+        p_valor = modelo.pvalues.loc[x_col, y_col]
+        low, high = modelo.conf_int()
+        ic_95 = [low.loc[x_col, y_col], high.loc[x_col, y_col]]
+        # INTERVALO NO PARAMÉTRICO DEL COEFICIENTE, SIN SUPONER NORMALIDAD DE LOS RESIDUOS
+        intervals = shared_intervals(x_col, y_col)
+        ic_bca = intervals["pendiente"]["BCa"]
+        # p-VALORES POR PERMUTACIONES, SIN SUPONER NORMALIDAD: LIBRES Y POR BLOQUES DE AÑOS CONSECUTIVOS,
+        # QUE RESPETAN LA AUTOCORRELACIÓN DE LA SERIE ANUAL (VER permutation.py)
+        pruebas = regression_permutation_tests(df, x_col, y_col)
+        context.results.add(section, {"variable explicativa": x_col, "variable explicada": y_col, "coeficiente": coef,
+                                      "p-valor": p_valor, "intervalo de confianza 95%": [ic_95[0], ic_95[1]],
+                                      "R²": modelo.rsquared[y_col], "observaciones": modelo.nobs, "significativo": bool(p_valor < 0.05),
+                                      "bootstrap": intervals, "permutaciones": pruebas})
 
         print(f"\nResultados del análisis:")
         print(f"  Coeficiente: {coef:.4f}")
         print(f"  p-valor: {p_valor:.4f}")
         print(f"  Intervalo de confianza al 95%: [{ic_95[0]:.4f}, {ic_95[1]:.4f}]")
+        print(f"  Intervalo de confianza bootstrap (BCa) al 95%: [{ic_bca[0]:.4f}, {ic_bca[1]:.4f}]")
+        for nombre, prueba in (("permutaciones", pruebas["permutación"]), (f"permutaciones por bloques de {BLOCK_SIZE} años", pruebas["permutación por bloques"])):
+            if prueba["exacto"]:
+                print(f"  p-valor por {nombre}: {prueba['p-valor']:.4f} (exacto, {prueba['permutaciones']} permutaciones)")
+            else:
+                print(f"  p-valor por {nombre}: {prueba['p-valor']:.4f} ± {prueba['error de Monte Carlo del p-valor']:.4f} ({prueba['permutaciones']} permutaciones)")
 
         if p_valor < 0.05:
             print("  Conclusión: El efecto es estadísticamente significativo (se rechaza H0).")
@@ -1296,5 +735,36 @@ def stats_inferential(vaccination_coverage, life_expectancy, preventable_deaths,
             print("  Conclusión: El efecto no es estadísticamente significativo (no se rechaza H0).")
 
     # SE TESTEAN POR SEPARADO LAS DOS HIPÓTESIS NULAS
-    test_hipotesis(df_corr, "Vacunación promedio (%)", "Esperanza de vida", "Vacunación sobre Esperanza de vida")
-    test_hipotesis(df_corr, "Vacunación promedio (%)", "Mortalidad infantil", "Vacunación sobre Mortalidad infantil")
\ No newline at end of file
+    run_part("test_vida_vacunacion", ["Vacunación promedio (%)", "Esperanza de vida"], test_hipotesis, "Vacunación promedio (%)", "Esperanza de vida", "Vacunación sobre Esperanza de vida")
+    run_part("test_mortalidad_vacunacion", ["Vacunación promedio (%)", "Mortalidad infantil"], test_hipotesis, "Vacunación promedio (%)", "Mortalidad infantil", "Vacunación sobre Mortalidad infantil")
+
+    # LAS MISMAS HIPÓTESIS CON EL PANEL PAÍS-AÑO EN LUGAR DE LOS PROMEDIOS ANUALES: CADA (PAÍS, AÑO) ES UNA
+    # OBSERVACIÓN, CON EFECTOS FIJOS DE PAÍS (LO QUE CADA PAÍS TIENE DE PROPIO) Y DE AÑO (LO QUE TODOS
+    # COMPARTEN EN CADA AÑO) Y ERRORES ESTÁNDAR AGRUPADOS POR PAÍS (VER fit_panel_regression EN regression.py)
+    def test_hipotesis_panel(panel, y_col, descripcion, section):
+        '''
+        Realiza un test de hipótesis sobre el coeficiente de la vacunación promedio en la regresión de
+        panel de y_col con efectos fijos de país y de año.
+        '''
+
+        print(f"\nTEST DE HIPÓTESIS CON EFECTOS FIJOS DE PAÍS Y AÑO: {descripcion}")
+
+        panel = panel.assign(**{"Vacunación promedio (%)": panel[vacunas_cols].mean(axis=1)})
+        modelo = fit_panel_regression(panel, y_col, "Vacunación promedio (%)")
+        print(modelo.summary())
+
+        p_valor = modelo.pvalues["Vacunación promedio (%)"]
+        context.results.add(section, dict(modelo.values(), significativo=bool(p_valor < 0.05)))
+        if p_valor < 0.05:
+            print("  Conclusión: El efecto es estadísticamente significativo (se rechaza H0).")
+        else:
+            print("  Conclusión: El efecto no es estadísticamente significativo (no se rechaza H0).")
+
+    for section, y_col, descripcion in (("test_panel_vida_vacunacion", "Esperanza de vida al nacer", "Vacunación sobre Esperanza de vida"),
+                                        ("test_panel_mortalidad_vacunacion", "Mortalidad infantil", "Vacunación sobre Mortalidad infantil")):
+        # LA HUELLA DE CADA TEST SÓLO CUBRE LAS CLAVES, LAS VACUNAS Y LA VARIABLE EXPLICADA
+        parts = [context.panel[["País", "Año", *vacunas_cols, y_col]], vacunas_cols, y_col, fit_panel_regression, regression, stats_inferential, results]
+        ran, _ = run_if_changed(f"stats_inferential_{section}{mode}", parts,
+                                lambda: test_hipotesis_panel(context.panel, y_col, descripcion, section), enabled=incremental)
+        if not ran:
+            context.results.load(section)
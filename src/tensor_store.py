@@ -0,0 +1,142 @@
+import os
+import json
+import shutil
+import numpy as np
+import pandas as pd
+from incremental import run_if_changed
+from dtype_optimizer import to_float64
+
+# DEFINICIÓN DE DIRECTORIOS
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+TENSOR_PATH = os.path.join(BASE_DIR, "data", "processed", "tensor")
+
+# VERSIÓN DEL FORMATO DEL TENSOR EN DISCO. SI CAMBIA, EL TENSOR GUARDADO SE VUELVE A CONSTRUIR
+TENSOR_FORMAT_VERSION = 2
+
+
+class TensorStore:
+    '''
+    Tensor denso de forma país x año x indicador, abierto como memmap de sólo lectura, más las
+    tablas de búsqueda de países, años e indicadores. Un país, un año o un indicador se resuelven con
+    un diccionario (sin recorrer filas) y cualquier recorte es una vista del memmap, sin copiar datos:
+    varios procesos que abran el mismo archivo comparten sus páginas a través de la caché del sistema
+    operativo. Las celdas sin dato son NaN.
+    '''
+
+    def __init__(self, tensor, countries, years, indicators):
+        self.tensor = tensor
+        self.countries = pd.Index(countries, name="País")
+        self.years = pd.Index(years, name="Año")
+        self.indicators = pd.Index(indicators, name="Indicador")
+        self._positions = {
+            "País": {country: i for i, country in enumerate(self.countries)},
+            "Año": {int(year): i for i, year in enumerate(self.years)},
+            "Indicador": {indicator: i for i, indicator in enumerate(self.indicators)}
+        }
+
+    @classmethod
+    def open(cls, directory=None):
+        '''
+        Abre el tensor que guardó build_tensor() como memmap. Devuelve None si no hay un tensor completo
+        en "directory" o si se guardó con otra versión del formato.
+        '''
+
+        directory = directory or TENSOR_PATH
+        meta_path = os.path.join(directory, "meta.json")
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version") != TENSOR_FORMAT_VERSION:
+            return None
+        tensor = np.load(os.path.join(directory, "tensor.npy"), mmap_mode="r")
+        return cls(tensor, meta["countries"], meta["years"], meta["indicators"])
+
+    def view(self, country=None, year=None, indicator=None):
+        '''
+        Devuelve el recorte del tensor para un país, un año y/o un indicador (los que no se indican se
+        conservan enteros), como vista del memmap. Por ejemplo, view(country="España") es la matriz
+        año x indicador de España y view(year=2019, indicator=...) el vector de todos los países en 2019.
+        '''
+
+        index = tuple(slice(None) if key is None else self._position(level, key)
+                      for level, key in (("País", country), ("Año", year), ("Indicador", indicator)))
+        return self.tensor[index]
+
+    def series(self, indicator, country=None, year=None, dropna=False):
+        '''
+        Devuelve un indicador como Series: a lo largo de los años para un país (country=...) o para
+        todos los países en un año (year=...). Sin dropna, los valores son una vista del memmap.
+        '''
+
+        if (country is None) == (year is None):
+            raise ValueError("Se debe indicar un país o un año, pero no ambos")
+        values = self.view(country=country, year=year, indicator=indicator)
+        series = pd.Series(values, index=self.years if year is None else self.countries, name=indicator, copy=False)
+        return series.dropna() if dropna else series
+
+    def _position(self, level, key):
+        try:
+            return self._positions[level][int(key) if level == "Año" else key]
+        except KeyError:
+            raise KeyError(f"{level} desconocido en el tensor: {key}") from None
+
+
+def build_tensor(panel, directory=None):
+    '''
+    Escribe el tensor país x año x indicador de un panel país-año (ver panel.py) en
+    data/processed/tensor/tensor.npy, directamente sobre el memmap, y las tablas de búsqueda en
+    meta.json. Los años son los que aparecen en el panel; los indicadores, todas sus columnas
+    numéricas salvo el año. El tensor es float32 sólo si todos los indicadores del panel lo son; si
+    alguno quedó en float64 (ver dtype_optimizer.py), es float64 y los indicadores float32 se pasan a
+    float64 con to_float64(), redondeados a sus decimales, de modo que ningún valor cambia respecto
+    de los datasets limpios. El meta.json se escribe al final y marca que el tensor está completo.
+    Devuelve el TensorStore abierto sobre el archivo escrito.
+    '''
+
+    directory = directory or TENSOR_PATH
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory)
+
+    countries = panel["País"].astype("category")
+    years = np.unique(panel["Año"].to_numpy())
+    indicators = [column for column in panel.columns if column not in ("País", "Año")]
+
+    dtype = np.result_type(np.float32, *(panel[indicator].dtype for indicator in indicators))
+    tensor = np.lib.format.open_memmap(os.path.join(directory, "tensor.npy"), mode="w+", dtype=dtype,
+                                       shape=(len(countries.cat.categories), len(years), len(indicators)))
+    tensor[:] = np.nan
+    cells = countries.cat.codes.to_numpy(), np.searchsorted(years, panel["Año"].to_numpy())
+    for i, indicator in enumerate(indicators):
+        tensor[(*cells, i)] = to_float64(panel[indicator]) if dtype == np.float64 else panel[indicator].to_numpy(dtype=dtype, na_value=np.nan)
+    tensor.flush()
+    del tensor
+
+    meta = {"version": TENSOR_FORMAT_VERSION, "countries": [str(country) for country in countries.cat.categories],
+            "years": [int(year) for year in years], "indicators": indicators}
+    with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=1)
+    return TensorStore.open(directory)
+
+
+def run_tensor_store(context, incremental=True, directory=None, verbose=True):
+    '''
+    Etapa del pipeline que se ejecuta después de construir el panel país-año: guarda su tensor en
+    data/processed/tensor y deja el TensorStore abierto en context.tensors. Con incremental=True, si el
+    panel no cambió desde la ejecución anterior, sólo se abre el tensor ya guardado. Con verbose=True
+    imprime su forma y su tamaño.
+    '''
+
+    directory = directory or TENSOR_PATH
+    parts = [context.panel, build_tensor, TENSOR_FORMAT_VERSION, directory]
+    ran, store = run_if_changed("tensor_store", parts, lambda: build_tensor(context.panel, directory),
+                                outputs=[os.path.join(directory, "tensor.npy"), os.path.join(directory, "meta.json")], enabled=incremental)
+    if not ran:
+        store = TensorStore.open(directory)
+    context.tensors = store
+
+    if verbose:
+        countries, years, indicators = store.tensor.shape
+        print(f"→ tensor país x año x indicador: {countries} x {years} x {indicators} {store.tensor.dtype}, "
+              f"{store.tensor.nbytes / 2**20:.1f} MB en memmap")
+    return store